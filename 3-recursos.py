@@ -15,35 +15,48 @@
 import simpy
 import random
 
+import verbosidad
+
+pasajerosAtendidos = 0
+
 # Funcion para imprimir el estado del recurso (taquilla)
 def print_stats(resource):
     print('\t[Recurso] {} ocupado, {} en cola'.format(resource.count, len(resource.queue)))
 
 # Proceso Entidad: Pasajero
 # Este proceso describe el comportamiento de un pasajero al llegar a la taquilla.
-def passenger(env, name, server, service_rate):
-    # El pasajero llega a la estación y se imprime el estado actual del recurso.
-    print('[{:6.2f}:{}] - llega a la estación'.format(env.now, name))
-    print_stats(server)
+# Solo se imprime (y se formatea el nombre) si traza es True, según el nivel de VERBOSIDAD.
+def passenger(env, numero, server, service_rate, traza):
+    global pasajerosAtendidos
+
+    if traza:
+        name = 'Pasajero#{}'.format(numero)
+        # El pasajero llega a la estación y se imprime el estado actual del recurso.
+        print('[{:6.2f}:{}] - llega a la estación'.format(env.now, name))
+        print_stats(server)
     
     # En esta parte se solicita el recurso (taquilla).
     # El pasajero espera (se pone en cola) hasta que el recurso esté disponible.
     with server.request() as request:
         yield request  # Pausa la ejecución hasta que se le asigne el recurso.
-        print('[{:6.2f}:{}] - inicia la compra del ticket'.format(env.now, name))
-        print_stats(server)
+        if traza:
+            print('[{:6.2f}:{}] - inicia la compra del ticket'.format(env.now, name))
+            print_stats(server)
         
         # Se genera un tiempo de servicio aleatorio basado en la tasa de servicio.
         service_time = random.expovariate(service_rate)
         yield env.timeout(service_time)  # Pausa el proceso durante el tiempo de servicio.
-        print('[{:6.2f}:{}] - finaliza la compra del ticket'.format(env.now, name))
-        print_stats(server)
+        if traza:
+            print('[{:6.2f}:{}] - finaliza la compra del ticket'.format(env.now, name))
+            print_stats(server)
         
         # Al salir del bloque 'with', el recurso se libera automáticamente.
     
     # Una vez liberado el recurso, el pasajero sale de la estación.
-    print('[{:6.2f}:{}] - sale de la estación'.format(env.now, name))
-    print_stats(server)
+    if traza:
+        print('[{:6.2f}:{}] - sale de la estación'.format(env.now, name))
+        print_stats(server)
+    pasajerosAtendidos += 1
 
 
 # generador - Proceso de Soporte
@@ -51,8 +64,7 @@ def passenger(env, name, server, service_rate):
 def passenger_generator(env, server, arrival_rate, service_rate):
     i = 0
     while True:
-        ename = 'Pasajero#{}'.format(i)
-        env.process(passenger(env, ename, server, service_rate))
+        env.process(passenger(env, i, server, service_rate, verbosidad.debe_trazar(i, VERBOSIDAD, MUESTREO_CADA)))
         next_entity_arrival = random.expovariate(arrival_rate)
         yield env.timeout(next_entity_arrival)
         i += 1
@@ -68,6 +80,10 @@ MEAN_INTER_ARRIVAL_TIME = 2     # 5 time units between arrivals (1/lambda)
 MEAN_SERVICE_TIME = 4           # 4 time units for each service (1/mu)
 SIMULATION_END_TIME = 50
 
+# Nivel de salida en consola (constantes de verbosidad.py): SILENCIOSO, RESUMEN, MUESTREO (1 de cada MUESTREO_CADA pasajeros) o COMPLETO
+VERBOSIDAD = verbosidad.COMPLETO
+MUESTREO_CADA = 100
+
 arrival_rate = 1/MEAN_INTER_ARRIVAL_TIME # lambda 
 service_rate = 1/MEAN_SERVICE_TIME # Mu
 
@@ -76,6 +92,9 @@ taquilla = simpy.Resource(env, capacity=1)
 env.process(passenger_generator(env, taquilla, arrival_rate, service_rate))
 env.run(until=SIMULATION_END_TIME)
 
+if VERBOSIDAD != verbosidad.SILENCIOSO:
+    print(f'\nPasajeros atendidos: {pasajerosAtendidos}')
+
 #------------------------ FIN ------------------------------------#
 
 
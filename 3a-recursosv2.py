@@ -18,9 +18,14 @@
 import simpy
 import random
 
-tiempoEnCola = []
-tiempoEnSistema = []
-tiempoOcupado = []
+from estadisticas import ResumenStreaming
+import verbosidad
+
+# Estadísticas en memoria constante (Welford para media/varianza y P² para los percentiles):
+# no se guarda el tiempo de cada pasajero, así que la memoria no crece con el tiempo simulado
+tiempoEnCola = ResumenStreaming()
+tiempoEnSistema = ResumenStreaming()
+tiempoOcupado = 0.0
 
 # Funcion para imprimir el estado del recurso (taquilla)
 def print_stats(resource):
@@ -29,38 +34,44 @@ def print_stats(resource):
 
 # Proceso Entidad: Pasajero
 # Este proceso describe el comportamiento de un pasajero al llegar a la taquilla.
-def passenger(env, name, server, service_rate):
+# Solo se imprime (y se formatea el nombre) si traza es True, según el nivel de VERBOSIDAD.
+def passenger(env, numero, server, service_rate, traza):
     
-    global tiempoEnCola, tiempoEnSistema, tiempoOcupado
+    global tiempoOcupado
 
     # El pasajero llega a la estación y se imprime el estado actual del recurso.
-    print('[{:6.2f}:{}] - llega a la estación'.format(env.now, name))
     t_llegada = env.now
-    print_stats(server)
+    if traza:
+        name = 'Pasajero#{}'.format(numero)
+        print('[{:6.2f}:{}] - llega a la estación'.format(env.now, name))
+        print_stats(server)
     
     # En esta parte se solicita el recurso (taquilla).
     # El pasajero espera (se pone en cola) hasta que el recurso esté disponible.
     with server.request() as request:
         yield request  # Pausa la ejecución hasta que se le asigne el recurso.
-        print('[{:6.2f}:{}] - inicia la compra del ticket'.format(env.now, name))
-        print_stats(server)
+        if traza:
+            print('[{:6.2f}:{}] - inicia la compra del ticket'.format(env.now, name))
+            print_stats(server)
         t_inicio=env.now
         
         # Se genera un tiempo de servicio aleatorio basado en la tasa de servicio.
         service_time = random.expovariate(service_rate)
         yield env.timeout(service_time)  # Pausa el proceso durante el tiempo de servicio.
-        print('[{:6.2f}:{}] - finaliza la compra del ticket'.format(env.now, name))
-        print_stats(server)
+        if traza:
+            print('[{:6.2f}:{}] - finaliza la compra del ticket'.format(env.now, name))
+            print_stats(server)
         t_salida=env.now
         
         # Al salir del bloque 'with', el recurso se libera automáticamente.
     
     # Una vez liberado el recurso, el pasajero sale de la estación.
-    print('[{:6.2f}:{}] - sale de la estación'.format(env.now, name))
-    print_stats(server)
-    tiempoEnCola.append(t_inicio-t_llegada)
-    tiempoEnSistema.append(t_salida-t_inicio)
-    tiempoOcupado.append(t_salida-t_inicio)
+    if traza:
+        print('[{:6.2f}:{}] - sale de la estación'.format(env.now, name))
+        print_stats(server)
+    tiempoEnCola.agregar(t_inicio-t_llegada)
+    tiempoEnSistema.agregar(t_salida-t_llegada)
+    tiempoOcupado += t_salida-t_inicio
 
 
 # generador - Proceso de Soporte
@@ -68,8 +79,7 @@ def passenger(env, name, server, service_rate):
 def passenger_generator(env, server, arrival_rate, service_rate):
     i = 0
     while True:
-        ename = 'Pasajero#{}'.format(i)
-        env.process(passenger(env, ename, server, service_rate))
+        env.process(passenger(env, i, server, service_rate, verbosidad.debe_trazar(i, VERBOSIDAD, MUESTREO_CADA)))
         next_entity_arrival = random.expovariate(arrival_rate)
         yield env.timeout(next_entity_arrival)
         i += 1
@@ -85,6 +95,10 @@ MEAN_INTER_ARRIVAL_TIME = 4     # 5 time units between arrivals (1/lambda)
 MEAN_SERVICE_TIME = 7           # 4 time units for each service (1/mu)
 SIMULATION_END_TIME = 840
 
+# Nivel de salida en consola (constantes de verbosidad.py): SILENCIOSO, RESUMEN, MUESTREO (1 de cada MUESTREO_CADA pasajeros) o COMPLETO
+VERBOSIDAD = verbosidad.COMPLETO
+MUESTREO_CADA = 100
+
 arrival_rate = 1/MEAN_INTER_ARRIVAL_TIME # lambda 
 service_rate = 1/MEAN_SERVICE_TIME # Mu
 
@@ -95,14 +109,18 @@ env.run(until=SIMULATION_END_TIME)
 
 
 #Calculo de Metricas
-wq=sum(tiempoEnCola)/len(tiempoEnCola)
-w=sum(tiempoEnSistema)/len(tiempoEnSistema)
-rho=sum(tiempoOcupado)/SIMULATION_END_TIME
-
-print('\n------ Resultados de la simulacion -------')
-print(f'Promedio de espera en cola (W_q):       {wq:.4f}')
-print(f'Promedio total en el sistema (W):       {w:.4f}')
-print(f'Ocupacion del cajero (rho):             {rho:.4f}')
+wq=tiempoEnCola.media
+w=tiempoEnSistema.media
+rho=tiempoOcupado/SIMULATION_END_TIME
+
+if VERBOSIDAD != verbosidad.SILENCIOSO:
+    print('\n------ Resultados de la simulacion -------')
+    print(f'Promedio de espera en cola (W_q):       {wq:.4f}')
+    print(f'Promedio total en el sistema (W):       {w:.4f}')
+    print(f'Ocupacion del cajero (rho):             {rho:.4f}')
+    print(f'Varianza de la espera en cola:          {tiempoEnCola.varianza:.4f}')
+    print(f'Espera en cola p50/p95/p99:             {tiempoEnCola.cuantil(0.5):.4f} / {tiempoEnCola.cuantil(0.95):.4f} / {tiempoEnCola.cuantil(0.99):.4f}')
+    print(f'Tiempo en el sistema p50/p95/p99:       {tiempoEnSistema.cuantil(0.5):.4f} / {tiempoEnSistema.cuantil(0.95):.4f} / {tiempoEnSistema.cuantil(0.99):.4f}')
 #------------------------ FIN ------------------------------------#
 
 
@@ -12,149 +12,70 @@ Durante la simulación se registran y calculan las siguientes métricas:
     de la cantidad de clientes.
   - Tiempo promedio en el sistema (W) y tiempo promedio de espera en la cola (Wq).
 
-Se imprime una tabla de eventos y, al final, se muestran los resultados de la simulación.
+Se imprime una tabla de eventos y, al final, se muestran los resultados de la simulación junto a
+los valores analíticos del M/M/1 (analitico.py). Con rho = LAMBDA / MU >= 1 (como con los valores
+por omisión) no hay estado estacionario y los valores analíticos son infinitos. Con
+VALIDAR_ANALITICO = True se muestra además el intervalo de confianza de REPLICACIONES_VALIDACION
+replicaciones de SIM_TIME, marcando las métricas que quedan fuera del intervalo (con rho >= 1 ese
+intervalo se omite). Con un horizonte corto esa diferencia mide el sesgo de empezar con el banco vacío.
 """
 
 #Estructura básica de la simulación
-import simpy
-import random
 import numpy as np
 import matplotlib.pyplot as plt
 
+from analitico import imprimir_analitico, mm1, validar_con_replicaciones
+from modelo_banco import SimulacionBanco, imprimir_resultados
+from perfilado import PerfiladoSimpy, ejecutar_perfilado, imprimir_perfil
+import verbosidad
+
 SIM_TIME = 50        #Tiempo total de simulación
 LAMBDA = 1/2          # Taza de llegadas (por unidad de tiempo)
 MU = 1/4              # Taza de servicio (por unidad de tiempo)
+RANDOM_SEED = None    # Semilla del generador aleatorio (None = distinta en cada corrida)
+PERFILAR = False      # Tabla de tiempo por fase al final (perfilado.py)
+ARCHIVO_PSTATS = None # Archivo de pstats con el cProfile de la corrida (None = sin cProfile)
 
-#Variables Globales
-tiempo_ultimo_evento = 0.0
-area_clientes_cola   = 0.0
-area_clientes_sistema = 0.0
-tiempo_ocupado = 0.0
-total_cola = 0.0
-total_sistema = 0.0
-total_clientes_simulacion = 0
-
-
-# ---------------------------
-# Proceso: generacion_llegadas
-# ---------------------------
-# Este proceso genera clientes que van entrando al sistema
-# Los tiempos entre llegadas estan distribuidos exponencialmente 
-def generacion_llegadas(env,server):
-    id_cliente = 0
-
-    #Este bucle se ejecuta indefinidamente hasta el final de la simulación
-    while True:
-        tiempo_entre_llegadas = random.expovariate(LAMBDA)
-        yield env.timeout(tiempo_entre_llegadas)
-        id_cliente+=1
-        #print(f"{env.now:.4f}: Se generó el cliente {id_cliente:d}. Tiempo entre llegadas {tiempo_entre_llegadas:.4f}")
-        tiempo_llegada=env.now
-        env.process(atencion_cliente(env,id_cliente,server,tiempo_llegada))
-
-# ---------------------------
-# Proceso: llegada_Cliente
-# ---------------------------
-# Este proceso (entidad) representa el ciclo de vida de un cliente en el sistema.
-# El cliente llega, solicita atención del cajero (o se pone en la cola), es atendido durante un
-# tiempo determinado y luego sale del sistema.
-def atencion_cliente(env,id_cliente,server,tiempo_llegada):
-    
-    global area_clientes_cola, area_clientes_sistema, tiempo_ultimo_evento,tiempo_ocupado, total_cola, total_sistema, total_clientes_simulacion
-    
-    print(f"{id_cliente:d},{env.now:.2f},LlegadaCliente,{len(server.queue):d},{server.count:d},{tiempo_ultimo_evento:.4f}")
-    actualizar_estadisticas(env,server)
-
-    #Esta es la parte mas importante del proceso, aqui solicitamos el servidor, el proceso continua hasta que exista un servidor disponible
-    #Esto es gestionado por Simpy
-    with server.request() as request: 
-        yield request 
-        #Inicio del servicio
-        print(f"{id_cliente:d},{env.now:.2f},InicioServicio,{len(server.queue):d},{server.count:d},{tiempo_ultimo_evento:.4f}")
-
-        #Generación del tiempo de servicio aleatorio (distribución exponencial)
-        tiempo_servicio = random.expovariate(MU)
-        
-        #Captura del inicio del servicio
-        inicio_servicio = env.now
-        
-        #Calculo del tiempo que estuvo el cleinte en cola
-        total_cola += inicio_servicio - tiempo_llegada
-
-        actualizar_estadisticas(env,server)
-
-        #delay por el tiempo de servicio
-        yield env.timeout(tiempo_servicio)
-
-        #Captura del tiempo que el cliente estuvo siendo atendido, lo cual equivale a que el cajero estuvo ocupado
-        tiempo_ocupado += env.now - inicio_servicio
-
-        print(f"{id_cliente:d},{env.now:.2f},FinServicio(Salida),{len(server.queue):d},{server.count:d},{tiempo_ultimo_evento:.4f}")
-
-        actualizar_estadisticas(env,server)
-
-        #Captura el fin del servicio
-        fin_servicio=env.now
-
-        #Calculo del total de tiempo que el cleinte estuvo en el sistema
-        total_sistema += fin_servicio-tiempo_llegada
-
-        #Registro de los clientes que van completando el servicio y saliendo del sistema
-        #esto nos sirve la final para calcular el tiempo promedio que estuvieron los cleintes en cola y en el sistema
-        #durante toda la simulación
-        total_clientes_simulacion +=1
-
-# ---------------------------
-# Función para actualizar las estadisticas
-# ---------------------------
-# Esta función calcula el tiempo transcurrido desde el último evento y actualiza el área acumulada bajo la curva para el 
-# número de clientes en cola (area_clientes_cola) y en el sistema (area_clientes_sistema).
-def actualizar_estadisticas(env,server):
-
-    global area_clientes_cola, area_clientes_sistema, tiempo_ultimo_evento
-    delta_tiempo = env.now - tiempo_ultimo_evento
+# Nivel de salida en consola (constantes de verbosidad.py): SILENCIOSO, RESUMEN, MUESTREO (1 de cada MUESTREO_CADA clientes) o COMPLETO
+VERBOSIDAD = verbosidad.COMPLETO
+MUESTREO_CADA = 10
 
-    clientes_cola = len(server.queue)
-    cajeros_ocupados = server.count
-    clientes_sistema = clientes_cola+cajeros_ocupados
+# Intervalo de confianza de REPLICACIONES_VALIDACION replicaciones junto al M/M/1 analítico (opcional)
+VALIDAR_ANALITICO = False
+REPLICACIONES_VALIDACION = 30
 
-    area_clientes_cola+=clientes_cola*delta_tiempo
-    area_clientes_sistema+=clientes_sistema*delta_tiempo
-  
-    tiempo_ultimo_evento = env.now
 
 # ---------------------------
 # Configuración General de la simulación
 # ---------------------------
+# El estado de la simulación (acumuladores, cajero y procesos generacion_llegadas/atencion_cliente)
+# vive en la clase SimulacionBanco (modelo_banco.py). Con un solo cajero y sin vaciar el sistema
+# al final, la simulación se corta en SIM_TIME igual que un M/M/1 observado durante SIM_TIME.
 def main():
 
-    global area_clientes_cola, area_clientes_sistema, total_sistema, total_cola, total_clientes_simulacion
+    # Con PERFILAR se mide el tiempo de cada fase del modelo (sin costo cuando es False)
+    modelo = PerfiladoSimpy if PERFILAR else SimulacionBanco
 
-    #random.seed(RANDOM_SEED)
-    banco = simpy.Environment()
-    cajero = simpy.Resource(banco, capacity=1)
-    banco.process(generacion_llegadas(banco,cajero))
-    print("\n--- Tabla de Eventos ---")
-    print("Num,Timestamp,Tipo Evento,Tamaño de la Cola,Cajeros Ocupados,Tiempo desde evento anterior")
+    # Sin traza (SILENCIOSO o RESUMEN) el modelo no llama a ningún registro
+    registro = verbosidad.registro_consola(VERBOSIDAD, MUESTREO_CADA)
+    banco = modelo(LAMBDA, MU, num_servidores=1, tiempo_llegada_maxima=SIM_TIME, semilla=RANDOM_SEED, vaciar_sistema=False, registro=registro)
+    if registro is not None:
+        print("\n--- Tabla de Eventos ---")
+        print("Num,Timestamp,Tipo Evento,Tamaño de la Cola,Cajeros Ocupados,Tiempo desde evento anterior")
 
-    banco.run(until=SIM_TIME)
-
-    #Calculo de resultados 
-    utilizacion = (tiempo_ocupado / (SIM_TIME))*100
-    L = area_clientes_sistema/SIM_TIME
-    L_q=area_clientes_cola/SIM_TIME
-    Wq=total_cola / total_clientes_simulacion
-    W=total_sistema / total_clientes_simulacion
+    resultados = ejecutar_perfilado(banco, ARCHIVO_PSTATS)
 
     #Despliegue de resultados de la simulación
-    print("\n--- Resultados de la Simulación ---")
-    print(f"Utilizacion del Servidor:                     {utilizacion:.2f}%")
-    print(f"Numero de clientes promedio en el banco (L):  {L:.4f}")
-    print(f"Numero de clientes promedio en cola (L_q):    {L_q:.4f}")
-    print(f"Tiempo promedio de espera en el sistema (W):  {W:.4f}")
-    print(f"Tiempo promedio de espera en la cola (Wq):    {Wq:.4f}")
+    if VERBOSIDAD != verbosidad.SILENCIOSO:
+        imprimir_resultados(resultados)
+        imprimir_analitico(mm1(LAMBDA, MU), resultados)
+
+    if VALIDAR_ANALITICO:
+        validar_con_replicaciones(mm1(LAMBDA, MU), REPLICACIONES_VALIDACION, RANDOM_SEED, resultados, tasa_llegadas=LAMBDA, tasa_servicio=MU, num_servidores=1, tiempo_llegada_maxima=SIM_TIME)
+
+    if PERFILAR:
+        imprimir_perfil(banco.perfil)
 
 
 if __name__ == '__main__':
     main()
-
@@ -11,144 +11,58 @@ Este script simula el funcionamiento de un banco (o sistema similar) con múltip
 - Durante la simulación, se genera un archivo de salida llamado "eventos_simulacion.csv" que registra 
   los eventos ocurridos, como llegadas, inicios y finales de servicio, junto con información relevante 
   como el tamaño de la cola y el número de cajeros ocupados.
+- Con FORMATO_REGISTRO = "npy" el mismo registro se guarda en "eventos_simulacion.npy", un archivo
+  binario columnar que se puede leer mapeado a memoria con registro_eventos.leer_registro_npy().
+- Con MODO_REGISTRO = "muestreo" solo se registran los clientes cuyo ID es múltiplo de MUESTREO_CADA, y con
+  MODO_REGISTRO = "agregado" se escribe una fila por ventana de ANCHO_VENTANA_REGISTRO en "eventos_agregados.csv"
+  (llegadas, salidas, cola promedio y máxima, tiempo de cajeros ocupados).
 """
 
 # Estructura básica de la simulación
-import simpy
-import random
 import numpy as np
 import matplotlib.pyplot as plt
 
+from modelo_banco import SimulacionBanco, imprimir_resultados
+from perfilado import PerfiladoSimpy, ejecutar_perfilado, imprimir_perfil
+from registro_eventos import abrir_registro
+
 # Configuración de la simulación
 TIEMPO_LLEGADA_MAXIMA = 480        #  Tiempo total de apertura del banco (unidades de tiempo)
 LAMBDA = 1                          # Tasa de llegadas (por unidad de tiempo)
 MU = 0.25                           # Tasa de servicio (por unidad de tiempo)
 NUM_SERVIDORES = 5                  # Número de servidores en el sistema
+FORMATO_REGISTRO = "csv"            # Formato del registro de eventos: "csv" o "npy" (binario columnar)
+MODO_REGISTRO = "completo"          # "completo", "muestreo" (1 de cada MUESTREO_CADA clientes) o "agregado" (una fila por ventana)
+MUESTREO_CADA = 100
+ANCHO_VENTANA_REGISTRO = 15         # Ancho de la ventana del registro agregado (unidades de tiempo)
+RANDOM_SEED = None                  # Semilla del generador aleatorio (None = distinta en cada corrida)
+PERFILAR = False                    # Tabla de tiempo por fase al final (perfilado.py)
+ARCHIVO_PSTATS = None               # Archivo de pstats con el cProfile de la corrida (None = sin cProfile)
 
 
-# Variables globales
-tiempo_ultimo_evento = 0.0
-area_clientes_cola = 0.0
-area_clientes_sistema = 0.0
-tiempo_ocupado = 0.0
-total_cola = 0.0
-total_sistema = 0.0
-total_clientes_simulacion = 0
-
-# ---------------------------
-# Función para actualizar las estadísticas
-# ---------------------------
-def actualizar_estadisticas(env, server, id_cliente=None, evento=None, tiempo_inicio_servicio=None, tiempo_fin_servicio=None, tiempo_en_cola=None, tiempo_servicio=None, tiempo_total=None):
-    global area_clientes_cola, area_clientes_sistema, tiempo_ultimo_evento
-    delta_tiempo = env.now - tiempo_ultimo_evento
-
-    clientes_cola = len(server.queue)
-    cajeros_ocupados = server.count
-    clientes_sistema = clientes_cola + cajeros_ocupados
-
-    area_clientes_cola += clientes_cola * delta_tiempo
-    area_clientes_sistema += clientes_sistema * delta_tiempo
-
-    tiempo_ultimo_evento = env.now
-
-    # Quitar el Tiempo_en_Cola en el evento FinServicio
-    if evento == "FinServicio":
-        tiempo_en_cola = ""
-    
-    # Registrar el evento en el archivo CSV
-    with open("eventos_simulacion.csv", "a") as archivo_eventos:
-        archivo_eventos.write(f"{id_cliente if id_cliente else ''},{evento if evento else ''},{env.now:.2f},{delta_tiempo:.2f},{clientes_cola},{cajeros_ocupados},{tiempo_inicio_servicio if tiempo_inicio_servicio else ''},{tiempo_fin_servicio if tiempo_fin_servicio else ''},{tiempo_en_cola if tiempo_en_cola else ''},{tiempo_servicio if tiempo_servicio else ''},{tiempo_total if tiempo_total else ''}\n")
-
-# ---------------------------
-# Proceso: atención al cliente
-# ---------------------------
-def atencion_cliente(env, id_cliente, servers, tiempo_llegada):
-    global tiempo_ocupado, total_cola, total_sistema, total_clientes_simulacion
-
-    # Actualizar estadísticas y registrar llegada
-    actualizar_estadisticas(env, servers[0], id_cliente=id_cliente, evento="Llegada")
-
-    # Seleccionar el cajero con la cola más corta
-    cajero_seleccionado = min(servers, key=lambda s: len(s.queue))
-
-    # Solicitar el servidor
-    with cajero_seleccionado.request() as request:
-        yield request
-
-        # Registrar el inicio del servicio
-        tiempo_inicio_servicio = env.now
-        tiempo_en_cola = tiempo_inicio_servicio - tiempo_llegada
-        actualizar_estadisticas(env, cajero_seleccionado, id_cliente=id_cliente, evento="InicioServicio", tiempo_inicio_servicio=tiempo_inicio_servicio, tiempo_en_cola=tiempo_en_cola)
-
-        # Generar tiempo de servicio y simular el tiempo de atención
-        tiempo_servicio = random.expovariate(MU)
-        yield env.timeout(tiempo_servicio)
-
-        # Registrar el evento de fin de servicio
-        tiempo_fin_servicio = env.now
-        tiempo_total = tiempo_fin_servicio - tiempo_llegada
-        actualizar_estadisticas(env, cajero_seleccionado, id_cliente=id_cliente, evento="FinServicio", tiempo_inicio_servicio=tiempo_inicio_servicio, tiempo_fin_servicio=tiempo_fin_servicio, tiempo_en_cola=tiempo_en_cola, tiempo_servicio=tiempo_servicio, tiempo_total=tiempo_total)
-
-        # Actualizar estadísticas después del fin del servicio
-        tiempo_ocupado += tiempo_servicio
-        total_cola += tiempo_en_cola
-        total_sistema += tiempo_total
-        total_clientes_simulacion += 1
-
-# ---------------------------
-# Proceso: generación de llegadas
-# ---------------------------
-def generacion_llegadas(env, servers):
-    id_cliente = 0
-
-    while env.now <= TIEMPO_LLEGADA_MAXIMA:
-        tiempo_entre_llegadas = random.expovariate(LAMBDA)
-        yield env.timeout(tiempo_entre_llegadas)
-
-        id_cliente += 1
-        tiempo_llegada = env.now
-        env.process(atencion_cliente(env, id_cliente, servers, tiempo_llegada))
-
 # ---------------------------
 # Configuración General de la simulación
 # ---------------------------
+# Los procesos generacion_llegadas y atencion_cliente, la función actualizar_estadisticas y los
+# acumuladores viven en la clase SimulacionBanco (modelo_banco.py).
+# Con colas_individuales=True cada cajero tiene su propia cola y el cliente elige la más corta.
 def main():
-    global area_clientes_cola, area_clientes_sistema, total_sistema, total_cola, total_clientes_simulacion
-
-    # Crear encabezados para el archivo unificado
-    with open("eventos_simulacion.csv", "w") as archivo_eventos:
-        archivo_eventos.write("ID_Cliente,Evento,Tiempo,Tiempo_Desde_Ultima_Llegada,Tamaño_Cola,Cajeros_Ocupados,Tiempo_Inicio_Servicio,Tiempo_Fin_Servicio,Tiempo_En_Cola,Tiempo_En_Servicio,Tiempo_Total\n")
 
-    banco = simpy.Environment()
+    # Con PERFILAR se mide el tiempo de cada fase del modelo (sin costo cuando es False)
+    modelo = PerfiladoSimpy if PERFILAR else SimulacionBanco
 
-    # Crear una lista de recursos: cajeros independientes
-    cajeros = [simpy.Resource(banco) for _ in range(NUM_SERVIDORES)]
+    # Abrir el archivo unificado de eventos (eventos_simulacion.csv o eventos_simulacion.npy)
+    with abrir_registro(FORMATO_REGISTRO, modo=MODO_REGISTRO, cada=MUESTREO_CADA, ancho=ANCHO_VENTANA_REGISTRO) as registro:
+        banco = modelo(LAMBDA, MU, num_servidores=NUM_SERVIDORES, tiempo_llegada_maxima=TIEMPO_LLEGADA_MAXIMA, semilla=RANDOM_SEED, colas_individuales=True, registro=registro)
 
-    # Programamos el recurso de generación de llegadas de clientes
-    banco.process(generacion_llegadas(banco, cajeros))
-    print("\n--- Tabla de Eventos ---")
-    print("Num,Timestamp,Tipo Evento,Tamaño de la Cola,Cajeros Ocupados,Tiempo desde evento anterior")
-
-    # Ejecutar la simulación hasta que no haya más clientes en el sistema
-    while True:
-        banco.run()  # Ejecutar la simulación indefinidamente
-        if all(len(cajero.queue) == 0 and cajero.count == 0 for cajero in cajeros):  # Verificar si no hay clientes en cola o siendo atendidos
-            break
-
-    # Calculo de resultados
-    utilizacion = (tiempo_ocupado / (banco.now * NUM_SERVIDORES)) * 100
-    L = area_clientes_sistema / banco.now
-    L_q = area_clientes_cola / banco.now
-    Wq = total_cola / total_clientes_simulacion
-    W = total_sistema / total_clientes_simulacion
+        # Ejecutar la simulación hasta que no haya más clientes en el sistema
+        resultados = ejecutar_perfilado(banco, ARCHIVO_PSTATS)
 
     # Despliegue de resultados de la simulación
-    print("\n--- Resultados de la Simulación ---")
-    print(f"Utilizacion del Servidor:                     {utilizacion:.2f}%")
-    print(f"Numero de clientes promedio en el banco (L):  {L:.4f}")
-    print(f"Numero de clientes promedio en cola (L_q):    {L_q:.4f}")
-    print(f"Tiempo promedio de espera en el sistema (W):  {W:.4f}")
-    print(f"Tiempo promedio de espera en la cola (Wq):    {Wq:.4f}")
+    imprimir_resultados(resultados)
+
+    if PERFILAR:
+        imprimir_perfil(banco.perfil)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,299 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Análisis de un registro de eventos (eventos_simulacion.csv o .npy) en bloques de tamaño fijo.
+
+Después de una corrida larga, el registro puede ocupar varios GB; cargarlo completo para recalcular
+esperas, colas y utilización no cabe en memoria. leer_bloques() lo recorre en bloques de
+FILAS_POR_BLOQUE filas con el esquema TIPO_EVENTO de registro_eventos.py:
+
+  - CSV: cada bloque de líneas se convierte a texto numérico (el evento como código y los campos
+    vacíos como nan) y se interpreta con una sola llamada a np.loadtxt.
+  - npy: el archivo se mapea a memoria y se recorre por rebanadas.
+
+AnalisisRegistro acumula cada bloque con operaciones de NumPy y reconstruye lo mismo que imprime el
+main() de los scripts 5 y 6:
+
+  - L y L_q: suma de (clientes en cola o en el sistema) x (tiempo desde el evento anterior), igual
+    que actualizar_estadisticas. En el CSV la columna Tiempo tiene dos decimales, así que el tiempo
+    de cada evento se toma de Tiempo_Inicio_Servicio o Tiempo_Fin_Servicio cuando la fila los tiene
+    (con precisión completa); solo las llegadas quedan redondeadas.
+  - W, Wq y utilización: de las filas FinServicio (Tiempo_Total, Tiempo_Total - Tiempo_En_Servicio y
+    la suma de Tiempo_En_Servicio entre tiempo_simulado x num_servidores).
+  - Distribución ponderada por tiempo de la cola y de los cajeros ocupados.
+
+El número de cajeros no está en el registro y se pasa como argumento. tiempo_simulado es, por
+omisión, el instante del último evento (el final de la corrida cuando el sistema se vacía).
+
+Con ancho se acumulan además métricas por franja de tiempo (L_q, L, utilización, llegadas y Wq y W
+por franja de llegada del cliente); ventanas(num_franjas) las combina en ventanas móviles de
+num_franjas franjas que avanzan de a una franja. La memoria depende del número de franjas, no del
+número de eventos.
+
+python analisis_registro.py [eventos_simulacion.csv] [num_servidores] muestra los resultados y las
+ventanas móviles del registro.
+"""
+
+import io
+import math
+import sys
+from dataclasses import dataclass
+from itertools import islice
+
+import numpy as np
+
+from modelo_banco import ResultadosSimulacion, imprimir_resultados
+from registro_eventos import ARCHIVO_EVENTOS, CODIGOS_EVENTO, TIPO_EVENTO, leer_registro_npy
+
+# Configuración (mismos valores que el script 5)
+NUM_SERVIDORES = 5
+FILAS_POR_BLOQUE = 1_000_000
+ANCHO_FRANJA = 15
+FRANJAS_POR_VENTANA = 4
+
+LLEGADA = CODIGOS_EVENTO["Llegada"]
+INICIO_SERVICIO = CODIGOS_EVENTO["InicioServicio"]
+FIN_SERVICIO = CODIGOS_EVENTO["FinServicio"]
+
+
+# ---------------------------
+# Lectura por bloques
+# ---------------------------
+def _texto_numerico(texto):
+    # El evento como su código y los campos vacíos como nan; dos pasadas cubren campos vacíos seguidos
+    for evento, codigo in CODIGOS_EVENTO.items():
+        texto = texto.replace(f",{evento},", f",{codigo},")
+    texto = texto.replace(",,", ",nan,").replace(",,", ",nan,")
+    return texto.replace(",\n", ",nan\n")
+
+
+def leer_bloques_csv(ruta=ARCHIVO_EVENTOS, filas_por_bloque=FILAS_POR_BLOQUE):
+    with open(ruta) as archivo:
+        next(archivo, None)         # Encabezado
+        while True:
+            lineas = list(islice(archivo, filas_por_bloque))
+            if not lineas:
+                return
+            if not lineas[-1].endswith("\n"):
+                lineas[-1] += "\n"
+            valores = np.loadtxt(io.StringIO(_texto_numerico("".join(lineas))), delimiter=",", ndmin=2)
+            bloque = np.empty(len(valores), dtype=TIPO_EVENTO)
+            for columna, nombre in enumerate(TIPO_EVENTO.names):
+                bloque[nombre] = valores[:, columna]
+            yield bloque
+
+
+def leer_bloques_npy(ruta, filas_por_bloque=FILAS_POR_BLOQUE):
+    eventos = leer_registro_npy(ruta)
+    for inicio in range(0, len(eventos), filas_por_bloque):
+        yield eventos[inicio:inicio + filas_por_bloque]
+
+
+def leer_bloques(ruta=ARCHIVO_EVENTOS, filas_por_bloque=FILAS_POR_BLOQUE):
+    if str(ruta).endswith(".npy"):
+        return leer_bloques_npy(ruta, filas_por_bloque)
+    return leer_bloques_csv(ruta, filas_por_bloque)
+
+
+# ---------------------------
+# Acumulación de un registro
+# ---------------------------
+@dataclass
+class FilaVentana:
+    inicio: float
+    fin: float
+    L_q: float              # Promedio en el tiempo de clientes en cola
+    L: float                # Promedio en el tiempo de clientes en el sistema
+    utilizacion: float      # Promedio en el tiempo de cajeros ocupados / num_servidores
+    llegadas: int           # Filas Llegada dentro de la ventana
+    clientes: int           # Clientes atendidos que llegaron en la ventana
+    Wq: float               # Espera promedio en cola de esos clientes
+    W: float                # Tiempo promedio en el sistema de esos clientes
+
+
+def _sumar_en(serie, indices, pesos=None):
+    # Suma pesos (o cuenta) por índice en serie, que crece si hace falta; devuelve la serie
+    conteos = np.bincount(indices, weights=pesos)
+    if len(conteos) > len(serie):
+        serie = np.concatenate([serie, np.zeros(len(conteos) - len(serie))])
+    serie[:len(conteos)] += conteos
+    return serie
+
+
+class AnalisisRegistro:
+
+    # Series con área bajo la curva: cola, sistema y cajeros ocupados
+    AREAS = ("cola", "sistema", "ocupados")
+
+    def __init__(self, num_servidores=NUM_SERVIDORES, ancho=None):
+        self.num_servidores = num_servidores
+        self.ancho = ancho
+
+        self.num_eventos = 0
+        self.tiempo_ultimo_evento = 0.0
+        self.areas = dict.fromkeys(self.AREAS, 0.0)
+        self.histograma_cola = np.zeros(0)
+        self.histograma_ocupados = np.zeros(0)
+
+        # Clientes atendidos (filas FinServicio)
+        self.clientes_atendidos = 0
+        self.total_sistema = 0.0
+        self.total_cola = 0.0
+        self.tiempo_ocupado = 0.0
+
+        # Por franja: área acumulada hasta el inicio de cada franja k >= 1 y sumas por franja
+        self.acumuladas = {nombre: [] for nombre in self.AREAS}
+        self.llegadas = np.zeros(0)
+        self.atendidos = np.zeros(0)
+        self.suma_cola = np.zeros(0)
+        self.suma_sistema = np.zeros(0)
+
+    def agregar_bloque(self, bloque):
+        if not len(bloque):
+            return
+        evento = bloque["evento"]
+        inicio_servicio = bloque["tiempo_inicio_servicio"]
+        fin_servicio = bloque["tiempo_fin_servicio"]
+
+        # Tiempo de cada evento con la mejor precisión disponible, sin retroceder
+        tiempos = np.where((evento == INICIO_SERVICIO) & ~np.isnan(inicio_servicio), inicio_servicio, bloque["tiempo"])
+        tiempos = np.where((evento == FIN_SERVICIO) & ~np.isnan(fin_servicio), fin_servicio, tiempos)
+        tiempos = np.maximum.accumulate(np.maximum(tiempos, self.tiempo_ultimo_evento))
+        deltas = np.diff(tiempos, prepend=self.tiempo_ultimo_evento)
+
+        cola = bloque["tamano_cola"]
+        ocupados = bloque["cajeros_ocupados"]
+        valores = {"cola": cola, "sistema": cola + ocupados, "ocupados": ocupados}
+        if self.ancho:
+            self._agregar_franjas(tiempos, valores, evento)
+        for nombre, valor in valores.items():
+            self.areas[nombre] += float(np.dot(valor, deltas))
+        self.histograma_cola = _sumar_en(self.histograma_cola, cola, deltas)
+        self.histograma_ocupados = _sumar_en(self.histograma_ocupados, ocupados, deltas)
+
+        # Clientes atendidos
+        fin = evento == FIN_SERVICIO
+        totales = bloque["tiempo_total"][fin]
+        servicios = bloque["tiempo_en_servicio"][fin]
+        esperas = totales - servicios
+        self.clientes_atendidos += len(totales)
+        self.total_sistema += float(totales.sum())
+        self.total_cola += float(esperas.sum())
+        self.tiempo_ocupado += float(servicios.sum())
+        if self.ancho:
+            franja = ((fin_servicio[fin] - totales) // self.ancho).astype(np.int64)
+            self.atendidos = _sumar_en(self.atendidos, franja)
+            self.suma_cola = _sumar_en(self.suma_cola, franja, esperas)
+            self.suma_sistema = _sumar_en(self.suma_sistema, franja, totales)
+
+        self.num_eventos += len(bloque)
+        self.tiempo_ultimo_evento = float(tiempos[-1])
+
+    def _agregar_franjas(self, tiempos, valores, evento):
+        # Área acumulada en cada borde de franja k * ancho dentro de (tiempo_ultimo_evento, tiempos[-1]]:
+        # la del último evento antes del borde más valor x (borde - ese evento). Cada fila vale desde
+        # el evento anterior hasta su propio tiempo.
+        ancho = self.ancho
+        primero = len(self.acumuladas["cola"]) + 1
+        ultimo = int(tiempos[-1] // ancho)
+        self.llegadas = _sumar_en(self.llegadas, (tiempos[evento == LLEGADA] // ancho).astype(np.int64))
+        if ultimo < primero:
+            return
+        bordes = np.arange(primero, ultimo + 1) * ancho
+        # Primer evento con tiempo >= borde: el borde cae dentro de su intervalo
+        j = np.searchsorted(tiempos, bordes, side="left")
+        anteriores = np.concatenate([[self.tiempo_ultimo_evento], tiempos])[j]
+        for nombre, valor in valores.items():
+            acumulada = np.concatenate([[self.areas[nombre]], self.areas[nombre] + np.cumsum(valor * np.diff(tiempos, prepend=self.tiempo_ultimo_evento))])
+            self.acumuladas[nombre].extend((acumulada[j] + valor[j] * (bordes - anteriores)).tolist())
+
+    # ---------------------------
+    # Resultados
+    # ---------------------------
+    def resultados(self, tiempo_simulado=None):
+        if tiempo_simulado is None:
+            tiempo_simulado = self.tiempo_ultimo_evento
+        atendidos = self.clientes_atendidos
+        return ResultadosSimulacion(
+            utilizacion=self.tiempo_ocupado / (tiempo_simulado * self.num_servidores),
+            L=self.areas["sistema"] / tiempo_simulado,
+            L_q=self.areas["cola"] / tiempo_simulado,
+            W=self.total_sistema / atendidos if atendidos else math.nan,
+            Wq=self.total_cola / atendidos if atendidos else math.nan,
+            clientes_atendidos=atendidos,
+            tiempo_simulado=tiempo_simulado,
+            distribucion_cola=tuple((self.histograma_cola / self.histograma_cola.sum()).tolist()) if self.histograma_cola.sum() > 0 else (),
+            distribucion_ocupados=tuple((self.histograma_ocupados / self.histograma_ocupados.sum()).tolist()) if self.histograma_ocupados.sum() > 0 else (),
+        )
+
+    def ventanas(self, num_franjas=1):
+        # Ventanas móviles de num_franjas franjas que avanzan de a una franja (num_franjas=1: una
+        # fila por franja). La última franja termina en el último evento.
+        if not self.ancho:
+            raise ValueError("Las ventanas necesitan AnalisisRegistro(ancho=...)")
+        hasta = self.tiempo_ultimo_evento
+        ancho = self.ancho
+        num_bordes = math.ceil(hasta / ancho)
+        if num_bordes == 0:
+            return []
+
+        # Área acumulada en 0, ancho, 2 ancho, ..., y en hasta
+        acumuladas = {}
+        for nombre in self.AREAS:
+            bordes = [0.0] + self.acumuladas[nombre][:num_bordes - 1] + [self.areas[nombre]]
+            acumuladas[nombre] = np.array(bordes)
+        instantes = np.minimum(np.arange(num_bordes + 1) * ancho, hasta)
+
+        def por_franja(serie):
+            serie = serie[:num_bordes]
+            return np.cumsum(np.concatenate([[0.0], serie, np.zeros(num_bordes - len(serie))]))
+
+        llegadas, atendidos = por_franja(self.llegadas), por_franja(self.atendidos)
+        suma_cola, suma_sistema = por_franja(self.suma_cola), por_franja(self.suma_sistema)
+
+        filas = []
+        for k in range(max(num_bordes - num_franjas + 1, 1)):
+            fin = min(k + num_franjas, num_bordes)
+            duracion = instantes[fin] - instantes[k]
+            clientes = int(atendidos[fin] - atendidos[k])
+            filas.append(FilaVentana(
+                inicio=float(instantes[k]),
+                fin=float(instantes[fin]),
+                L_q=(acumuladas["cola"][fin] - acumuladas["cola"][k]) / duracion,
+                L=(acumuladas["sistema"][fin] - acumuladas["sistema"][k]) / duracion,
+                utilizacion=(acumuladas["ocupados"][fin] - acumuladas["ocupados"][k]) / (duracion * self.num_servidores),
+                llegadas=int(llegadas[fin] - llegadas[k]),
+                clientes=clientes,
+                Wq=(suma_cola[fin] - suma_cola[k]) / clientes if clientes else math.nan,
+                W=(suma_sistema[fin] - suma_sistema[k]) / clientes if clientes else math.nan,
+            ))
+        return filas
+
+
+def analizar_registro(ruta=ARCHIVO_EVENTOS, num_servidores=NUM_SERVIDORES, ancho=None, filas_por_bloque=FILAS_POR_BLOQUE):
+    analisis = AnalisisRegistro(num_servidores, ancho)
+    for bloque in leer_bloques(ruta, filas_por_bloque):
+        analisis.agregar_bloque(bloque)
+    return analisis
+
+
+def imprimir_ventanas(filas):
+    print(f"{'Ventana':>15}{'L_q':>8}{'L':>8}{'Util.':>8}{'Llegadas':>10}{'Atendidos':>11}{'Wq':>8}{'W':>8}")
+    for f in filas:
+        print(f"{f.inicio:7.0f}-{f.fin:<7.0f}{f.L_q:8.2f}{f.L:8.2f}{f.utilizacion:8.2f}{f.llegadas:10d}{f.clientes:11d}{f.Wq:8.2f}{f.W:8.2f}")
+
+
+def main():
+    ruta = sys.argv[1] if len(sys.argv) > 1 else ARCHIVO_EVENTOS
+    num_servidores = int(sys.argv[2]) if len(sys.argv) > 2 else NUM_SERVIDORES
+    analisis = analizar_registro(ruta, num_servidores, ANCHO_FRANJA)
+
+    print(f"\n--- Registro {ruta}: {analisis.num_eventos} eventos, {num_servidores} cajeros ---")
+    imprimir_resultados(analisis.resultados())
+    print(f"\n--- Ventanas móviles de {FRANJAS_POR_VENTANA * ANCHO_FRANJA} (cada {ANCHO_FRANJA}) ---")
+    imprimir_ventanas(analisis.ventanas(FRANJAS_POR_VENTANA))
+
+
+if __name__ == '__main__':
+    main()
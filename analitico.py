@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Resultados analíticos de estado estacionario para M/M/1 y M/M/c (una sola cola, scripts 4 y 5).
+
+Con a = LAMBDA / MU (carga ofrecida) y rho = a / c:
+  - Erlang B se calcula con la recursión B(0) = 1, B(k) = a B(k-1) / (k + a B(k-1)), estable para
+    miles de cajeros (no usa a^c ni c!).
+  - Erlang C (probabilidad de esperar): C = B / (1 - rho (1 - B)).
+  - L_q = C rho / (1 - rho),  Wq = L_q / LAMBDA,  W = Wq + 1 / MU,  L = LAMBDA W.
+  - P(espera > t) = C exp(-(c MU - LAMBDA) t).
+
+Con rho >= 1 el sistema es inestable: L, L_q, W y Wq son infinitos y la utilización es 1.
+
+Los resultados se guardan en caché (functools.lru_cache), así que evaluar la misma celda varias
+veces, como al filtrar un barrido de parámetros, no repite el cálculo.
+
+imprimir_analitico() pone los valores analíticos junto a una sola corrida (los scripts 4 y 5 lo
+muestran siempre al final). comparar_con_simulacion() los pone junto a un resumen de replicaciones
+y marca las métricas cuyo intervalo de confianza no contiene el valor analítico. Las corridas son de
+horizonte finito y empiezan con el banco vacío, así que una diferencia pequeña y sistemática es
+esperable.
+
+validar_con_replicaciones() corre esas replicaciones (la usan los scripts 4 y 5 con
+VALIDAR_ANALITICO = True). Las replicaciones se cortan en tiempo_llegada_maxima sin vaciar el banco:
+con vaciado, el tiempo final sin llegadas entra en el denominador y la utilización, L y L_q quedan
+por debajo del estado estacionario aunque el modelo sea correcto. Lo que queda fuera del intervalo
+con un horizonte corto mide el sesgo del arranque con el banco vacío (transitorio, largo en M/M/1 con
+rho alto) y de los servicios en curso al corte, que no se cuentan. Con rho >= 1 no hay estado
+estacionario y la comparación se omite.
+"""
+
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+
+from replicaciones import METRICAS, ejecutar_replicaciones, resumir
+
+
+# ---------------------------
+# Resultados analíticos
+# ---------------------------
+@dataclass(frozen=True)
+class ResultadosAnaliticos:
+    utilizacion: float
+    L: float
+    L_q: float
+    W: float
+    Wq: float
+    prob_espera: float          # Erlang C: probabilidad de que un cliente espere en cola
+
+    @property
+    def estable(self):
+        return self.utilizacion < 1
+
+
+# ---------------------------
+# Erlang B y Erlang C
+# ---------------------------
+@lru_cache(maxsize=4096)
+def erlang_b(num_servidores, carga):
+    b = 1.0
+    for k in range(1, num_servidores + 1):
+        b = carga * b / (k + carga * b)
+    return b
+
+
+@lru_cache(maxsize=4096)
+def erlang_c(num_servidores, carga):
+    rho = carga / num_servidores
+    if rho >= 1:
+        return 1.0
+    b = erlang_b(num_servidores, carga)
+    return b / (1 - rho * (1 - b))
+
+
+# ---------------------------
+# M/M/c y M/M/1
+# ---------------------------
+@lru_cache(maxsize=4096)
+def mmc(tasa_llegadas, tasa_servicio, num_servidores):
+    carga = tasa_llegadas / tasa_servicio
+    rho = carga / num_servidores
+    if rho >= 1:
+        return ResultadosAnaliticos(utilizacion=1.0, L=math.inf, L_q=math.inf, W=math.inf, Wq=math.inf, prob_espera=1.0)
+
+    c = erlang_c(num_servidores, carga)
+    L_q = c * rho / (1 - rho)
+    Wq = L_q / tasa_llegadas
+    W = Wq + 1 / tasa_servicio
+    return ResultadosAnaliticos(utilizacion=rho, L=tasa_llegadas * W, L_q=L_q, W=W, Wq=Wq, prob_espera=c)
+
+
+def mm1(tasa_llegadas, tasa_servicio):
+    return mmc(tasa_llegadas, tasa_servicio, 1)
+
+
+def prob_espera_mayor(tasa_llegadas, tasa_servicio, num_servidores, t):
+    r = mmc(tasa_llegadas, tasa_servicio, num_servidores)
+    if not r.estable:
+        return 1.0
+    return r.prob_espera * math.exp(-(num_servidores * tasa_servicio - tasa_llegadas) * t)
+
+
+# ---------------------------
+# Comparación con la simulación
+# ---------------------------
+# resumen: {métrica: ResumenMetrica} de replicaciones.resumir(); corrida: un ResultadosSimulacion
+# opcional (por ejemplo, la corrida que acaba de imprimir el script).
+def imprimir_analitico(analitico, corrida, nota=None):
+    # Sin intervalo de confianza: una corrida sola no dice si la diferencia es ruido o sesgo
+    print("\n--- Analítico contra la corrida ---")
+    if not analitico.estable:
+        print("rho >= 1: el sistema es inestable y no tiene estado estacionario; la cola crece con el tiempo.")
+    if nota is not None:
+        print(nota)
+    print(f"{'Métrica':<12}{'Corrida':>10}{'Analítico':>11}")
+    for metrica in METRICAS:
+        print(f"{metrica:<12}{getattr(corrida, metrica):10.4f}{getattr(analitico, metrica):11.4f}")
+
+
+def comparar_con_simulacion(analitico, resumen, corrida=None, confianza=0.95):
+    n = next(iter(resumen.values())).n
+    print(f"\n--- Analítico contra simulado ({n} replicaciones, IC {confianza:.0%}) ---")
+    if not analitico.estable:
+        print("rho >= 1: el sistema es inestable y no tiene estado estacionario; la cola crece con el tiempo.")
+    print(f"{'Métrica':<12}{'Corrida':>10}{'Media':>10}{'Inferior':>10}{'Superior':>10}{'Analítico':>11}  ")
+    for metrica, r in resumen.items():
+        valor = getattr(analitico, metrica)
+        fuera = not (r.inferior <= valor <= r.superior)
+        propia = f"{getattr(corrida, metrica):10.4f}" if corrida is not None else f"{'':>10}"
+        print(f"{metrica:<12}{propia}{r.media:10.4f}{r.inferior:10.4f}{r.superior:10.4f}{valor:11.4f}  {'fuera del IC' if fuera else ''}")
+
+
+def validar_con_replicaciones(analitico, num_replicaciones, semilla=None, corrida=None, procesos=None, **parametros):
+    # parametros: los de SimulacionBanco; se fuerza vaciar_sistema=False (ver la descripción del módulo)
+    if not analitico.estable:
+        print("\n--- Analítico contra simulado ---")
+        print("rho >= 1: el sistema es inestable y no tiene estado estacionario; no se compara con los valores analíticos.")
+        return None
+    parametros["vaciar_sistema"] = False
+    resumen = resumir(ejecutar_replicaciones(num_replicaciones, semilla, procesos, **parametros))
+    comparar_con_simulacion(analitico, resumen, corrida)
+    return resumen
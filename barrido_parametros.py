@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Barrido de parámetros del modelo del banco (LAMBDA x MU x NUM_SERVIDORES).
+
+Para la planificación de capacidad se corren los modelos de los scripts 5 (una sola cola) y 6 (una
+cola por cajero) sobre mallas de tasas de llegada, tasas de servicio y número de cajeros. En lugar de
+editar las constantes de cada script, este módulo recibe la especificación de la malla, corre todas
+las celdas en paralelo y guarda el resultado de cada celda en disco.
+
+Cada celda se guarda en CARPETA_CACHE con el nombre del hash de (variante, parámetros, semilla,
+replicaciones, origen de las variables y VERSION_MODELO de modelo_banco.py). Al repetir un barrido
+que se traslapa con uno anterior solo se calculan las celdas nuevas. Con semilla None (entropía del
+sistema) no se usa la caché: cada barrido simula de nuevo. La tabla final se escribe de una sola
+vez en un archivo CSV.
+
+Todas las celdas usan la misma semilla maestra, es decir, números aleatorios comunes entre celdas.
+
+Antes de simular, las celdas se pueden filtrar con la utilización analítica rho = LAMBDA / (c MU)
+(analitico.py): con utilizacion_minima y utilizacion_maxima en la malla solo se simulan las celdas
+dentro de ese rango (por ejemplo, se descartan las inestables con rho >= 1 y las casi vacías).
+
+Uso:
+    python barrido_parametros.py                 # malla definida en MALLA
+    python barrido_parametros.py malla.json      # malla en un archivo JSON con las mismas llaves
+"""
+
+import csv
+import hashlib
+import json
+import os
+import sys
+import time
+from dataclasses import asdict
+from itertools import product
+
+from analitico import mmc
+from modelo_banco import VERSION_MODELO, ResultadosSimulacion
+from perfil_llegadas import PerfilLlegadas
+from replicaciones import METRICAS, ejecutar_tareas, generar_semillas, resumir
+
+CARPETA_CACHE = ".cache_barrido"
+ARCHIVO_RESULTADOS = "resultados_barrido.csv"
+
+# Variantes del modelo: script 5 (una sola cola) y script 6 (colas individuales)
+VARIANTES = {"cola_unica": False, "colas_individuales": True}
+
+# Especificación de la malla
+MALLA = {
+    "variantes": ["cola_unica", "colas_individuales"],
+    "tasa_llegadas": [0.8, 1.0, 1.2],
+    "tasa_servicio": [0.25],
+    "num_servidores": [4, 5, 6],
+    "tiempo_llegada_maxima": 480,
+    "replicaciones": 50,
+    "semilla": 2025,
+    "variables": "numpy",
+    # Rango de utilización analítica de las celdas que se simulan (None = sin límite)
+    "utilizacion_minima": None,
+    "utilizacion_maxima": 0.99,
+}
+
+
+# ---------------------------
+# Celdas de la malla
+# ---------------------------
+def celdas(malla):
+    for variante, tasa_llegadas, tasa_servicio, num_servidores in product(malla["variantes"], malla["tasa_llegadas"], malla["tasa_servicio"], malla["num_servidores"]):
+        # Tipos normalizados para que 1 y 1.0 den la misma llave de caché
+        yield {
+            "variante": variante,
+            "tasa_llegadas": float(tasa_llegadas),
+            "tasa_servicio": float(tasa_servicio),
+            "num_servidores": int(num_servidores),
+            "tiempo_llegada_maxima": float(malla["tiempo_llegada_maxima"]),
+            "replicaciones": int(malla["replicaciones"]),
+            "semilla": malla["semilla"],
+            "variables": malla.get("variables", "numpy"),
+            "version_modelo": VERSION_MODELO,
+        }
+
+
+# Celdas cuya utilización analítica está en [utilizacion_minima, utilizacion_maxima]
+def filtrar_celdas(lista_celdas, utilizacion_minima=None, utilizacion_maxima=None):
+    seleccionadas = []
+    for celda in lista_celdas:
+        rho = mmc(celda["tasa_llegadas"], celda["tasa_servicio"], celda["num_servidores"]).utilizacion
+        if utilizacion_minima is not None and rho < utilizacion_minima:
+            continue
+        if utilizacion_maxima is not None and rho > utilizacion_maxima:
+            continue
+        seleccionadas.append(celda)
+    return seleccionadas
+
+
+# Parámetros opcionales del modelo que una celda puede traer (dotacion.py); solo entran en la llave
+# de caché de las celdas que los usan
+PARAMETROS_OPCIONALES = ("perfil_llegadas", "umbral_espera")
+
+
+def parametros_modelo(celda):
+    parametros = {
+        "tasa_llegadas": celda["tasa_llegadas"],
+        "tasa_servicio": celda["tasa_servicio"],
+        "num_servidores": celda["num_servidores"],
+        "tiempo_llegada_maxima": celda["tiempo_llegada_maxima"],
+        "colas_individuales": VARIANTES[celda["variante"]],
+        "variables": celda["variables"],
+    }
+    for nombre in PARAMETROS_OPCIONALES:
+        if celda.get(nombre) is not None:
+            parametros[nombre] = celda[nombre]
+    if "perfil_llegadas" in parametros:
+        # La celda guarda tramos e interpolación (PerfilLlegadas.como_dict)
+        parametros["perfil_llegadas"] = PerfilLlegadas.desde_dict(parametros["perfil_llegadas"])
+    return parametros
+
+
+# ---------------------------
+# Caché en disco
+# ---------------------------
+def llave_celda(celda):
+    texto = json.dumps(celda, sort_keys=True)
+    return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+
+def ruta_cache(celda, carpeta=CARPETA_CACHE):
+    return os.path.join(carpeta, llave_celda(celda) + ".json")
+
+
+def leer_cache(celda, carpeta=CARPETA_CACHE):
+    ruta = ruta_cache(celda, carpeta)
+    if not os.path.exists(ruta):
+        return None
+    with open(ruta) as archivo:
+        datos = json.load(archivo)
+    return [ResultadosSimulacion(**r) for r in datos["replicaciones"]]
+
+
+def guardar_cache(celda, resultados, carpeta=CARPETA_CACHE):
+    os.makedirs(carpeta, exist_ok=True)
+    ruta = ruta_cache(celda, carpeta)
+
+    # Se escribe a un archivo temporal y se renombra, para no dejar celdas a medio escribir
+    temporal = ruta + ".tmp"
+    with open(temporal, "w") as archivo:
+        json.dump({"celda": celda, "replicaciones": [asdict(r) for r in resultados]}, archivo)
+    os.replace(temporal, ruta)
+
+
+# ---------------------------
+# Ejecución de las celdas
+# ---------------------------
+# Devuelve una lista de (celda, resultados por replicación). Las celdas que no están en caché se
+# corren juntas en un solo pool: cada replicación de cada celda es una tarea independiente.
+# Las celdas con semilla None toman entropía nueva en cada corrida: no se leen ni se guardan en caché.
+def ejecutar_celdas(lista_celdas, procesos=None, carpeta=CARPETA_CACHE):
+    resultados = [None] * len(lista_celdas)
+    pendientes = []
+    for i, celda in enumerate(lista_celdas):
+        if celda["semilla"] is not None:
+            resultados[i] = leer_cache(celda, carpeta)
+        if resultados[i] is None:
+            pendientes.append(i)
+
+    if pendientes:
+        # Una sola lista de tareas para todas las celdas pendientes (mejor balance de carga)
+        tareas = []
+        for i in pendientes:
+            celda = lista_celdas[i]
+            semillas = generar_semillas(celda["replicaciones"], celda["semilla"])
+            tareas.extend((parametros_modelo(celda), semilla) for semilla in semillas)
+        corridas = ejecutar_tareas(tareas, procesos)
+
+        inicio = 0
+        for i in pendientes:
+            celda = lista_celdas[i]
+            fin = inicio + celda["replicaciones"]
+            resultados[i] = corridas[inicio:fin]
+            if celda["semilla"] is not None:
+                guardar_cache(celda, resultados[i], carpeta)
+            inicio = fin
+
+    return list(zip(lista_celdas, resultados)), len(pendientes)
+
+
+def ejecutar_barrido(malla, procesos=None, carpeta=CARPETA_CACHE):
+    seleccionadas = filtrar_celdas(celdas(malla), malla.get("utilizacion_minima"), malla.get("utilizacion_maxima"))
+    return ejecutar_celdas(seleccionadas, procesos, carpeta)
+
+
+# ---------------------------
+# Tabla final (se escribe en bloque)
+# ---------------------------
+def escribir_tabla(filas_barrido, ruta=ARCHIVO_RESULTADOS, confianza=0.95):
+    encabezado = ["variante", "tasa_llegadas", "tasa_servicio", "num_servidores", "tiempo_llegada_maxima", "replicaciones", "semilla"]
+    for metrica in METRICAS:
+        encabezado += [f"{metrica}_media", f"{metrica}_semiancho"]
+
+    filas = []
+    for celda, resultados in filas_barrido:
+        resumen = resumir(resultados, confianza)
+        fila = [celda[campo] for campo in encabezado[:7]]
+        for metrica in METRICAS:
+            fila += [resumen[metrica].media, resumen[metrica].semiancho]
+        filas.append(fila)
+
+    with open(ruta, "w", newline="") as archivo:
+        escritor = csv.writer(archivo)
+        escritor.writerow(encabezado)
+        escritor.writerows(filas)
+
+
+def cargar_malla(ruta):
+    with open(ruta) as archivo:
+        malla = dict(MALLA)
+        malla.update(json.load(archivo))
+    return malla
+
+
+def main():
+    malla = cargar_malla(sys.argv[1]) if len(sys.argv) > 1 else MALLA
+
+    inicio = time.perf_counter()
+    filas_barrido, calculadas = ejecutar_barrido(malla)
+    escribir_tabla(filas_barrido)
+    duracion = time.perf_counter() - inicio
+
+    print(f"\n--- Barrido de parámetros: {len(filas_barrido)} celdas ---")
+    print(f"Celdas descartadas:  {len(list(celdas(malla))) - len(filas_barrido)} (utilización analítica fuera de rango)")
+    print(f"Celdas calculadas:   {calculadas}")
+    print(f"Celdas desde caché:  {len(filas_barrido) - calculadas}")
+    print(f"Tiempo:              {duracion:.2f} s")
+    print(f"Tabla escrita en {ARCHIVO_RESULTADOS}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Comparación del costo por valor de los generadores de tiempos aleatorios.
+
+Mide el tiempo por valor de:
+  - random.expovariate (una llamada de Python por valor, como en los scripts originales);
+  - numpy.random.Generator.exponential() llamado con un solo valor;
+  - FlujoVariables (bloques de NumPy entregados uno por uno).
+
+Después corre el mismo modelo (MotorEventosBanco) con variables="random" y variables="numpy".
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_flujos
+"""
+
+import random
+import time
+
+import numpy as np
+
+from flujos_aleatorios import flujo_exponencial
+from motor_eventos import MotorEventosBanco
+
+NUM_VALORES = 2_000_000
+TASA = 0.25
+SEMILLA = 2025
+
+# Modelo de comparación (mismo sistema que el script 5, corrida larga)
+LAMBDA = 1
+MU = 0.25
+NUM_SERVIDORES = 5
+TIEMPO_LLEGADA_MAXIMA = 200_000
+
+
+# ---------------------------
+# Costo por valor
+# ---------------------------
+def con_random(n):
+    rng = random.Random(SEMILLA)
+    expovariate = rng.expovariate
+    for _ in range(n):
+        expovariate(TASA)
+
+
+def con_generador_escalar(n):
+    exponential = np.random.default_rng(SEMILLA).exponential
+    escala = 1 / TASA
+    for _ in range(n):
+        exponential(escala)
+
+
+def con_flujo(n):
+    valores = iter(flujo_exponencial(TASA, SEMILLA))
+    for _ in range(n):
+        next(valores)
+
+
+def medir(funcion, n):
+    inicio = time.perf_counter()
+    funcion(n)
+    return (time.perf_counter() - inicio) / n * 1e9
+
+
+def medir_modelo(variables):
+    inicio = time.perf_counter()
+    r = MotorEventosBanco(LAMBDA, MU, NUM_SERVIDORES, TIEMPO_LLEGADA_MAXIMA, semilla=SEMILLA, variables=variables).ejecutar()
+    return r, time.perf_counter() - inicio
+
+
+def main():
+    print(f"\n--- Costo por valor ({NUM_VALORES} valores exponenciales) ---")
+    t_random = medir(con_random, NUM_VALORES)
+    t_escalar = medir(con_generador_escalar, NUM_VALORES)
+    t_flujo = medir(con_flujo, NUM_VALORES)
+    print(f"random.expovariate:          {t_random:8.1f} ns/valor")
+    print(f"Generator.exponential():     {t_escalar:8.1f} ns/valor")
+    print(f"FlujoVariables (bloques):    {t_flujo:8.1f} ns/valor  ({t_random / t_flujo:.1f}x contra random)")
+
+    r_random, t_modelo_random = medir_modelo("random")
+    r_numpy, t_modelo_numpy = medir_modelo("numpy")
+    print(f"\n--- MotorEventosBanco: {r_numpy.clientes_atendidos} clientes ---")
+    print(f"variables=\"random\":  {t_modelo_random:8.2f} s   Wq={r_random.Wq:.4f}")
+    print(f"variables=\"numpy\":   {t_modelo_numpy:8.2f} s   Wq={r_numpy.Wq:.4f}  ({t_modelo_random / t_modelo_numpy:.2f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Comparación de rendimiento del registro de eventos.
+
+Compara la escritura original de actualizar_estadisticas (abrir el CSV en modo "a", escribir una fila
+y cerrarlo en cada evento) contra RegistroEventosCSV, que mantiene el archivo abierto y escribe en
+bloques. Se escriben las mismas filas (tres eventos por cliente) en ambos casos.
+
+Además corre el modelo del script 5 con cada modo de abrir_registro ("completo", "muestreo" y
+"agregado") y compara el tiempo y el tamaño del archivo escrito.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_registro_eventos
+"""
+
+import os
+import tempfile
+import time
+
+from modelo_banco import SimulacionBanco
+from registro_eventos import ENCABEZADO_CSV, MODOS_REGISTRO, RegistroEventosCSV, abrir_registro
+
+NUM_CLIENTES = 100000
+
+# Modelo del script 5 con un horizonte más largo para comparar los modos de registro
+LAMBDA = 1
+MU = 0.25
+NUM_SERVIDORES = 5
+TIEMPO_MODOS = 100_000
+MUESTREO_CADA = 100
+ANCHO_VENTANA = 15
+
+
+# ---------------------------
+# Filas de prueba: Llegada, InicioServicio y FinServicio por cliente
+# ---------------------------
+def eventos_de_prueba(num_clientes):
+    tiempo = 0.0
+    for id_cliente in range(1, num_clientes + 1):
+        tiempo += 1.0
+        yield (id_cliente, "Llegada", tiempo, 1.0, 2, 5, None, None, None, None, None)
+        yield (id_cliente, "InicioServicio", tiempo + 0.5, 0.5, 1, 5, tiempo + 0.5, None, 0.5, None, None)
+        yield (id_cliente, "FinServicio", tiempo + 4.5, 4.0, 1, 5, tiempo + 0.5, tiempo + 4.5, None, 4.0, 4.5)
+
+
+# ---------------------------
+# Ruta original: abrir, escribir y cerrar en cada evento
+# ---------------------------
+def escribir_por_evento(ruta, eventos):
+    with open(ruta, "w") as archivo_eventos:
+        archivo_eventos.write(ENCABEZADO_CSV)
+    for (id_cliente, evento, tiempo, delta_tiempo, clientes_cola, cajeros_ocupados, tiempo_inicio_servicio, tiempo_fin_servicio, tiempo_en_cola, tiempo_servicio, tiempo_total) in eventos:
+        with open(ruta, "a") as archivo_eventos:
+            archivo_eventos.write(f"{id_cliente if id_cliente else ''},{evento if evento else ''},{tiempo:.2f},{delta_tiempo:.2f},{clientes_cola},{cajeros_ocupados},{tiempo_inicio_servicio if tiempo_inicio_servicio else ''},{tiempo_fin_servicio if tiempo_fin_servicio else ''},{tiempo_en_cola if tiempo_en_cola else ''},{tiempo_servicio if tiempo_servicio else ''},{tiempo_total if tiempo_total else ''}\n")
+
+
+# ---------------------------
+# Ruta nueva: un solo manejador con escritura en bloques
+# ---------------------------
+def escribir_con_registro(ruta, eventos):
+    with RegistroEventosCSV(ruta) as registro:
+        for evento in eventos:
+            registro.registrar(*evento)
+
+
+def medir(funcion, ruta, num_clientes):
+    eventos = list(eventos_de_prueba(num_clientes))
+    inicio = time.perf_counter()
+    funcion(ruta, eventos)
+    duracion = time.perf_counter() - inicio
+    return len(eventos), duracion
+
+
+# ---------------------------
+# Modos de registro con el modelo del script 5
+# ---------------------------
+def comparar_modos(directorio):
+    filas = []
+    for modo in (None,) + MODOS_REGISTRO:
+        ruta = os.path.join(directorio, f"{modo}.csv")
+        inicio = time.perf_counter()
+        if modo is None:
+            SimulacionBanco(LAMBDA, MU, NUM_SERVIDORES, TIEMPO_MODOS, semilla=1).ejecutar()
+        else:
+            with abrir_registro("csv", ruta, modo=modo, cada=MUESTREO_CADA, ancho=ANCHO_VENTANA) as registro:
+                SimulacionBanco(LAMBDA, MU, NUM_SERVIDORES, TIEMPO_MODOS, semilla=1, registro=registro).ejecutar()
+        duracion = time.perf_counter() - inicio
+        filas.append((modo or "sin registro", duracion, os.path.getsize(ruta) if modo else 0))
+    return filas
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta_original = os.path.join(directorio, "por_evento.csv")
+        ruta_bloques = os.path.join(directorio, "en_bloques.csv")
+
+        eventos, t_original = medir(escribir_por_evento, ruta_original, NUM_CLIENTES)
+        _, t_bloques = medir(escribir_con_registro, ruta_bloques, NUM_CLIENTES)
+
+        # Ambas rutas deben producir exactamente el mismo archivo
+        with open(ruta_original) as a, open(ruta_bloques) as b:
+            identicos = a.read() == b.read()
+
+        modos = comparar_modos(directorio)
+
+    print(f"\n--- Registro de eventos: {eventos} filas ({NUM_CLIENTES} clientes) ---")
+    print(f"Abrir/cerrar por evento:   {t_original:8.3f} s   {eventos / t_original:12.0f} filas/s")
+    print(f"RegistroEventosCSV:        {t_bloques:8.3f} s   {eventos / t_bloques:12.0f} filas/s")
+    print(f"Aceleración:               {t_original / t_bloques:8.1f}x")
+    print(f"Archivos idénticos:        {identicos}")
+
+    print(f"\n--- Modos de registro: script 5 con TIEMPO_LLEGADA_MAXIMA = {TIEMPO_MODOS} ---")
+    print(f"{'Modo':<14}{'Tiempo (s)':>12}{'Archivo (KB)':>14}")
+    for modo, duracion, tamano in modos:
+        print(f"{modo:<14}{duracion:12.3f}{tamano / 1024:14.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Aceleración de los niveles de verbosidad.
+
+Corre el script 3a y el modelo del script 4 (SimulacionBanco con un cajero) con cada nivel de
+VERBOSIDAD y compara el tiempo contra la traza completa. La salida se redirige a os.devnull, así
+que la medición incluye el formateo y las llamadas a print pero no el costo de la terminal; en una
+terminal real la diferencia es todavía mayor.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_verbosidad
+"""
+
+import contextlib
+import os
+import re
+import time
+
+from modelo_banco import SimulacionBanco
+from verbosidad import COMPLETO, MUESTREO, RESUMEN, SILENCIOSO, registro_consola
+
+NIVELES = {"COMPLETO": COMPLETO, "MUESTREO": MUESTREO, "RESUMEN": RESUMEN, "SILENCIOSO": SILENCIOSO}
+MUESTREO_CADA = 100
+
+# Script 3a con un horizonte más largo (rho = 0.8)
+SCRIPT_3A = "3a-recursosv2.py"
+TIEMPO_SCRIPT_3A = 400_000
+
+# Modelo del script 4 con un horizonte más largo (rho = 0.8)
+LAMBDA = 0.2
+MU = 0.25
+TIEMPO_SCRIPT_4 = 500_000
+
+
+# ---------------------------
+# Ejecución de un script con constantes reemplazadas
+# ---------------------------
+def ejecutar_script(ruta, constantes):
+    with open(ruta, encoding="utf-8") as archivo:
+        codigo = archivo.read()
+    for nombre, valor in constantes.items():
+        codigo = re.sub(rf"^{nombre} = .*$", f"{nombre} = {valor}", codigo, count=1, flags=re.MULTILINE)
+    espacio = {"__name__": "__benchmark__"}
+    exec(compile(codigo, ruta, "exec"), espacio)
+    return espacio
+
+
+def medir(funcion):
+    with open(os.devnull, "w") as nulo, contextlib.redirect_stdout(nulo):
+        inicio = time.perf_counter()
+        funcion()
+        return time.perf_counter() - inicio
+
+
+def main():
+    tiempos_3a = {}
+    tiempos_4 = {}
+    for nombre, nivel in NIVELES.items():
+        tiempos_3a[nombre] = medir(lambda: ejecutar_script(SCRIPT_3A, {"VERBOSIDAD": nivel, "MUESTREO_CADA": MUESTREO_CADA, "SIMULATION_END_TIME": TIEMPO_SCRIPT_3A, "MEAN_INTER_ARRIVAL_TIME": 5, "MEAN_SERVICE_TIME": 4}))
+        tiempos_4[nombre] = medir(lambda: SimulacionBanco(LAMBDA, MU, 1, TIEMPO_SCRIPT_4, semilla=1, vaciar_sistema=False, registro=registro_consola(nivel, MUESTREO_CADA)).ejecutar())
+
+    print(f"\n--- Niveles de verbosidad (muestreo 1 de cada {MUESTREO_CADA}) ---")
+    print(f"{'Nivel':<12}{'Script 3a (s)':>15}{'Acel.':>8}{'Script 4 (s)':>15}{'Acel.':>8}")
+    for nombre in NIVELES:
+        print(f"{nombre:<12}{tiempos_3a[nombre]:15.2f}{tiempos_3a['COMPLETO'] / tiempos_3a[nombre]:8.1f}{tiempos_4[nombre]:15.2f}{tiempos_4['COMPLETO'] / tiempos_4[nombre]:8.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,272 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Suite de rendimiento de los ejemplos y de los motores de simulación.
+
+Mide la carga de trabajo de cada script (1 a 6) escalada a un número de clientes dado, sin
+registro de eventos y con la salida de consola redirigida a os.devnull:
+
+  - 1-ejemplo-simple: N procesos simple_process con esperas uniformes.
+  - 2-procesos-entidades: el generador del script 2 hasta crear N entidades.
+  - 3-recursos, 3a-recursosv2: los scripts con VERBOSIDAD = SILENCIOSO y el horizonte ajustado
+    a N pasajeros.
+  - 4 (M/M/1), 5 (M/M/c) y 6 (colas individuales) con los motores "simpy" (SimulacionBanco),
+    "eventos" (MotorEventosBanco) y, para colas FIFO, "vectorizado" (motor_vectorizado.py).
+    El script 4 usa rho = 0.8 (LAMBDA = 0.2) en lugar de su LAMBDA original, que es inestable.
+
+Cada medición corre en un proceso hijo nuevo, que reporta:
+  - eventos por segundo (Llegada/InicioServicio/FinServicio o inicio/fin de cada proceso);
+  - memoria residente máxima (getrusage, ru_maxrss) y la del proceso recién importado;
+  - solo se mide la simulación: la preparación del caso (leer el script, generar esperas) queda fuera;
+  - memoria por cliente: pico de tracemalloc dividido entre el número de clientes, en una segunda
+    corrida (tracemalloc hace lenta la ejecución, por eso solo hasta MAXIMO_TRACEMALLOC clientes).
+
+Los resultados se escriben en JSON junto con el commit, la versión de Python y de las bibliotecas,
+para comparar entre commits con --comparar.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.suite
+    python -m benchmarks.suite --clientes 1e3 1e4 1e5 1e6 1e7 --salida base.json
+    python -m benchmarks.suite --casos 5:simpy 5:eventos --comparar base.json
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy
+import simpy
+
+from benchmarks.bench_verbosidad import ejecutar_script
+from motor_vectorizado import generar_entradas_por_clientes, simular_fifo
+from replicaciones import MOTORES
+from verbosidad import SILENCIOSO
+
+CLIENTES = (10**3, 10**4, 10**5)
+MAXIMO_TRACEMALLOC = 10**5
+ARCHIVO_RESULTADOS = "resultados_benchmark.json"
+SEMILLA = 2025
+
+# Modelos del banco (rho = 0.8 en todos)
+BANCO = {
+    "4": dict(tasa_llegadas=0.2, tasa_servicio=0.25, num_servidores=1, colas_individuales=False),
+    "5": dict(tasa_llegadas=1.0, tasa_servicio=0.25, num_servidores=5, colas_individuales=False),
+    "6": dict(tasa_llegadas=1.0, tasa_servicio=0.25, num_servidores=5, colas_individuales=True),
+}
+
+
+# ---------------------------
+# Cargas de trabajo: cada una prepara el caso para num_clientes (fuera de la medición) y devuelve
+# una función sin argumentos que corre la simulación y devuelve (clientes, eventos)
+# ---------------------------
+def script_1(num_clientes):
+    simple_process = ejecutar_script("1-ejemplo-simple.py", {})["simple_process"]
+    rng = random.Random(SEMILLA)
+    esperas = [rng.uniform(0, 100) for _ in range(num_clientes)]
+
+    def correr():
+        env = simpy.Environment()
+        for i, espera in enumerate(esperas):
+            env.process(simple_process(env, f"Proceso {i}", waitfor=espera))
+        env.run()
+        return num_clientes, 2 * num_clientes
+    return correr
+
+
+def script_2(num_clientes):
+    espacio = ejecutar_script("2-procesos-entidades.py", {})
+    # El generador busca entity en el espacio del script: se envuelve para contar las entidades
+    entity = espacio["entity"]
+    creadas = [0]
+
+    def entidad_contada(env, name, waitfor=50):
+        creadas[0] += 1
+        return entity(env, name, waitfor)
+
+    espacio["entity"] = entidad_contada
+
+    def correr():
+        random.seed(SEMILLA)
+        env = simpy.Environment()
+        env.process(espacio["generator"](env, 0.1))
+        while creadas[0] < num_clientes:
+            env.step()
+        env.run(until=env.now + 50)
+        return creadas[0], 2 * creadas[0]
+    return correr
+
+
+def script_3(num_clientes, ruta="3-recursos.py"):
+    # MEAN_INTER_ARRIVAL_TIME = 5 y MEAN_SERVICE_TIME = 4: rho = 0.8
+    constantes = {"VERBOSIDAD": SILENCIOSO, "MEAN_INTER_ARRIVAL_TIME": 5, "MEAN_SERVICE_TIME": 4, "SIMULATION_END_TIME": 5 * num_clientes}
+
+    def correr():
+        random.seed(SEMILLA)
+        espacio = ejecutar_script(ruta, constantes)
+        atendidos = espacio["pasajerosAtendidos"] if "pasajerosAtendidos" in espacio else espacio["tiempoEnCola"].n
+        return atendidos, 3 * atendidos
+    return correr
+
+
+def script_3a(num_clientes):
+    return script_3(num_clientes, "3a-recursosv2.py")
+
+
+def banco(script, motor):
+    parametros = BANCO[script]
+
+    def preparar(num_clientes):
+        def correr():
+            if motor == "vectorizado":
+                entre_llegadas, servicios = generar_entradas_por_clientes(parametros["tasa_llegadas"], parametros["tasa_servicio"], num_clientes, SEMILLA)
+                r = simular_fifo(entre_llegadas, servicios, parametros["num_servidores"])
+            else:
+                horizonte = num_clientes / parametros["tasa_llegadas"]
+                r = MOTORES[motor](tiempo_llegada_maxima=horizonte, semilla=SEMILLA, **parametros).ejecutar()
+            return r.clientes_atendidos, 3 * r.clientes_atendidos
+        return correr
+    return preparar
+
+
+CASOS = {
+    "1:simpy": script_1,
+    "2:simpy": script_2,
+    "3:simpy": script_3,
+    "3a:simpy": script_3a,
+    "4:simpy": banco("4", "simpy"),
+    "4:eventos": banco("4", "eventos"),
+    "4:vectorizado": banco("4", "vectorizado"),
+    "5:simpy": banco("5", "simpy"),
+    "5:eventos": banco("5", "eventos"),
+    "5:vectorizado": banco("5", "vectorizado"),
+    "6:simpy": banco("6", "simpy"),
+    "6:eventos": banco("6", "eventos"),
+}
+
+
+# ---------------------------
+# Medición dentro del proceso hijo
+# ---------------------------
+def medir_en_hijo(caso, num_clientes, con_tracemalloc):
+    rss_inicial = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    with open(os.devnull, "w") as nulo, contextlib.redirect_stdout(nulo):
+        correr = CASOS[caso](num_clientes)
+        if con_tracemalloc:
+            tracemalloc.start()
+        inicio = time.perf_counter()
+        clientes, eventos = correr()
+        duracion = time.perf_counter() - inicio
+        pico = tracemalloc.get_traced_memory()[1] if con_tracemalloc else None
+    return {
+        "clientes": clientes,
+        "eventos": eventos,
+        "duracion": duracion,
+        "rss_inicial": rss_inicial,
+        "rss_pico": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+        "tracemalloc_pico": pico,
+    }
+
+
+def ejecutar_hijo(caso, num_clientes, con_tracemalloc=False):
+    comando = [sys.executable, "-m", "benchmarks.suite", "--hijo", caso, str(num_clientes)]
+    if con_tracemalloc:
+        comando.append("--tracemalloc")
+    salida = subprocess.run(comando, capture_output=True, text=True, check=True)
+    return json.loads(salida.stdout.strip().splitlines()[-1])
+
+
+def medir(caso, num_clientes):
+    r = ejecutar_hijo(caso, num_clientes)
+    fila = {
+        "caso": caso,
+        "clientes_pedidos": num_clientes,
+        "clientes": r["clientes"],
+        "eventos": r["eventos"],
+        "duracion": r["duracion"],
+        "eventos_por_segundo": r["eventos"] / r["duracion"] if r["duracion"] > 0 else None,
+        "rss_inicial": r["rss_inicial"],
+        "rss_pico": r["rss_pico"],
+        "bytes_por_cliente": None,
+    }
+    if num_clientes <= MAXIMO_TRACEMALLOC:
+        t = ejecutar_hijo(caso, num_clientes, con_tracemalloc=True)
+        fila["bytes_por_cliente"] = t["tracemalloc_pico"] / max(t["clientes"], 1)
+    return fila
+
+
+# ---------------------------
+# Metadatos y comparación entre commits
+# ---------------------------
+def metadatos():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "numpy": numpy.__version__,
+        "simpy": getattr(simpy, "__version__", None),
+    }
+
+
+def comparar(filas, ruta_anterior):
+    with open(ruta_anterior) as archivo:
+        anterior = {(f["caso"], f["clientes_pedidos"]): f for f in json.load(archivo)["resultados"]}
+    print(f"\n--- Comparación con {ruta_anterior} (eventos/s actual / anterior) ---")
+    for f in filas:
+        a = anterior.get((f["caso"], f["clientes_pedidos"]))
+        if a and a["eventos_por_segundo"] and f["eventos_por_segundo"]:
+            print(f"{f['caso']:<16}{f['clientes_pedidos']:>10}{f['eventos_por_segundo'] / a['eventos_por_segundo']:10.2f}x")
+
+
+def imprimir(filas):
+    print(f"\n{'Caso':<16}{'Clientes':>10}{'Tiempo (s)':>12}{'Eventos/s':>14}{'RSS pico (MB)':>15}{'B/cliente':>11}")
+    for f in filas:
+        por_cliente = f"{f['bytes_por_cliente']:11.0f}" if f["bytes_por_cliente"] is not None else f"{'-':>11}"
+        print(f"{f['caso']:<16}{f['clientes']:>10}{f['duracion']:12.3f}{f['eventos_por_segundo']:14.0f}{f['rss_pico'] / 2**20:15.1f}{por_cliente}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Suite de rendimiento de los ejemplos y motores de simulación")
+    parser.add_argument("--clientes", nargs="+", type=float, default=CLIENTES, help="números de clientes (por ejemplo 1e3 1e6)")
+    parser.add_argument("--casos", nargs="+", default=list(CASOS), choices=list(CASOS), metavar="CASO", help=f"casos a medir: {', '.join(CASOS)}")
+    parser.add_argument("--salida", default=ARCHIVO_RESULTADOS, help="archivo JSON de resultados")
+    parser.add_argument("--comparar", help="JSON de una corrida anterior para comparar eventos/s")
+    parser.add_argument("--hijo", nargs=2, metavar=("CASO", "CLIENTES"), help=argparse.SUPPRESS)
+    parser.add_argument("--tracemalloc", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.hijo:
+        caso, num_clientes = args.hijo
+        print(json.dumps(medir_en_hijo(caso, int(num_clientes), args.tracemalloc)))
+        return
+
+    filas = []
+    for num_clientes in (int(n) for n in args.clientes):
+        for caso in args.casos:
+            filas.append(medir(caso, num_clientes))
+            print(f"{caso} con {num_clientes} clientes: {filas[-1]['duracion']:.3f} s", file=sys.stderr)
+
+    with open(args.salida, "w") as archivo:
+        json.dump({"metadatos": metadatos(), "resultados": filas}, archivo, indent=2)
+
+    imprimir(filas)
+    print(f"\nResultados escritos en {args.salida}")
+    if args.comparar:
+        comparar(filas, args.comparar)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Comparación de una sola cola (script 5) contra colas individuales (script 6) con números
+aleatorios comunes.
+
+Para decidir entre las dos configuraciones interesa la diferencia de Wq, W, L, ... entre ellas, no
+cada valor por separado. Con replicaciones independientes la varianza de la diferencia es la suma de
+las dos varianzas y se necesitan muchas replicaciones para distinguirlas.
+
+Aquí cada replicación genera una vez los tiempos entre llegadas y de servicio
+(motor_vectorizado.generar_entradas) y alimenta con ellos a los dos modelos. El tiempo de servicio
+queda ligado al cliente (tiempos_servicio[i - 1] es el del cliente i), no al orden en que se sortea,
+así que el cliente i trae el mismo trabajo en las dos configuraciones aunque lo atiendan en otro
+orden. Las dos corridas quedan correlacionadas positivamente y la diferencia por pares
+d_i = cola_unica_i - colas_individuales_i tiene mucha menos varianza.
+
+Se reporta el intervalo de confianza de la diferencia por pares y, como referencia, el semiancho que
+se obtendría comparando dos muestras independientes del mismo tamaño.
+"""
+
+import math
+import os
+import time
+from dataclasses import dataclass
+
+from estadisticas import ResumenMetrica, resumir_muestra, t_critico
+from motor_vectorizado import generar_entradas
+from replicaciones import METRICAS, MOTORES, ejecutar_tareas, generar_semillas
+
+# Configuración (mismos valores que los scripts 5 y 6)
+TIEMPO_LLEGADA_MAXIMA = 480
+LAMBDA = 1
+MU = 0.25
+NUM_SERVIDORES = 5
+NUM_REPLICACIONES = 50
+SEMILLA_MAESTRA = 2025
+CONFIANZA = 0.95
+
+
+# ---------------------------
+# Diferencia por pares de una métrica
+# ---------------------------
+@dataclass
+class ComparacionMetrica:
+    cola_unica: ResumenMetrica
+    colas_individuales: ResumenMetrica
+    diferencia: ResumenMetrica          # cola_unica - colas_individuales, por pares
+    semiancho_independiente: float      # Semiancho si las dos muestras fueran independientes
+
+    @property
+    def significativa(self):
+        return self.diferencia.inferior > 0 or self.diferencia.superior < 0
+
+    @property
+    def reduccion_varianza(self):
+        # Var(d) / (Var(X) + Var(Y)): 1 sin correlación, cerca de 0 con correlación fuerte
+        independiente = self.cola_unica.varianza + self.colas_individuales.varianza
+        return self.diferencia.varianza / independiente if independiente > 0 else float("nan")
+
+
+# ---------------------------
+# Un par de corridas con las mismas entradas (se ejecuta en un proceso del pool)
+# ---------------------------
+def ejecutar_par(tarea):
+    parametros, semilla = tarea
+    parametros = dict(parametros)
+    clase = MOTORES[parametros.pop("motor", "simpy")]
+
+    entre_llegadas, servicios = generar_entradas(parametros["tasa_llegadas"], parametros["tasa_servicio"], parametros["tiempo_llegada_maxima"], semilla)
+    # La semilla del modelo solo se usa en políticas de despacho aleatorias
+    return tuple(
+        clase(semilla=semilla, colas_individuales=colas_individuales, tiempos_entre_llegadas=entre_llegadas, tiempos_servicio=servicios, **parametros).ejecutar()
+        for colas_individuales in (False, True)
+    )
+
+
+def comparar(num_replicaciones=NUM_REPLICACIONES, semilla_maestra=SEMILLA_MAESTRA, procesos=None, confianza=CONFIANZA, metricas=METRICAS, **parametros):
+    semillas = generar_semillas(num_replicaciones, semilla_maestra)
+    pares = ejecutar_tareas([(parametros, semilla) for semilla in semillas], procesos, funcion=ejecutar_par)
+
+    comparacion = {}
+    for metrica in metricas:
+        unica = [getattr(a, metrica) for a, _ in pares]
+        individuales = [getattr(b, metrica) for _, b in pares]
+        resumen_unica = resumir_muestra(unica, confianza)
+        resumen_individuales = resumir_muestra(individuales, confianza)
+        n = len(pares)
+        comparacion[metrica] = ComparacionMetrica(
+            cola_unica=resumen_unica,
+            colas_individuales=resumen_individuales,
+            diferencia=resumir_muestra([a - b for a, b in zip(unica, individuales)], confianza),
+            semiancho_independiente=t_critico(confianza, 2 * n - 2) * math.sqrt((resumen_unica.varianza + resumen_individuales.varianza) / n),
+        )
+    return comparacion
+
+
+def imprimir_comparacion(comparacion, confianza=CONFIANZA):
+    n = next(iter(comparacion.values())).diferencia.n
+    print(f"\n--- Cola única - colas individuales: {n} pares con números aleatorios comunes (IC {confianza:.0%}) ---")
+    print(f"{'Métrica':<12}{'Única':>10}{'Indiv.':>10}{'Diferencia':>12}{'Semiancho':>11}{'Sin CRN':>10}{'Var(d)/suma':>13}  Significativa")
+    for metrica, c in comparacion.items():
+        print(f"{metrica:<12}{c.cola_unica.media:10.4f}{c.colas_individuales.media:10.4f}{c.diferencia.media:12.4f}{c.diferencia.semiancho:11.4f}{c.semiancho_independiente:10.4f}{c.reduccion_varianza:13.3f}  {'sí' if c.significativa else 'no'}")
+
+
+def main():
+    procesos = os.cpu_count()
+    inicio = time.perf_counter()
+    comparacion = comparar(NUM_REPLICACIONES, SEMILLA_MAESTRA, procesos, tasa_llegadas=LAMBDA, tasa_servicio=MU, num_servidores=NUM_SERVIDORES, tiempo_llegada_maxima=TIEMPO_LLEGADA_MAXIMA)
+    duracion = time.perf_counter() - inicio
+
+    imprimir_comparacion(comparacion)
+    print(f"\n{NUM_REPLICACIONES} pares en {duracion:.2f} s con {procesos} procesos (semilla maestra {SEMILLA_MAESTRA})")
+
+
+if __name__ == '__main__':
+    main()
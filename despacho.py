@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Políticas de despacho para el modelo con una cola por cajero (script 6).
+
+El script 6 elegía el cajero con min(servers, key=lambda s: len(s.queue)), que recorre todos los
+cajeros en cada llegada: O(n) por cliente. Con miles de agentes (centros de llamadas) ese recorrido
+domina la simulación.
+
+Cada política lleva la carga de cada cajero (clientes en su cola + el que está atendiendo) y se
+actualiza con asignar(i) cuando un cliente se une al cajero i y con liberar(i) cuando sale. Políticas:
+
+  - "cola_mas_corta": heap de (carga, cajero) con entradas obsoletas que se descartan al consultarlo;
+    elegir, asignar y liberar cuestan O(log n). Empates: el cajero de menor índice.
+  - "aleatoria": un cajero al azar, O(1).
+  - "dos_opciones": el de menor carga entre dos cajeros al azar (power of two choices), O(1).
+  - "round_robin": los cajeros en orden circular, O(1).
+  - "cola_mas_corta_lineal": mismo criterio que "cola_mas_corta" con un recorrido O(n); sirve de
+    referencia para comparar.
+
+A diferencia del script 6 original, la carga incluye al cliente en servicio: un cajero libre se
+prefiere a uno ocupado con la cola vacía.
+
+python despacho.py compara las políticas con miles de cajeros usando motor_eventos.
+"""
+
+import heapq
+import time
+
+# Configuración de la comparación
+NUM_CAJEROS = 2000
+MU = 0.25
+UTILIZACION = 0.9
+TIEMPO_LLEGADA_MAXIMA = 200
+SEMILLA = 2025
+
+
+# ---------------------------
+# Cola más corta con heap indexado
+# ---------------------------
+class ColaMasCorta:
+    usa_aleatorios = False
+
+    def __init__(self, num_cajeros, rng=None):
+        self.carga = [0] * num_cajeros
+        self.heap = [(0, i) for i in range(num_cajeros)]
+
+    def elegir(self):
+        heap = self.heap
+        carga = self.carga
+        # Descartar entradas obsoletas (la carga del cajero cambió después de agregarlas)
+        while heap[0][0] != carga[heap[0][1]]:
+            heapq.heappop(heap)
+        return heap[0][1]
+
+    def actualizar(self, cajero, cambio):
+        self.carga[cajero] += cambio
+        heapq.heappush(self.heap, (self.carga[cajero], cajero))
+        # Reconstruir si las entradas obsoletas crecen demasiado
+        if len(self.heap) > 4 * len(self.carga):
+            self.heap = [(c, i) for i, c in enumerate(self.carga)]
+            heapq.heapify(self.heap)
+
+    def asignar(self, cajero):
+        self.actualizar(cajero, 1)
+
+    def liberar(self, cajero):
+        self.actualizar(cajero, -1)
+
+
+# ---------------------------
+# Políticas O(1)
+# ---------------------------
+class PoliticaSimple:
+    usa_aleatorios = False
+
+    def __init__(self, num_cajeros, rng=None):
+        self.num_cajeros = num_cajeros
+        self.carga = [0] * num_cajeros
+        self.rng = rng
+
+    def asignar(self, cajero):
+        self.carga[cajero] += 1
+
+    def liberar(self, cajero):
+        self.carga[cajero] -= 1
+
+
+class Aleatoria(PoliticaSimple):
+    usa_aleatorios = True
+
+    def elegir(self):
+        return self.rng.randrange(self.num_cajeros)
+
+
+class DosOpciones(PoliticaSimple):
+    usa_aleatorios = True
+
+    def elegir(self):
+        a = self.rng.randrange(self.num_cajeros)
+        b = self.rng.randrange(self.num_cajeros)
+        return a if self.carga[a] <= self.carga[b] else b
+
+
+class RoundRobin(PoliticaSimple):
+
+    def __init__(self, num_cajeros, rng=None):
+        super().__init__(num_cajeros, rng)
+        self.siguiente = 0
+
+    def elegir(self):
+        cajero = self.siguiente
+        self.siguiente = (cajero + 1) % self.num_cajeros
+        return cajero
+
+
+class ColaMasCortaLineal(PoliticaSimple):
+
+    def elegir(self):
+        carga = self.carga
+        return min(range(self.num_cajeros), key=carga.__getitem__)
+
+
+POLITICAS = {
+    "cola_mas_corta": ColaMasCorta,
+    "aleatoria": Aleatoria,
+    "dos_opciones": DosOpciones,
+    "round_robin": RoundRobin,
+    "cola_mas_corta_lineal": ColaMasCortaLineal,
+}
+
+
+# ---------------------------
+# Creación de la política
+# ---------------------------
+# Las políticas aleatorias usan su propio generador, sembrado desde el del modelo, para no alterar
+# la secuencia de tiempos de llegada y de servicio.
+def crear_despacho(politica, num_cajeros, rng):
+    if politica not in POLITICAS:
+        raise ValueError(f"Política de despacho desconocida: {politica!r} (opciones: {', '.join(POLITICAS)})")
+    clase = POLITICAS[politica]
+    if clase.usa_aleatorios:
+        return clase(num_cajeros, type(rng)(rng.getrandbits(64)))
+    return clase(num_cajeros)
+
+
+def main():
+    from motor_eventos import MotorEventosBanco
+
+    tasa_llegadas = UTILIZACION * NUM_CAJEROS * MU
+    print(f"\n--- Despacho con {NUM_CAJEROS} cajeros (rho={UTILIZACION}) ---")
+    print(f"{'Política':<24}{'Wq':>10}{'W':>10}{'L_q':>10}{'Tiempo (s)':>12}{'us/cliente':>12}")
+    for politica in POLITICAS:
+        inicio = time.perf_counter()
+        r = MotorEventosBanco(tasa_llegadas, MU, NUM_CAJEROS, TIEMPO_LLEGADA_MAXIMA, semilla=SEMILLA, colas_individuales=True, politica_despacho=politica).ejecutar()
+        duracion = time.perf_counter() - inicio
+        print(f"{politica:<24}{r.Wq:10.4f}{r.W:10.4f}{r.L_q:10.4f}{duracion:12.2f}{duracion / r.clientes_atendidos * 1e6:12.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Número mínimo de cajeros que cumple un objetivo de espera (modelo del script 5, una sola cola).
+
+En lugar de editar NUM_SERVIDORES a mano hasta cumplir el objetivo, dotacion_minima():
+
+  1. Acota la respuesta con las fórmulas del M/M/c (analitico.py): el menor c cuyo valor analítico
+     cumple el objetivo. Con un perfil de llegadas que cambia en la jornada, el intervalo va del c de
+     la tasa media al c de la tasa máxima.
+  2. Simula los valores de c alrededor de esa cota (VECINOS a cada lado) en paralelo, como celdas de
+     barrido_parametros.py, así que las evaluaciones quedan en la misma caché en disco y no se
+     repiten entre búsquedas.
+  3. Mueve la ventana hacia abajo o hacia arriba hasta encontrar el menor c que cumple y cuyo vecino
+     inferior no cumple.
+
+Objetivos:
+  - "Wq": espera promedio en cola <= objetivo.
+  - "espera_mayor": fracción de clientes que esperan más de umbral_espera <= objetivo.
+
+Un valor de c cumple si el límite superior del intervalo de confianza de la métrica queda bajo el
+objetivo, es decir, cumple con la confianza pedida.
+"""
+
+import math
+from dataclasses import dataclass, field
+
+from analitico import mmc, prob_espera_mayor
+from barrido_parametros import CARPETA_CACHE, ejecutar_celdas
+from estadisticas import ResumenMetrica
+from modelo_banco import VERSION_MODELO
+from perfil_llegadas import PerfilLlegadas
+from replicaciones import resumir
+
+# Configuración (mismos valores que el script 5)
+TIEMPO_LLEGADA_MAXIMA = 480
+LAMBDA = 1
+MU = 0.25
+REPLICACIONES = 50
+SEMILLA = 2025
+CONFIANZA = 0.95
+VECINOS = 1
+MAXIMO_SERVIDORES = 100_000
+
+# Perfil de llegadas de una jornada de 480 minutos: mañana tranquila, hora pico al mediodía
+PERFIL_JORNADA = [(0, 0.6), (120, 1.4), (240, 1.0), (360, 0.8)]
+
+# Métrica de ResultadosSimulacion que se compara con el objetivo
+OBJETIVOS = {"Wq": "Wq", "espera_mayor": "fraccion_espera_mayor"}
+
+
+@dataclass
+class Dotacion:
+    num_servidores: int                     # Menor c que cumple el objetivo
+    resumen: ResumenMetrica                 # Intervalo de confianza de la métrica con ese c
+    evaluaciones: dict = field(default_factory=dict)   # {c: ResumenMetrica} de todos los c simulados
+
+
+# ---------------------------
+# Cota analítica
+# ---------------------------
+def valor_analitico(objetivo, tasa_llegadas, tasa_servicio, num_servidores, umbral_espera=None):
+    if objetivo == "Wq":
+        return mmc(tasa_llegadas, tasa_servicio, num_servidores).Wq
+    return prob_espera_mayor(tasa_llegadas, tasa_servicio, num_servidores, umbral_espera)
+
+
+def dotacion_analitica(objetivo, valor_objetivo, tasa_llegadas, tasa_servicio, umbral_espera=None):
+    # Se empieza en el menor c estable
+    c = max(1, math.floor(tasa_llegadas / tasa_servicio) + 1)
+    while valor_analitico(objetivo, tasa_llegadas, tasa_servicio, c, umbral_espera) > valor_objetivo:
+        c += 1
+        if c > MAXIMO_SERVIDORES:
+            raise ValueError(f"Ningún número de cajeros hasta {MAXIMO_SERVIDORES} cumple el objetivo")
+    return c
+
+
+def cota_analitica(objetivo, valor_objetivo, tasa_llegadas, tasa_servicio, tiempo_llegada_maxima, perfil_llegadas=None, umbral_espera=None):
+    if perfil_llegadas is None:
+        c = dotacion_analitica(objetivo, valor_objetivo, tasa_llegadas, tasa_servicio, umbral_espera)
+        return c, c
+    bajo = dotacion_analitica(objetivo, valor_objetivo, perfil_llegadas.tasa_media(tiempo_llegada_maxima), tasa_servicio, umbral_espera)
+    alto = dotacion_analitica(objetivo, valor_objetivo, perfil_llegadas.tasa_maxima(tiempo_llegada_maxima), tasa_servicio, umbral_espera)
+    return bajo, alto
+
+
+# ---------------------------
+# Búsqueda con simulación
+# ---------------------------
+def celda_dotacion(num_servidores, tasa_llegadas, tasa_servicio, tiempo_llegada_maxima, replicaciones, semilla, perfil_llegadas=None, umbral_espera=None):
+    # Mismo formato que las celdas de barrido_parametros.py (misma caché)
+    celda = {
+        "variante": "cola_unica",
+        "tasa_llegadas": float(tasa_llegadas),
+        "tasa_servicio": float(tasa_servicio),
+        "num_servidores": int(num_servidores),
+        "tiempo_llegada_maxima": float(tiempo_llegada_maxima),
+        "replicaciones": int(replicaciones),
+        "semilla": semilla,
+        "variables": "numpy",
+        "version_modelo": VERSION_MODELO,
+    }
+    if perfil_llegadas is not None:
+        celda["perfil_llegadas"] = perfil_llegadas.como_dict()
+    if umbral_espera is not None:
+        celda["umbral_espera"] = float(umbral_espera)
+    return celda
+
+
+def dotacion_minima(objetivo, valor_objetivo, tasa_llegadas, tasa_servicio, tiempo_llegada_maxima=TIEMPO_LLEGADA_MAXIMA, perfil_llegadas=None, umbral_espera=None, replicaciones=REPLICACIONES, semilla=SEMILLA, confianza=CONFIANZA, vecinos=VECINOS, procesos=None, carpeta=CARPETA_CACHE):
+    if objetivo not in OBJETIVOS:
+        raise ValueError(f"Objetivo desconocido: {objetivo!r} (opciones: {', '.join(OBJETIVOS)})")
+    if objetivo == "espera_mayor" and umbral_espera is None:
+        raise ValueError("El objetivo 'espera_mayor' necesita umbral_espera")
+    if isinstance(perfil_llegadas, (list, tuple)):
+        perfil_llegadas = PerfilLlegadas(perfil_llegadas)
+    if perfil_llegadas is not None:
+        tasa_llegadas = perfil_llegadas.tasa_media(tiempo_llegada_maxima)
+    metrica = OBJETIVOS[objetivo]
+
+    bajo, alto = cota_analitica(objetivo, valor_objetivo, tasa_llegadas, tasa_servicio, tiempo_llegada_maxima, perfil_llegadas, umbral_espera)
+    bajo, alto = max(1, bajo - vecinos), alto + vecinos
+    ancho = alto - bajo + 1
+
+    evaluaciones = {}
+    while True:
+        # Los c de la ventana que faltan se simulan juntos en un solo pool
+        pendientes = [c for c in range(bajo, alto + 1) if c not in evaluaciones]
+        lista = [celda_dotacion(c, tasa_llegadas, tasa_servicio, tiempo_llegada_maxima, replicaciones, semilla, perfil_llegadas, umbral_espera) for c in pendientes]
+        filas, _ = ejecutar_celdas(lista, procesos, carpeta)
+        for celda, resultados in filas:
+            evaluaciones[celda["num_servidores"]] = resumir(resultados, confianza, (metrica,))[metrica]
+
+        cumplen = [c for c in sorted(evaluaciones) if evaluaciones[c].superior <= valor_objetivo]
+        if not cumplen:
+            # Ninguno cumple: la ventana sube
+            if alto >= MAXIMO_SERVIDORES:
+                raise ValueError(f"Ningún número de cajeros hasta {MAXIMO_SERVIDORES} cumple el objetivo")
+            bajo, alto = alto + 1, alto + ancho
+            continue
+
+        c = cumplen[0]
+        if c > 1 and c - 1 not in evaluaciones:
+            # El menor que cumple está en el borde inferior: la ventana baja
+            bajo, alto = max(1, c - ancho), c - 1
+            continue
+        return Dotacion(num_servidores=c, resumen=evaluaciones[c], evaluaciones=dict(sorted(evaluaciones.items())))
+
+
+def imprimir_dotacion(titulo, dotacion, valor_objetivo, confianza=CONFIANZA):
+    print(f"\n--- {titulo} ---")
+    print(f"{'Cajeros':>8}{'Media':>10}{'Inferior':>10}{'Superior':>10}  Cumple (IC {confianza:.0%})")
+    for c, r in dotacion.evaluaciones.items():
+        print(f"{c:8d}{r.media:10.4f}{r.inferior:10.4f}{r.superior:10.4f}  {'sí' if r.superior <= valor_objetivo else 'no'}")
+    print(f"Mínimo número de cajeros: {dotacion.num_servidores}")
+
+
+def main():
+    objetivo_wq = 1.0
+    dotacion = dotacion_minima("Wq", objetivo_wq, LAMBDA, MU)
+    imprimir_dotacion(f"Wq <= {objetivo_wq} con LAMBDA={LAMBDA}, MU={MU}", dotacion, objetivo_wq)
+
+    umbral, fraccion = 5.0, 0.10
+    dotacion = dotacion_minima("espera_mayor", fraccion, LAMBDA, MU, perfil_llegadas=PERFIL_JORNADA, umbral_espera=umbral)
+    imprimir_dotacion(f"P(espera > {umbral}) <= {fraccion} con el perfil de la jornada {PERFIL_JORNADA}", dotacion, fraccion)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,404 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Herramientas estadísticas para analizar los resultados de la simulación.
+
+- t_critico: valor crítico de la distribución t de Student (sin depender de scipy).
+- resumir_muestra: media, varianza e intervalo de confianza de una muestra de replicaciones.
+- AcumuladorWelford, CuantilP2 y ResumenStreaming: estadísticas en memoria constante para
+  observaciones que llegan una por una (tiempos de espera y en el sistema de cada cliente).
+- HistogramaTiempo: distribución ponderada por tiempo P(N = k) de un conteo (clientes en cola,
+  cajeros ocupados) en un arreglo denso que crece según se necesite; prob_mayor() da P(N > k).
+- AreasPorIntervalo: área bajo la curva de una o más series (clientes en cola, en el sistema)
+  separada en intervalos de tiempo de ancho fijo.
+- MetricasPorFranja: clientes en cola y en el sistema, llegadas y esperas por franja de tiempo
+  (por ejemplo, cada 15 minutos de la jornada), acumuladas durante la simulación.
+- SerieMSER5: truncamiento del periodo de calentamiento con MSER-5 e intervalo de confianza por
+  medias de lotes para una sola corrida larga.
+"""
+
+import math
+from array import array
+from dataclasses import dataclass
+from statistics import NormalDist
+
+import numpy as np
+
+
+# ---------------------------
+# Valor crítico de la t de Student
+# ---------------------------
+# Para 1 y 2 grados de libertad se usan las fórmulas exactas; para más grados de libertad, la
+# expansión de Cornish-Fisher alrededor del cuantil normal (Abramowitz y Stegun 26.7.5). Con 95%
+# de confianza el error es menor a 0.005 desde 3 grados de libertad.
+def t_critico(confianza, grados_libertad):
+    p = 1 - (1 - confianza) / 2
+    if grados_libertad == 1:
+        return math.tan(math.pi * (p - 0.5))
+    if grados_libertad == 2:
+        return (2 * p - 1) / math.sqrt(2 * p * (1 - p))
+
+    z = NormalDist().inv_cdf(p)
+    v = grados_libertad
+    g1 = (z**3 + z) / 4
+    g2 = (5 * z**5 + 16 * z**3 + 3 * z) / 96
+    g3 = (3 * z**7 + 19 * z**5 + 17 * z**3 - 15 * z) / 384
+    g4 = (79 * z**9 + 776 * z**7 + 1482 * z**5 - 1920 * z**3 - 945 * z) / 92160
+    return z + g1 / v + g2 / v**2 + g3 / v**3 + g4 / v**4
+
+
+# ---------------------------
+# Resumen de una muestra: media, varianza e intervalo de confianza
+# ---------------------------
+@dataclass
+class ResumenMetrica:
+    media: float
+    varianza: float
+    semiancho: float            # Mitad del ancho del intervalo de confianza
+    inferior: float
+    superior: float
+    n: int
+
+    @property
+    def semiancho_relativo(self):
+        return self.semiancho / abs(self.media) if self.media else math.inf
+
+
+def resumir_muestra(valores, confianza=0.95):
+    n = len(valores)
+    media = sum(valores) / n
+    if n < 2:
+        return ResumenMetrica(media, math.nan, math.inf, -math.inf, math.inf, n)
+
+    varianza = sum((x - media) ** 2 for x in valores) / (n - 1)
+    semiancho = t_critico(confianza, n - 1) * math.sqrt(varianza / n)
+    return ResumenMetrica(media, varianza, semiancho, media - semiancho, media + semiancho, n)
+
+
+# ---------------------------
+# Media y varianza en una pasada (algoritmo de Welford)
+# ---------------------------
+# Numéricamente estable aunque la media sea grande frente a la varianza, y sin guardar las
+# observaciones.
+class AcumuladorWelford:
+    __slots__ = ("n", "media", "m2", "minimo", "maximo")
+
+    def __init__(self):
+        self.n = 0
+        self.media = 0.0
+        self.m2 = 0.0
+        self.minimo = math.inf
+        self.maximo = -math.inf
+
+    def agregar(self, x):
+        self.n += 1
+        delta = x - self.media
+        self.media += delta / self.n
+        self.m2 += delta * (x - self.media)
+        if x < self.minimo:
+            self.minimo = x
+        if x > self.maximo:
+            self.maximo = x
+
+    @property
+    def varianza(self):
+        return self.m2 / (self.n - 1) if self.n > 1 else math.nan
+
+    @property
+    def desviacion(self):
+        return math.sqrt(self.varianza)
+
+
+# ---------------------------
+# Cuantil en una pasada (algoritmo P² de Jain y Chlamtac)
+# ---------------------------
+# Mantiene 5 marcadores (mínimo, p/2, p, (1+p)/2 y máximo) cuyas alturas se ajustan con una
+# interpolación parabólica a medida que llegan observaciones. Usa memoria constante.
+class CuantilP2:
+    __slots__ = ("p", "q", "n", "deseadas", "incrementos", "iniciales", "extra")
+
+    def __init__(self, p):
+        self.p = p
+        self.q = []
+        self.n = [0, 1, 2, 3, 4]
+        self.deseadas = [0.0, 2 * p, 4 * p, 2 + 2 * p, 4.0]
+        self.incrementos = [0.0, p / 2, p, (1 + p) / 2, 1.0]
+        self.iniciales = []
+        # Observaciones después de las 5 iniciales: posición deseada = deseadas[i] + extra * incrementos[i]
+        self.extra = 0
+
+    def agregar(self, x):
+        # Las primeras 5 observaciones inicializan los marcadores
+        if self.iniciales is not None:
+            self.iniciales.append(x)
+            if len(self.iniciales) == 5:
+                self.q = sorted(self.iniciales)
+                self.iniciales = None
+            return
+
+        q = self.q
+        n = self.n
+
+        # Celda k donde cae x (y ajuste de los extremos)
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x < q[1]:
+            k = 0
+        elif x < q[2]:
+            k = 1
+        elif x < q[3]:
+            k = 2
+        elif x <= q[4]:
+            k = 3
+        else:
+            q[4] = x
+            k = 3
+
+        for i in range(k + 1, 5):
+            n[i] += 1
+        self.extra += 1
+        extra = self.extra
+        deseadas = self.deseadas
+        incrementos = self.incrementos
+
+        # Ajuste de los marcadores intermedios
+        for i in (1, 2, 3):
+            d = deseadas[i] + extra * incrementos[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                qp = q[i] + d / (n[i + 1] - n[i - 1]) * ((n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i]) + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1]))
+                if not q[i - 1] < qp < q[i + 1]:
+                    # Si la parábola sale del intervalo, interpolación lineal
+                    qp = q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                q[i] = qp
+                n[i] += d
+
+    @property
+    def valor(self):
+        if self.iniciales is None:
+            return self.q[2]
+        if not self.iniciales:
+            return math.nan
+        # Con menos de 5 observaciones, el cuantil exacto de la muestra
+        ordenados = sorted(self.iniciales)
+        return ordenados[min(len(ordenados) - 1, int(self.p * len(ordenados)))]
+
+
+# ---------------------------
+# Resumen en memoria constante: media, varianza y cuantiles
+# ---------------------------
+CUANTILES = (0.5, 0.95, 0.99)
+
+
+class ResumenStreaming:
+
+    def __init__(self, cuantiles=CUANTILES):
+        self.momentos = AcumuladorWelford()
+        self.cuantiles = {p: CuantilP2(p) for p in cuantiles}
+
+    def agregar(self, x):
+        self.momentos.agregar(x)
+        for cuantil in self.cuantiles.values():
+            cuantil.agregar(x)
+
+    def cuantil(self, p):
+        # NaN si el cuantil p no se está estimando
+        return self.cuantiles[p].valor if p in self.cuantiles else math.nan
+
+    @property
+    def n(self):
+        return self.momentos.n
+
+    @property
+    def media(self):
+        return self.momentos.media
+
+    @property
+    def varianza(self):
+        return self.momentos.varianza
+
+
+# ---------------------------
+# Distribución ponderada por tiempo de un conteo
+# ---------------------------
+# tiempos[k] es el tiempo total que el conteo valió k. La memoria es proporcional al máximo
+# observado, no al número de eventos.
+class HistogramaTiempo:
+    __slots__ = ("tiempos",)
+
+    def __init__(self, tamano=1):
+        self.tiempos = [0.0] * tamano
+
+    def agregar(self, k, delta_tiempo):
+        tiempos = self.tiempos
+        if k >= len(tiempos):
+            tiempos.extend([0.0] * (k + 1 - len(tiempos)))
+        tiempos[k] += delta_tiempo
+
+    def probabilidades(self):
+        total = sum(self.tiempos)
+        if total <= 0:
+            return ()
+        return tuple(t / total for t in self.tiempos)
+
+
+def prob_mayor(probabilidades, k):
+    # P(N > k) a partir de (P(N = 0), P(N = 1), ...)
+    return math.fsum(probabilidades[k + 1:])
+
+
+def media_distribucion(probabilidades):
+    return math.fsum(k * p for k, p in enumerate(probabilidades))
+
+
+# ---------------------------
+# Áreas bajo la curva por intervalo de tiempo
+# ---------------------------
+# agregar(t0, t1, v1, v2, ...) suma v_i * (tiempo de traslape) en cada intervalo [k*ancho, (k+1)*ancho)
+# que cubre [t0, t1]. Los valores son constantes entre dos eventos, igual que en actualizar_estadisticas.
+class AreasPorIntervalo:
+
+    def __init__(self, ancho, num_series=1):
+        self.ancho = ancho
+        self.series = [array("d") for _ in range(num_series)]
+
+    def agregar(self, t0, t1, *valores):
+        ancho = self.ancho
+        series = self.series
+        while t0 < t1:
+            k = int(t0 // ancho)
+            fin = min(t1, (k + 1) * ancho)
+            # Crecer las series hasta el intervalo k
+            while len(series[0]) <= k:
+                for serie in series:
+                    serie.append(0.0)
+            for serie, valor in zip(series, valores):
+                serie[k] += valor * (fin - t0)
+            t0 = fin
+
+    def promedios(self, serie=0, completos_hasta=None):
+        # Promedio en el tiempo de cada intervalo; con completos_hasta se omiten los intervalos que
+        # terminan después de ese instante (el último suele estar incompleto)
+        areas = np.frombuffer(self.series[serie], dtype=np.float64) / self.ancho
+        if completos_hasta is not None:
+            areas = areas[:int(completos_hasta // self.ancho)]
+        return areas
+
+
+# ---------------------------
+# Métricas por franja de tiempo
+# ---------------------------
+@dataclass
+class FilaFranja:
+    inicio: float
+    fin: float
+    L_q: float              # Promedio en el tiempo de clientes en cola dentro de la franja
+    L: float                # Promedio en el tiempo de clientes en el sistema dentro de la franja
+    clientes: int           # Clientes atendidos que llegaron en la franja
+    Wq: float               # Espera promedio en cola de esos clientes
+    W: float                # Tiempo promedio en el sistema de esos clientes
+    Wq_maximo: float
+
+
+# Las áreas se reparten entre las franjas que cubre cada intervalo entre eventos; las esperas se
+# asignan a la franja en que llegó el cliente.
+class MetricasPorFranja:
+
+    def __init__(self, ancho):
+        self.ancho = ancho
+        self.areas = AreasPorIntervalo(ancho, 2)
+        self.esperas = []
+        self.tiempos_sistema = []
+
+    def agregar_area(self, t0, t1, clientes_cola, clientes_sistema):
+        self.areas.agregar(t0, t1, clientes_cola, clientes_sistema)
+
+    def agregar_cliente(self, tiempo_llegada, tiempo_en_cola, tiempo_total):
+        k = int(tiempo_llegada // self.ancho)
+        while len(self.esperas) <= k:
+            self.esperas.append(AcumuladorWelford())
+            self.tiempos_sistema.append(AcumuladorWelford())
+        self.esperas[k].agregar(tiempo_en_cola)
+        self.tiempos_sistema[k].agregar(tiempo_total)
+
+    def tabla(self, hasta=None):
+        # Una fila por franja; con hasta, la última franja se promedia solo hasta ese instante
+        cola, sistema = self.areas.series
+        num_franjas = max(len(cola), len(self.esperas))
+        if hasta is not None:
+            num_franjas = min(num_franjas, math.ceil(hasta / self.ancho))
+        filas = []
+        for k in range(num_franjas):
+            inicio = k * self.ancho
+            fin = inicio + self.ancho if hasta is None else min(inicio + self.ancho, hasta)
+            duracion = fin - inicio
+            esperas = self.esperas[k] if k < len(self.esperas) else AcumuladorWelford()
+            tiempos = self.tiempos_sistema[k] if k < len(self.tiempos_sistema) else AcumuladorWelford()
+            filas.append(FilaFranja(
+                inicio=inicio,
+                fin=fin,
+                L_q=cola[k] / duracion if k < len(cola) else 0.0,
+                L=sistema[k] / duracion if k < len(sistema) else 0.0,
+                clientes=esperas.n,
+                Wq=esperas.media if esperas.n else math.nan,
+                W=tiempos.media if tiempos.n else math.nan,
+                Wq_maximo=esperas.maximo if esperas.n else math.nan,
+            ))
+        return filas
+
+
+# ---------------------------
+# MSER-5 y medias de lotes para una corrida larga
+# ---------------------------
+# Las observaciones se agrupan en lotes de 5 a medida que llegan y se guardan las medias de cada
+# lote de 5 (k = n / 5 valores en memoria). El truncamiento no es incremental: se calcula una vez al
+# final de la corrida, en truncamiento(). Para un truncamiento de d lotes,
+# MSER(d) = sum_{j>d} (Z_j - media_d)^2 / (k - d)^2; se elige el d que minimiza MSER(d) dentro de la
+# primera mitad de la serie. Con sumas acumuladas, todos los MSER(d) se evalúan en O(k).
+class SerieMSER5:
+    TAMANO_LOTE = 5
+
+    def __init__(self):
+        self.medias = array("d")
+        self.suma_lote = 0.0
+        self.en_lote = 0
+        self.n = 0
+
+    def agregar(self, x):
+        self.n += 1
+        self.suma_lote += x
+        self.en_lote += 1
+        if self.en_lote == self.TAMANO_LOTE:
+            self.medias.append(self.suma_lote / self.TAMANO_LOTE)
+            self.suma_lote = 0.0
+            self.en_lote = 0
+
+    def extender(self, valores):
+        for x in valores:
+            self.agregar(float(x))
+
+    def truncamiento(self):
+        # Número de lotes de 5 a descartar (el calentamiento son 5 * d observaciones)
+        z = np.frombuffer(self.medias, dtype=np.float64)
+        k = len(z)
+        if k < 4:
+            return 0
+        suma = np.cumsum(z[::-1])[::-1]              # sum_{j>=d} Z_j
+        suma2 = np.cumsum((z * z)[::-1])[::-1]
+        restantes = np.arange(k, 0, -1, dtype=np.float64)
+        mser = (suma2 - suma * suma / restantes) / (restantes * restantes)
+        return int(np.argmin(mser[:k // 2]))
+
+    def medias_por_lotes(self, num_lotes=30, confianza=0.95, truncamiento=None):
+        # Intervalo de confianza con num_lotes lotes grandes después de descartar el calentamiento
+        d = self.truncamiento() if truncamiento is None else truncamiento
+        z = np.frombuffer(self.medias, dtype=np.float64)[d:]
+        if len(z) < num_lotes:
+            raise ValueError(f"La serie tiene {len(z)} lotes de 5 después del calentamiento; se necesitan al menos num_lotes={num_lotes} (corrida más larga o menos lotes)")
+        tamano = len(z) // num_lotes
+        # Se descartan los primeros lotes de 5 que sobran para que todos los lotes sean iguales
+        z = z[len(z) - tamano * num_lotes:]
+        lotes = z.reshape(num_lotes, tamano).mean(axis=1)
+        return resumir_muestra(lotes.tolist(), confianza)
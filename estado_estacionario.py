@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Estimación en estado estacionario con una sola corrida larga.
+
+Las replicaciones independientes (replicaciones.py) repiten el periodo de calentamiento en cada
+corrida. Para medidas de estado estacionario conviene una sola corrida larga sin vaciado
+(vaciar_sistema=False), quitando el sesgo inicial y estimando la varianza por medias de lotes:
+
+  - Wq y W: la serie de esperas y tiempos en el sistema, en el orden en que terminan los clientes.
+  - L y L_q: la serie de promedios en el tiempo del número de clientes en intervalos de ancho
+    ANCHO_INTERVALO (áreas bajo la curva por intervalo, AreasPorIntervalo).
+
+En cada serie el calentamiento se elige con MSER-5 (SerieMSER5): las observaciones se agrupan en
+lotes de 5 a medida que llegan y, al final de la corrida, se descarta el prefijo que minimiza el
+error estándar marginal. El resto se divide en NUM_LOTES medias de lotes para el intervalo de confianza.
+
+La corrida usa MotorEventosBanco por omisión (motor="simpy" para SimulacionBanco); solo se agrega
+el seguimiento de las series, así que los demás resultados no cambian.
+"""
+
+import time
+from dataclasses import dataclass
+
+from estadisticas import AreasPorIntervalo, ResumenMetrica, SerieMSER5
+from modelo_banco import SimulacionBanco
+from motor_eventos import MotorEventosBanco
+
+# Configuración (mismo sistema que el script 5, con una corrida larga)
+LAMBDA = 1
+MU = 0.25
+NUM_SERVIDORES = 5
+TIEMPO_SIMULACION = 200_000
+ANCHO_INTERVALO = 10.0
+NUM_LOTES = 30
+CONFIANZA = 0.95
+SEMILLA = 2025
+
+
+# ---------------------------
+# Resultado por métrica
+# ---------------------------
+@dataclass
+class ResultadoEstacionario:
+    resumen: ResumenMetrica      # Medias de lotes después de quitar el calentamiento
+    descartadas: int             # Observaciones descartadas como calentamiento
+    observaciones: int           # Observaciones en la serie completa
+    tiempo_calentamiento: float  # Tiempo simulado aproximado que cubre el calentamiento
+
+
+# ---------------------------
+# Resumen que además guarda la serie para MSER-5
+# ---------------------------
+class ResumenConSerie:
+
+    def __init__(self, resumen, serie):
+        self.resumen = resumen
+        self.serie = serie
+
+    def agregar(self, x):
+        self.resumen.agregar(x)
+        self.serie.agregar(x)
+
+    def cuantil(self, p):
+        return self.resumen.cuantil(p)
+
+
+# ---------------------------
+# Seguimiento de las series (sirve con cualquiera de los dos motores)
+# ---------------------------
+class Trayectoria:
+
+    def __init__(self, *args, ancho_intervalo=ANCHO_INTERVALO, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.ancho_intervalo = ancho_intervalo
+
+    def reiniciar_acumuladores(self):
+        super().reiniciar_acumuladores()
+        self.serie_esperas = SerieMSER5()
+        self.serie_sistema = SerieMSER5()
+        self.esperas = ResumenConSerie(self.esperas, self.serie_esperas)
+        self.tiempos_sistema = ResumenConSerie(self.tiempos_sistema, self.serie_sistema)
+        # Serie 0: clientes en cola; serie 1: clientes en el sistema
+        self.areas = AreasPorIntervalo(self.ancho_intervalo, 2)
+
+    def actualizar_estadisticas(self, *args, **kwargs):
+        # Los conteos son constantes desde el último evento hasta ahora
+        inicio = self.tiempo_ultimo_evento
+        clientes_cola = self.clientes_cola
+        clientes_sistema = clientes_cola + self.cajeros_ocupados
+        super().actualizar_estadisticas(*args, **kwargs)
+        self.areas.agregar(inicio, self.tiempo_ultimo_evento, clientes_cola, clientes_sistema)
+
+
+class TrayectoriaSimpy(Trayectoria, SimulacionBanco):
+    pass
+
+
+class TrayectoriaEventos(Trayectoria, MotorEventosBanco):
+    pass
+
+
+MOTORES = {"simpy": TrayectoriaSimpy, "eventos": TrayectoriaEventos}
+
+
+# ---------------------------
+# Análisis de una corrida larga
+# ---------------------------
+def resumir_serie(serie, tiempo_por_observacion, num_lotes=NUM_LOTES, confianza=CONFIANZA):
+    d = serie.truncamiento()
+    descartadas = d * SerieMSER5.TAMANO_LOTE
+    return ResultadoEstacionario(
+        resumen=serie.medias_por_lotes(num_lotes, confianza, truncamiento=d),
+        descartadas=descartadas,
+        observaciones=serie.n,
+        tiempo_calentamiento=descartadas * tiempo_por_observacion,
+    )
+
+
+# Devuelve (ResultadosSimulacion de la corrida completa, {métrica: ResultadoEstacionario})
+def analizar_corrida(tasa_llegadas, tasa_servicio, num_servidores=1, tiempo_simulacion=TIEMPO_SIMULACION, motor="eventos", ancho_intervalo=ANCHO_INTERVALO, num_lotes=NUM_LOTES, confianza=CONFIANZA, **parametros):
+    modelo = MOTORES[motor](tasa_llegadas, tasa_servicio, num_servidores, tiempo_simulacion, vaciar_sistema=False, ancho_intervalo=ancho_intervalo, **parametros)
+    resultados = modelo.ejecutar()
+
+    # Promedios de L_q y L por intervalo; el último intervalo puede estar incompleto
+    series_tiempo = {}
+    for nombre, indice in (("L_q", 0), ("L", 1)):
+        serie = SerieMSER5()
+        serie.extender(modelo.areas.promedios(indice, completos_hasta=tiempo_simulacion))
+        series_tiempo[nombre] = serie
+
+    # Tiempo simulado por cliente, para expresar el calentamiento de Wq y W en unidades de tiempo
+    por_cliente = tiempo_simulacion / max(resultados.clientes_atendidos, 1)
+    metricas = {
+        "Wq": resumir_serie(modelo.serie_esperas, por_cliente, num_lotes, confianza),
+        "W": resumir_serie(modelo.serie_sistema, por_cliente, num_lotes, confianza),
+        "L_q": resumir_serie(series_tiempo["L_q"], ancho_intervalo, num_lotes, confianza),
+        "L": resumir_serie(series_tiempo["L"], ancho_intervalo, num_lotes, confianza),
+    }
+    return resultados, metricas
+
+
+def imprimir_analisis(metricas, confianza=CONFIANZA):
+    print(f"\n--- Estado estacionario: MSER-5 y medias de lotes (IC {confianza:.0%}) ---")
+    print(f"{'Métrica':<8}{'Media':>10}{'Inferior':>10}{'Superior':>10}{'Semiancho':>11}{'Descartadas':>13}{'Calentamiento':>15}")
+    for nombre, m in metricas.items():
+        r = m.resumen
+        print(f"{nombre:<8}{r.media:10.4f}{r.inferior:10.4f}{r.superior:10.4f}{r.semiancho:11.4f}{m.descartadas:>7}/{m.observaciones:<7}{m.tiempo_calentamiento:13.1f}")
+
+
+def main():
+    inicio = time.perf_counter()
+    resultados, metricas = analizar_corrida(LAMBDA, MU, NUM_SERVIDORES, TIEMPO_SIMULACION, semilla=SEMILLA)
+    duracion = time.perf_counter() - inicio
+
+    imprimir_analisis(metricas)
+    print(f"\nCorrida completa sin truncar: L={resultados.L:.4f}  L_q={resultados.L_q:.4f}  W={resultados.W:.4f}  Wq={resultados.Wq:.4f}")
+    print(f"{resultados.clientes_atendidos} clientes, {TIEMPO_SIMULACION} unidades de tiempo en {duracion:.2f} s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Flujos de variables aleatorias generadas en bloque con NumPy.
+
+Los scripts sortean cada tiempo con random.expovariate(LAMBDA) o random.expovariate(MU): una
+llamada de Python al generador por cada valor. FlujoVariables llena un bloque de valores con una sola
+llamada vectorizada de numpy.random.Generator y los entrega uno por uno con next(flujo). Cuando el
+bloque se agota se genera el siguiente (llenado perezoso). El primer bloque es pequeño y el tamaño se
+duplica hasta tamano_bloque, así que las corridas cortas no generan valores de más.
+
+La distribución es cualquier método de numpy.random.Generator ("exponential", "gamma", "lognormal",
+...) con sus parámetros por nombre. FlujoExponencialInversion genera exponenciales por inversión,
+X = -ln(1 - U) / tasa, y con antitetico=True usa 1 - U en lugar de U (variables antitéticas). Cada flujo tiene su propio generador; semillas_flujos() deriva
+semillas independientes para varios flujos (por ejemplo, llegadas y servicios) de una sola semilla.
+
+Un flujo se puede guardar con pickle (puntos_control.py): se guarda el estado del generador al inicio
+del bloque actual y, con reanudar(consumidos), el bloque se vuelve a generar y la entrega sigue en el
+valor número consumidos + 1, igual que sin interrupción.
+"""
+
+from itertools import chain
+
+import numpy as np
+
+TAMANO_BLOQUE = 65536
+BLOQUE_INICIAL = 1024
+
+
+class FlujoVariables:
+
+    def __init__(self, distribucion="exponential", semilla=None, tamano_bloque=TAMANO_BLOQUE, **parametros):
+        self.generador = np.random.default_rng(semilla)
+        if not hasattr(self.generador, distribucion):
+            raise ValueError(f"Distribución desconocida: {distribucion!r} (debe ser un método de numpy.random.Generator)")
+        self.distribucion = distribucion
+        self.muestrear = getattr(self.generador, distribucion)
+        self.parametros = parametros
+        self.tamano_bloque = tamano_bloque
+        # Valores generados antes del bloque actual, y (estado del generador, tamaño) al inicio de ese bloque
+        self.generados = 0
+        self.inicio_bloque = None
+        # chain.from_iterable recorre cada bloque en C; solo se vuelve a Python al pedir otro bloque
+        self.valores = chain.from_iterable(self.bloques())
+
+    def generar(self, tamano):
+        return self.muestrear(size=tamano, **self.parametros)
+
+    def bloques_arreglo(self, tamano=None):
+        # Bloques como arreglos de NumPy, para transformarlos antes de entregarlos (perfil_llegadas.py)
+        if tamano is None:
+            tamano = min(BLOQUE_INICIAL, self.tamano_bloque)
+        while True:
+            if self.inicio_bloque is not None:
+                self.generados += self.inicio_bloque[1]
+            self.inicio_bloque = (self.generador.bit_generator.state, tamano)
+            yield self.generar(tamano)
+            tamano = min(2 * tamano, self.tamano_bloque)
+
+    def bloques(self, tamano=None):
+        # Los valores se convierten a float de Python una sola vez por bloque
+        for bloque in self.bloques_arreglo(tamano):
+            yield bloque.tolist()
+
+    # ---------------------------
+    # Guardar y reanudar
+    # ---------------------------
+    def reanudar(self, consumidos):
+        # Vuelve a generar el bloque actual desde su estado inicial y sigue después de los consumidos
+        # primeros valores del flujo (consumidos no puede ser anterior al bloque actual)
+        if self.inicio_bloque is None:
+            if consumidos:
+                raise ValueError("El flujo no ha generado valores")
+            self.valores = chain.from_iterable(self.bloques())
+            return
+        estado, tamano = self.inicio_bloque
+        desplazamiento = consumidos - self.generados
+        if not 0 <= desplazamiento <= tamano:
+            raise ValueError(f"No se puede reanudar en el valor {consumidos}: el bloque actual empieza en {self.generados} y tiene {tamano} valores")
+        self.generador.bit_generator.state = estado
+        actual = self.generar(tamano)[desplazamiento:].tolist()
+        self.valores = chain(actual, chain.from_iterable(self.bloques(min(2 * tamano, self.tamano_bloque))))
+
+    def __getstate__(self):
+        # valores (un iterador) y muestrear (método del generador) no se guardan
+        estado = self.__dict__.copy()
+        del estado["valores"], estado["muestrear"]
+        return estado
+
+    def __setstate__(self, estado):
+        self.__dict__.update(estado)
+        self.muestrear = getattr(self.generador, self.distribucion)
+        # Por omisión sigue después del bloque actual; reanudar() elige otra posición
+        self.reanudar(self.generados + (self.inicio_bloque[1] if self.inicio_bloque else 0))
+
+    # En ciclos calientes conviene guardar iter(flujo) y llamar next() sobre él: evita una llamada
+    # de método de Python por valor
+    def __iter__(self):
+        return self.valores
+
+    def __next__(self):
+        return next(self.valores)
+
+
+# ---------------------------
+# Exponenciales por inversión (admiten variables antitéticas)
+# ---------------------------
+# Generator.exponential usa el método ziggurat, que no es monótono en un solo uniforme; para que
+# el par (U, 1 - U) dé valores con correlación negativa hace falta la inversión.
+class FlujoExponencialInversion(FlujoVariables):
+
+    def __init__(self, tasa, semilla=None, tamano_bloque=TAMANO_BLOQUE, antitetico=False):
+        self.escala = 1 / tasa
+        self.antitetico = antitetico
+        super().__init__("random", semilla, tamano_bloque)
+
+    def generar(self, tamano):
+        u = self.muestrear(size=tamano)              # U en [0, 1)
+        if self.antitetico:
+            # 1 - U está en (0, 1]; se acota para no obtener -ln(0)
+            u = np.minimum(1.0 - u, np.nextafter(1.0, 0.0))
+        return -np.log1p(-u) * self.escala
+
+
+def flujo_exponencial(tasa, semilla=None, tamano_bloque=TAMANO_BLOQUE):
+    return FlujoVariables("exponential", semilla, tamano_bloque, scale=1 / tasa)
+
+
+# ---------------------------
+# Semillas independientes por flujo
+# ---------------------------
+# La semilla puede ser un entero, None o una SeedSequence. Los hijos se construyen con spawn_key
+# explícito en lugar de spawn(), que modifica la SeedSequence y daría flujos distintos si se
+# reinicia el mismo modelo.
+def semillas_flujos(semilla, num_flujos):
+    if not isinstance(semilla, np.random.SeedSequence):
+        semilla = np.random.SeedSequence(semilla)
+    return [np.random.SeedSequence(semilla.entropy, spawn_key=semilla.spawn_key + (i,)) for i in range(num_flujos)]
@@ -0,0 +1,384 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Modelo del banco (M/M/1 y M/M/c) encapsulado en una clase.
+
+Los scripts 4, 5 y 6 guardaban los acumuladores (area_clientes_cola, tiempo_ultimo_evento, total_cola, ...)
+en variables globales y sus funciones main() dependían de las constantes LAMBDA, MU y NUM_SERVIDORES.
+Así solo se podía hacer una replicación por proceso de Python.
+
+SimulacionBanco es dueña de sus acumuladores y recibe los parámetros y la semilla como argumentos.
+Cada llamada a ejecutar() crea un entorno nuevo de SimPy y devuelve un ResultadosSimulacion con la
+utilización, L, L_q, W y Wq, de modo que se pueden correr miles de replicaciones seguidas en el mismo
+proceso.
+
+Variantes:
+  - colas_individuales=False: una sola cola para todos los cajeros (script 5; con 1 cajero es el script 4).
+  - colas_individuales=True: una cola por cajero (script 6). El cajero lo elige la política de
+    despacho (despacho.py); por omisión, el de menor carga ("cola_mas_corta").
+  - vaciar_sistema=True: las llegadas se generan hasta tiempo_llegada_maxima y la simulación continúa
+    hasta atender al último cliente (scripts 5 y 6).
+  - vaciar_sistema=False: la simulación se corta en tiempo_llegada_maxima (script 4).
+
+En lugar de sortear los tiempos durante la simulación se pueden pasar tiempos_entre_llegadas y
+tiempos_servicio ya generados. El tiempo de servicio queda ligado al cliente (el cliente i usa
+tiempos_servicio[i - 1]) y no al orden en que se sortea, lo que permite alimentar varios modelos
+con las mismas entradas (por ejemplo, para validar motor_vectorizado.py).
+
+Los tiempos sorteados salen, por omisión, de dos flujos de NumPy generados en bloque
+(variables="numpy", flujos_aleatorios.py), uno para llegadas y otro para servicios, con semillas
+independientes derivadas de la semilla. Con variables="random" se usa random.Random con una llamada
+por valor, como en los scripts originales. variables="inversion" genera las exponenciales por
+inversión de uniformes y variables="antitetica" usa los uniformes complementarios 1 - U con la misma
+semilla; un par de corridas con ambas opciones forma un par antitético (reduccion_varianza.py).
+
+Con perfil_llegadas (lista de (inicio, tasa) o PerfilLlegadas, perfil_llegadas.py) la tasa de
+llegadas cambia durante la jornada y tasa_llegadas no se usa para sortear llegadas. Con
+umbral_espera=t se cuenta la fracción de clientes que esperan en cola más de t
+(fraccion_espera_mayor). Además se acumula la distribución ponderada por tiempo del número de
+clientes en cola y de cajeros ocupados (distribucion_cola y distribucion_ocupados), de la que salen
+probabilidades de cola como P(cola > 10) sin releer el registro de eventos. Con ancho_franja se acumulan métricas por franja de tiempo en
+self.franjas (MetricasPorFranja, estadisticas.py).
+"""
+
+import math
+import random
+from dataclasses import dataclass
+from itertools import chain
+
+import numpy as np
+import simpy
+
+from despacho import crear_despacho
+from estadisticas import CUANTILES, HistogramaTiempo, MetricasPorFranja, ResumenStreaming, prob_mayor
+from flujos_aleatorios import FlujoExponencialInversion, flujo_exponencial, semillas_flujos
+from perfil_llegadas import PerfilLlegadas
+
+# Origen de los tiempos sorteados
+VARIABLES = ("numpy", "random", "inversion", "antitetica")
+
+# Versión del sorteo del modelo: entra en la llave de la caché de barrido_parametros.py. Se incrementa
+# cada vez que cambia cómo se sortean los tiempos, para no reutilizar resultados de otra versión
+VERSION_MODELO = 1
+
+
+# ---------------------------
+# Resultados de una replicación
+# ---------------------------
+@dataclass
+class ResultadosSimulacion:
+    utilizacion: float          # Fracción del tiempo que los cajeros estuvieron ocupados (0 a 1)
+    L: float                    # Número promedio de clientes en el banco
+    L_q: float                  # Número promedio de clientes en cola
+    W: float                    # Tiempo promedio en el sistema
+    Wq: float                   # Tiempo promedio de espera en la cola
+    clientes_atendidos: int
+    tiempo_simulado: float
+    # Percentiles de la espera en cola y del tiempo en el sistema (estimados con P², memoria constante)
+    Wq_p50: float = float("nan")
+    Wq_p95: float = float("nan")
+    Wq_p99: float = float("nan")
+    W_p50: float = float("nan")
+    W_p95: float = float("nan")
+    W_p99: float = float("nan")
+    # Fracción de clientes que esperan en cola más de umbral_espera (NaN sin umbral)
+    fraccion_espera_mayor: float = float("nan")
+    # Distribución ponderada por tiempo: distribucion_cola[k] = P(clientes en cola = k),
+    # distribucion_ocupados[k] = P(cajeros ocupados = k)
+    distribucion_cola: tuple = ()
+    distribucion_ocupados: tuple = ()
+
+
+# ---------------------------
+# Semilla del generador aleatorio
+# ---------------------------
+# La semilla puede ser un entero, None o una SeedSequence de NumPy (replicaciones.py). De una
+# SeedSequence se toman 128 bits de estado para sembrar random.Random.
+def semilla_entera(semilla):
+    if isinstance(semilla, np.random.SeedSequence):
+        return int.from_bytes(semilla.generate_state(4).tobytes(), "little")
+    return semilla
+
+
+class SimulacionBanco:
+
+    def __init__(self, tasa_llegadas, tasa_servicio, num_servidores=1, tiempo_llegada_maxima=480, semilla=None, colas_individuales=False, vaciar_sistema=True, registro=None, tiempos_entre_llegadas=None, tiempos_servicio=None, politica_despacho="cola_mas_corta", cuantiles=CUANTILES, variables="numpy", perfil_llegadas=None, umbral_espera=None, ancho_franja=None):
+        if variables not in VARIABLES:
+            raise ValueError(f"Origen de variables desconocido: {variables!r} (opciones: {', '.join(VARIABLES)})")
+        self.tasa_llegadas = tasa_llegadas
+        self.tasa_servicio = tasa_servicio
+        self.num_servidores = num_servidores
+        self.tiempo_llegada_maxima = tiempo_llegada_maxima
+        self.semilla = semilla
+        self.colas_individuales = colas_individuales
+        self.vaciar_sistema = vaciar_sistema
+        self.politica_despacho = politica_despacho
+        self.variables = variables
+        self.umbral_espera = umbral_espera
+        self.ancho_franja = ancho_franja
+
+        # Tasa de llegadas que cambia durante la jornada (opcional)
+        if isinstance(perfil_llegadas, (list, tuple)):
+            perfil_llegadas = PerfilLlegadas(perfil_llegadas)
+        self.perfil_llegadas = perfil_llegadas
+
+        # Cuantiles de espera y tiempo en el sistema que se estiman (() para no estimar ninguno)
+        self.cuantiles = cuantiles
+
+        # Entradas pregeneradas (opcionales)
+        self.tiempos_entre_llegadas = tiempos_entre_llegadas
+        self.tiempos_servicio = tiempos_servicio
+
+        # Objeto con el método registrar(...) (ver registro_eventos.py); None para no registrar eventos
+        self.registro = registro
+
+    # ---------------------------
+    # Estado inicial de la replicación
+    # ---------------------------
+    def reiniciar(self):
+        self.reiniciar_acumuladores()
+        self.env = simpy.Environment()
+
+        if self.colas_individuales:
+            self.cajeros = [simpy.Resource(self.env) for _ in range(self.num_servidores)]
+        else:
+            self.cajeros = [simpy.Resource(self.env, capacity=self.num_servidores)]
+
+    # Estado común a todos los motores: generador aleatorio, entradas, contadores y acumuladores
+    def reiniciar_acumuladores(self):
+        self.rng = random.Random(semilla_entera(self.semilla))
+
+        # _llegadas y _flujo_servicios son iteradores; None para sortear con self.rng
+        self._llegadas = None
+        self._servicios = None
+        self._flujo_servicios = None
+        # Objetos FlujoVariables (llegadas, servicios) detrás de los iteradores, para puntos_control.py
+        self._flujos = None
+        # Con perfil de llegadas se sortean exponenciales de tasa 1 y el perfil las convierte
+        perfil = self.perfil_llegadas
+        tasa_llegadas = self.tasa_llegadas if perfil is None else 1.0
+        if self.variables != "random":
+            semilla_llegadas, semilla_servicios = semillas_flujos(self.semilla, 2)
+            if self.variables == "numpy":
+                flujo_llegadas = flujo_exponencial(tasa_llegadas, semilla_llegadas)
+                flujo_servicios = flujo_exponencial(self.tasa_servicio, semilla_servicios)
+            else:
+                antitetico = self.variables == "antitetica"
+                flujo_llegadas = FlujoExponencialInversion(tasa_llegadas, semilla_llegadas, antitetico=antitetico)
+                flujo_servicios = FlujoExponencialInversion(self.tasa_servicio, semilla_servicios, antitetico=antitetico)
+            self._flujos = (flujo_llegadas, flujo_servicios)
+            self._flujo_servicios = iter(flujo_servicios)
+            if perfil is None:
+                self._llegadas = iter(flujo_llegadas)
+            else:
+                # Inversión del perfil por bloques completos
+                self._llegadas = chain.from_iterable(perfil.bloques_entre_llegadas(flujo_llegadas.bloques_arreglo()))
+        elif perfil is not None:
+            expovariate = self.rng.expovariate
+            self._llegadas = perfil.entre_llegadas(iter(lambda: expovariate(1.0), None))
+        if self.tiempos_entre_llegadas is not None:
+            self._llegadas = iter([float(t) for t in self.tiempos_entre_llegadas])
+        if self.tiempos_servicio is not None:
+            self._servicios = [float(t) for t in self.tiempos_servicio]
+
+        # Contadores de clientes en cola y cajeros ocupados (O(1) aunque haya miles de cajeros)
+        self.clientes_cola = 0
+        self.cajeros_ocupados = 0
+        if self.colas_individuales:
+            self.despacho = crear_despacho(self.politica_despacho, self.num_servidores, self.rng)
+
+        # Acumuladores (antes variables globales)
+        self.tiempo_ultimo_evento = 0.0
+        self.area_clientes_cola = 0.0
+        self.area_clientes_sistema = 0.0
+        self.tiempo_ocupado = 0.0
+        self.total_cola = 0.0
+        self.total_sistema = 0.0
+        self.total_clientes_simulacion = 0
+        self.clientes_espera_mayor = 0
+        self._umbral_espera = math.inf if self.umbral_espera is None else self.umbral_espera
+
+        # Distribución de la espera en cola y del tiempo en el sistema, en memoria constante
+        self.esperas = ResumenStreaming(self.cuantiles)
+        self.tiempos_sistema = ResumenStreaming(self.cuantiles)
+
+        # Tiempo con k clientes en cola y con k cajeros ocupados
+        self.histograma_cola = HistogramaTiempo()
+        self.histograma_ocupados = HistogramaTiempo(self.num_servidores + 1)
+
+        # Métricas por franja de tiempo (opcional)
+        self.franjas = MetricasPorFranja(self.ancho_franja) if self.ancho_franja else None
+
+    # ---------------------------
+    # Función para actualizar las estadísticas
+    # ---------------------------
+    def actualizar_estadisticas(self, id_cliente=None, evento=None, tiempo_inicio_servicio=None, tiempo_fin_servicio=None, tiempo_en_cola=None, tiempo_servicio=None, tiempo_total=None):
+        ahora = self.env.now
+        delta_tiempo = ahora - self.tiempo_ultimo_evento
+
+        clientes_cola = self.clientes_cola
+        cajeros_ocupados = self.cajeros_ocupados
+        clientes_sistema = clientes_cola + cajeros_ocupados
+
+        self.area_clientes_cola += clientes_cola * delta_tiempo
+        self.area_clientes_sistema += clientes_sistema * delta_tiempo
+        self.histograma_cola.agregar(clientes_cola, delta_tiempo)
+        self.histograma_ocupados.agregar(cajeros_ocupados, delta_tiempo)
+        if self.franjas is not None:
+            self.franjas.agregar_area(self.tiempo_ultimo_evento, ahora, clientes_cola, clientes_sistema)
+
+        self.tiempo_ultimo_evento = ahora
+
+        if self.registro is not None:
+            # Quitar el Tiempo_en_Cola en el evento FinServicio (campo vacío en CSV, NaN en npy)
+            if evento == "FinServicio":
+                tiempo_en_cola = None
+            self.registro.registrar(id_cliente, evento, ahora, delta_tiempo, clientes_cola, cajeros_ocupados, tiempo_inicio_servicio, tiempo_fin_servicio, tiempo_en_cola, tiempo_servicio, tiempo_total)
+
+    # ---------------------------
+    # Tiempos aleatorios (sorteados o pregenerados)
+    # ---------------------------
+    def tiempo_entre_llegadas(self):
+        if self._llegadas is None:
+            return self.rng.expovariate(self.tasa_llegadas)
+        return next(self._llegadas)
+
+    def tiempo_servicio(self, id_cliente):
+        if self._servicios is not None:
+            return self._servicios[id_cliente - 1]
+        if self._flujo_servicios is not None:
+            return next(self._flujo_servicios)
+        return self.rng.expovariate(self.tasa_servicio)
+
+    # ---------------------------
+    # Selección del cajero
+    # ---------------------------
+    def seleccionar_cajero(self):
+        if self.colas_individuales:
+            cajero = self.despacho.elegir()
+            self.despacho.asignar(cajero)
+            return cajero
+        return 0
+
+    # ---------------------------
+    # Proceso: atención al cliente
+    # ---------------------------
+    def atencion_cliente(self, id_cliente, tiempo_llegada):
+        env = self.env
+
+        # Actualizar estadísticas y registrar llegada
+        self.actualizar_estadisticas(id_cliente=id_cliente, evento="Llegada")
+
+        # Solicitar el servidor
+        cajero = self.seleccionar_cajero()
+        self.clientes_cola += 1
+        with self.cajeros[cajero].request() as request:
+            yield request
+            self.clientes_cola -= 1
+            self.cajeros_ocupados += 1
+
+            # Registrar el inicio del servicio
+            tiempo_inicio_servicio = env.now
+            tiempo_en_cola = tiempo_inicio_servicio - tiempo_llegada
+            self.actualizar_estadisticas(id_cliente=id_cliente, evento="InicioServicio", tiempo_inicio_servicio=tiempo_inicio_servicio, tiempo_en_cola=tiempo_en_cola)
+
+            # Generar tiempo de servicio y simular el tiempo de atención
+            tiempo_servicio = self.tiempo_servicio(id_cliente)
+            yield env.timeout(tiempo_servicio)
+
+            # Registrar el evento de fin de servicio
+            tiempo_fin_servicio = env.now
+            tiempo_total = tiempo_fin_servicio - tiempo_llegada
+            self.actualizar_estadisticas(id_cliente=id_cliente, evento="FinServicio", tiempo_inicio_servicio=tiempo_inicio_servicio, tiempo_fin_servicio=tiempo_fin_servicio, tiempo_en_cola=tiempo_en_cola, tiempo_servicio=tiempo_servicio, tiempo_total=tiempo_total)
+
+            # Actualizar estadísticas después del fin del servicio
+            self.tiempo_ocupado += tiempo_servicio
+            self.total_cola += tiempo_en_cola
+            self.total_sistema += tiempo_total
+            self.total_clientes_simulacion += 1
+            self.esperas.agregar(tiempo_en_cola)
+            self.tiempos_sistema.agregar(tiempo_total)
+            if tiempo_en_cola > self._umbral_espera:
+                self.clientes_espera_mayor += 1
+            if self.franjas is not None:
+                self.franjas.agregar_cliente(tiempo_llegada, tiempo_en_cola, tiempo_total)
+
+        # El cajero queda libre
+        self.cajeros_ocupados -= 1
+        if self.colas_individuales:
+            self.despacho.liberar(cajero)
+
+    # ---------------------------
+    # Proceso: generación de llegadas
+    # ---------------------------
+    def generacion_llegadas(self):
+        env = self.env
+        id_cliente = 0
+
+        # Sin vaciado, las llegadas continúan hasta que se corta la simulación
+        while not self.vaciar_sistema or env.now <= self.tiempo_llegada_maxima:
+            try:
+                tiempo_entre_llegadas = self.tiempo_entre_llegadas()
+            except StopIteration:
+                # Se agotaron los tiempos entre llegadas pregenerados
+                return
+            yield env.timeout(tiempo_entre_llegadas)
+
+            id_cliente += 1
+            tiempo_llegada = env.now
+            env.process(self.atencion_cliente(id_cliente, tiempo_llegada))
+
+    # ---------------------------
+    # Ejecución de una replicación
+    # ---------------------------
+    def ejecutar(self):
+        self.reiniciar()
+        self.env.process(self.generacion_llegadas())
+
+        if self.vaciar_sistema:
+            # Ejecutar hasta que no haya más clientes en el sistema
+            self.env.run()
+        else:
+            self.env.run(until=self.tiempo_llegada_maxima)
+
+        return self.resultados(self.env.now)
+
+    def resultados(self, tiempo_simulado):
+        atendidos = self.total_clientes_simulacion
+        return ResultadosSimulacion(
+            utilizacion=self.tiempo_ocupado / (tiempo_simulado * self.num_servidores),
+            L=self.area_clientes_sistema / tiempo_simulado,
+            L_q=self.area_clientes_cola / tiempo_simulado,
+            W=self.total_sistema / atendidos if atendidos else math.nan,
+            Wq=self.total_cola / atendidos if atendidos else math.nan,
+            clientes_atendidos=atendidos,
+            tiempo_simulado=tiempo_simulado,
+            Wq_p50=self.esperas.cuantil(0.5),
+            Wq_p95=self.esperas.cuantil(0.95),
+            Wq_p99=self.esperas.cuantil(0.99),
+            W_p50=self.tiempos_sistema.cuantil(0.5),
+            W_p95=self.tiempos_sistema.cuantil(0.95),
+            W_p99=self.tiempos_sistema.cuantil(0.99),
+            fraccion_espera_mayor=self.clientes_espera_mayor / atendidos if atendidos and self.umbral_espera is not None else math.nan,
+            distribucion_cola=self.histograma_cola.probabilidades(),
+            distribucion_ocupados=self.histograma_ocupados.probabilidades(),
+        )
+
+
+# ---------------------------
+# Despliegue de resultados (formato de los scripts 4, 5 y 6)
+# ---------------------------
+def imprimir_resultados(resultados):
+    print("\n--- Resultados de la Simulación ---")
+    print(f"Utilizacion del Servidor:                     {resultados.utilizacion * 100:.2f}%")
+    print(f"Numero de clientes promedio en el banco (L):  {resultados.L:.4f}")
+    print(f"Numero de clientes promedio en cola (L_q):    {resultados.L_q:.4f}")
+    print(f"Tiempo promedio de espera en el sistema (W):  {resultados.W:.4f}")
+    print(f"Tiempo promedio de espera en la cola (Wq):    {resultados.Wq:.4f}")
+    if not math.isnan(resultados.Wq_p50):
+        print(f"Percentiles de espera en cola (p50/p95/p99):  {resultados.Wq_p50:.4f} / {resultados.Wq_p95:.4f} / {resultados.Wq_p99:.4f}")
+        print(f"Percentiles en el sistema (p50/p95/p99):      {resultados.W_p50:.4f} / {resultados.W_p95:.4f} / {resultados.W_p99:.4f}")
+    if resultados.distribucion_cola:
+        p = resultados.distribucion_cola
+        print(f"P(cola > 0) / P(cola > 5) / P(cola > 10):     {prob_mayor(p, 0):.4f} / {prob_mayor(p, 5):.4f} / {prob_mayor(p, 10):.4f}")
@@ -0,0 +1,248 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Motor de eventos discretos basado en un heap, alternativo a SimPy para corridas grandes.
+
+En SimulacionBanco cada llegada crea un proceso generador nuevo con env.process(atencion_cliente(...))
+y un Request de SimPy. Con 10^6 a 10^7 clientes el costo de crear esos objetos y de la planificación
+de SimPy domina el tiempo de ejecución.
+
+MotorEventosBanco simula el mismo modelo con:
+  - un heap plano de tuplas (tiempo, secuencia, tipo, cliente), donde tipo es LLEGADA o FIN_SERVICIO;
+  - registros de cliente compactos (clase Cliente con __slots__);
+  - colas FIFO (deque) y contadores de clientes en cola y cajeros ocupados.
+
+Las estadísticas se actualizan en los mismos puntos que atencion_cliente/actualizar_estadisticas
+(Llegada, InicioServicio y FinServicio, con los mismos conteos), los números aleatorios se sortean
+en el mismo orden y acepta los mismos parámetros, así que con la misma semilla da los mismos
+resultados que SimulacionBanco (salvo empates exactos de tiempo).
+
+python motor_eventos.py compara ambos motores en eventos por segundo.
+"""
+
+import heapq
+import time
+from collections import deque
+
+from modelo_banco import SimulacionBanco
+
+# Configuración de la comparación
+LAMBDA = 1
+MU = 0.25
+NUM_SERVIDORES = 5
+TIEMPO_LLEGADA_MAXIMA = 100_000
+SEMILLA = 2025
+
+# Tipos de evento
+LLEGADA = 0
+FIN_SERVICIO = 1
+
+
+# ---------------------------
+# Registro compacto de un cliente
+# ---------------------------
+class Cliente:
+    __slots__ = ("id_cliente", "tiempo_llegada", "tiempo_inicio_servicio", "tiempo_servicio", "cajero")
+
+    def __init__(self, id_cliente, tiempo_llegada):
+        self.id_cliente = id_cliente
+        self.tiempo_llegada = tiempo_llegada
+        self.tiempo_inicio_servicio = 0.0
+        self.tiempo_servicio = 0.0
+        self.cajero = 0
+
+
+class MotorEventosBanco(SimulacionBanco):
+    # Mismos parámetros, entradas y acumuladores que SimulacionBanco; cambia solo el motor
+
+    # ---------------------------
+    # Estado inicial de la replicación
+    # ---------------------------
+    def reiniciar(self):
+        self.reiniciar_acumuladores()
+
+        self.ahora = 0.0
+        self.eventos = []
+        self.secuencia = 0
+        self.eventos_procesados = 0
+        self.id_cliente = 0
+
+        # Una cola compartida, o una cola por cajero; ocupados_por_cajero[i] indica si el cajero i atiende
+        num_colas = self.num_servidores if self.colas_individuales else 1
+        self.colas = [deque() for _ in range(num_colas)]
+        self.ocupados_por_cajero = [0] * self.num_servidores
+        self.cajeros_libres = list(range(self.num_servidores - 1, -1, -1))
+
+    def programar(self, tiempo, tipo, cliente):
+        self.secuencia += 1
+        heapq.heappush(self.eventos, (tiempo, self.secuencia, tipo, cliente))
+
+    def programar_llegada(self):
+        try:
+            self.programar(self.ahora + self.tiempo_entre_llegadas(), LLEGADA, None)
+        except StopIteration:
+            # Se agotaron los tiempos entre llegadas pregenerados
+            pass
+
+    # ---------------------------
+    # Función para actualizar las estadísticas (mismos puntos que en SimulacionBanco)
+    # ---------------------------
+    def actualizar_estadisticas(self, cliente, evento, tiempo_fin_servicio=None, tiempo_total=None):
+        ahora = self.ahora
+        delta_tiempo = ahora - self.tiempo_ultimo_evento
+        clientes_cola = self.clientes_cola
+        cajeros_ocupados = self.cajeros_ocupados
+
+        self.area_clientes_cola += clientes_cola * delta_tiempo
+        self.area_clientes_sistema += (clientes_cola + cajeros_ocupados) * delta_tiempo
+        self.histograma_cola.agregar(clientes_cola, delta_tiempo)
+        self.histograma_ocupados.agregar(cajeros_ocupados, delta_tiempo)
+        if self.franjas is not None:
+            self.franjas.agregar_area(self.tiempo_ultimo_evento, ahora, clientes_cola, clientes_cola + cajeros_ocupados)
+        self.tiempo_ultimo_evento = ahora
+
+        if self.registro is not None:
+            if evento == "Llegada":
+                self.registro.registrar(cliente.id_cliente, evento, ahora, delta_tiempo, clientes_cola, cajeros_ocupados)
+            elif evento == "InicioServicio":
+                self.registro.registrar(cliente.id_cliente, evento, ahora, delta_tiempo, clientes_cola, cajeros_ocupados, cliente.tiempo_inicio_servicio, None, cliente.tiempo_inicio_servicio - cliente.tiempo_llegada)
+            else:
+                self.registro.registrar(cliente.id_cliente, evento, ahora, delta_tiempo, clientes_cola, cajeros_ocupados, cliente.tiempo_inicio_servicio, tiempo_fin_servicio, None, cliente.tiempo_servicio, tiempo_total)
+
+    # ---------------------------
+    # Selección del cajero
+    # ---------------------------
+    def seleccionar_cajero(self):
+        if self.colas_individuales:
+            cajero = self.despacho.elegir()
+            self.despacho.asignar(cajero)
+            return cajero
+        # En la cola única se toma cualquier cajero libre
+        return self.cajeros_libres.pop()
+
+    def iniciar_servicio(self, cliente, cajero):
+        cliente.tiempo_inicio_servicio = self.ahora
+        cliente.cajero = cajero
+        self.ocupados_por_cajero[cajero] = 1
+        self.cajeros_ocupados += 1
+        self.actualizar_estadisticas(cliente, "InicioServicio")
+
+        cliente.tiempo_servicio = self.tiempo_servicio(cliente.id_cliente)
+        self.programar(self.ahora + cliente.tiempo_servicio, FIN_SERVICIO, cliente)
+
+    # ---------------------------
+    # Manejo de eventos
+    # ---------------------------
+    def llegada(self):
+        self.id_cliente += 1
+        cliente = Cliente(self.id_cliente, self.ahora)
+
+        # Igual que generacion_llegadas: la siguiente llegada se sortea antes de atender al cliente
+        if not self.vaciar_sistema or self.ahora <= self.tiempo_llegada_maxima:
+            self.programar_llegada()
+
+        self.actualizar_estadisticas(cliente, "Llegada")
+
+        if self.colas_individuales:
+            cajero = self.seleccionar_cajero()
+            if self.ocupados_por_cajero[cajero] == 0:
+                self.iniciar_servicio(cliente, cajero)
+            else:
+                self.colas[cajero].append(cliente)
+                self.clientes_cola += 1
+        elif self.cajeros_ocupados < self.num_servidores:
+            self.iniciar_servicio(cliente, self.seleccionar_cajero())
+        else:
+            self.colas[0].append(cliente)
+            self.clientes_cola += 1
+
+    def fin_servicio(self, cliente):
+        tiempo_fin_servicio = self.ahora
+        tiempo_en_cola = cliente.tiempo_inicio_servicio - cliente.tiempo_llegada
+        tiempo_total = tiempo_fin_servicio - cliente.tiempo_llegada
+        self.actualizar_estadisticas(cliente, "FinServicio", tiempo_fin_servicio, tiempo_total)
+
+        self.tiempo_ocupado += cliente.tiempo_servicio
+        self.total_cola += tiempo_en_cola
+        self.total_sistema += tiempo_total
+        self.total_clientes_simulacion += 1
+        self.esperas.agregar(tiempo_en_cola)
+        self.tiempos_sistema.agregar(tiempo_total)
+        if tiempo_en_cola > self._umbral_espera:
+            self.clientes_espera_mayor += 1
+        if self.franjas is not None:
+            self.franjas.agregar_cliente(cliente.tiempo_llegada, tiempo_en_cola, tiempo_total)
+
+        # Liberar el cajero y pasar al siguiente cliente de su cola
+        cajero = cliente.cajero
+        self.ocupados_por_cajero[cajero] = 0
+        self.cajeros_ocupados -= 1
+        cola = self.colas[cajero if self.colas_individuales else 0]
+        if cola:
+            self.clientes_cola -= 1
+            self.iniciar_servicio(cola.popleft(), cajero)
+        elif not self.colas_individuales:
+            self.cajeros_libres.append(cajero)
+
+        if self.colas_individuales:
+            self.despacho.liberar(cajero)
+
+    # ---------------------------
+    # Ejecución de una replicación
+    # ---------------------------
+    def ejecutar(self):
+        self.reiniciar()
+        self.programar_llegada()
+        return self.continuar()
+
+    def continuar(self, hasta=float("inf")):
+        # Procesa los eventos hasta el tiempo hasta (inclusive). Devuelve los resultados si la
+        # replicación terminó, o None si se detuvo antes (puntos_control.py la sigue después)
+        eventos = self.eventos
+        limite = float("inf") if self.vaciar_sistema else self.tiempo_llegada_maxima
+        parada = min(limite, hasta)
+        while eventos:
+            if eventos[0][0] > parada:
+                break
+            tiempo, _, tipo, cliente = heapq.heappop(eventos)
+            self.ahora = tiempo
+            self.eventos_procesados += 1
+            if tipo == LLEGADA:
+                self.llegada()
+            else:
+                self.fin_servicio(cliente)
+
+        if eventos and eventos[0][0] <= limite:
+            return None
+        if not self.vaciar_sistema:
+            self.ahora = self.tiempo_llegada_maxima
+
+        return self.resultados(self.ahora)
+
+
+# ---------------------------
+# Comparación de motores: eventos por segundo
+# ---------------------------
+def medir(clase, **parametros):
+    inicio = time.perf_counter()
+    resultados = clase(**parametros).ejecutar()
+    duracion = time.perf_counter() - inicio
+    # Tres eventos por cliente: Llegada, InicioServicio y FinServicio
+    return resultados, 3 * resultados.clientes_atendidos / duracion, duracion
+
+
+def main():
+    for colas_individuales in (False, True):
+        parametros = dict(tasa_llegadas=LAMBDA, tasa_servicio=MU, num_servidores=NUM_SERVIDORES, tiempo_llegada_maxima=TIEMPO_LLEGADA_MAXIMA, semilla=SEMILLA, colas_individuales=colas_individuales)
+        r_simpy, eps_simpy, t_simpy = medir(SimulacionBanco, **parametros)
+        r_heap, eps_heap, t_heap = medir(MotorEventosBanco, **parametros)
+
+        print(f"\n--- {'Colas individuales' if colas_individuales else 'Cola única'}: {r_heap.clientes_atendidos} clientes ---")
+        print(f"SimPy:            {t_simpy:8.2f} s  {eps_simpy:12.0f} eventos/s")
+        print(f"Heap de eventos:  {t_heap:8.2f} s  {eps_heap:12.0f} eventos/s  ({t_simpy / t_heap:.1f}x)")
+        print(f"Mismos resultados: {r_simpy == r_heap}")
+
+
+if __name__ == '__main__':
+    main()
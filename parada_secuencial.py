@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Control secuencial del número de replicaciones según el ancho del intervalo de confianza.
+
+Con el modelo del script 5 había que adivinar cuántas replicaciones correr: o se desperdicia CPU o los
+intervalos quedan demasiado anchos. Este módulo lanza replicaciones en lotes paralelos y, después de
+cada lote, calcula el intervalo de confianza de las métricas elegidas (por ejemplo Wq, L y
+utilizacion). Se detiene en cuanto el semiancho relativo (semiancho / |media|) de todas ellas queda
+por debajo del objetivo, o al llegar al máximo de replicaciones.
+
+Las semillas salen de una sola SeedSequence maestra con spawn() sucesivos, así que la secuencia de
+replicaciones es la misma sin importar el tamaño de los lotes ni el número de procesos.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+from replicaciones import ejecutar_tareas, imprimir_resumen, resumir
+
+# Configuración (mismos valores que el script 5)
+TIEMPO_LLEGADA_MAXIMA = 480
+LAMBDA = 1
+MU = 0.25
+NUM_SERVIDORES = 5
+METRICAS_OBJETIVO = ("Wq", "L", "utilizacion")
+PRECISION_RELATIVA = 0.05           # Semiancho relativo objetivo (5% de la media)
+CONFIANZA = 0.95
+SEMILLA_MAESTRA = 2025
+
+
+@dataclass
+class ResultadoSecuencial:
+    resumen: dict                   # Resumen por métrica (ver replicaciones.resumir)
+    resultados: list                # ResultadosSimulacion de cada replicación
+    replicaciones: int
+    lotes: int
+    precision_alcanzada: bool
+
+
+# ---------------------------
+# ¿Todas las métricas alcanzaron la precisión?
+# ---------------------------
+def precision_suficiente(resumen, metricas, precision_relativa):
+    return all(resumen[m].semiancho_relativo <= precision_relativa for m in metricas)
+
+
+# ---------------------------
+# Replicaciones hasta alcanzar la precisión
+# ---------------------------
+# Los parámetros son los de SimulacionBanco (y opcionalmente motor, ver replicaciones.py).
+def replicar_hasta_precision(precision_relativa=PRECISION_RELATIVA, metricas=METRICAS_OBJETIVO, confianza=CONFIANZA, minimo=10, maximo=10000, lote=None, semilla_maestra=None, procesos=None, **parametros):
+    procesos = procesos or os.cpu_count()
+    lote = lote or max(minimo, 4 * procesos)
+    semillas = np.random.SeedSequence(semilla_maestra)
+
+    resultados = []
+    lotes = 0
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        while True:
+            # El primer lote asegura el mínimo de replicaciones; nunca se pasa del máximo
+            tamano = min(max(lote, minimo - len(resultados)), maximo - len(resultados))
+            tareas = [(parametros, semilla) for semilla in semillas.spawn(tamano)]
+            resultados.extend(ejecutar_tareas(tareas, procesos, pool))
+            lotes += 1
+
+            resumen = resumir(resultados, confianza, metricas)
+            alcanzada = precision_suficiente(resumen, metricas, precision_relativa)
+            if alcanzada or len(resultados) >= maximo:
+                return ResultadoSecuencial(resumen, resultados, len(resultados), lotes, alcanzada)
+
+
+def main():
+    inicio = time.perf_counter()
+    r = replicar_hasta_precision(PRECISION_RELATIVA, METRICAS_OBJETIVO, CONFIANZA, semilla_maestra=SEMILLA_MAESTRA, tasa_llegadas=LAMBDA, tasa_servicio=MU, num_servidores=NUM_SERVIDORES, tiempo_llegada_maxima=TIEMPO_LLEGADA_MAXIMA)
+    duracion = time.perf_counter() - inicio
+
+    imprimir_resumen(r.resumen, CONFIANZA)
+    print(f"\nObjetivo: semiancho relativo <= {PRECISION_RELATIVA:.1%} en {', '.join(METRICAS_OBJETIVO)}")
+    print(f"{'Alcanzado' if r.precision_alcanzada else 'NO alcanzado'} con {r.replicaciones} replicaciones en {r.lotes} lotes ({duracion:.2f} s)")
+    for metrica in METRICAS_OBJETIVO:
+        print(f"  {metrica:<12} semiancho relativo {r.resumen[metrica].semiancho_relativo:.2%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Perfiles de tasa de llegadas que cambian durante la jornada (proceso de Poisson no homogéneo).
+
+El banco no recibe la misma cantidad de clientes a las 9:00 que a la hora de almuerzo.
+PerfilLlegadas describe LAMBDA(t) con una tabla de puntos (inicio, tasa):
+
+  - interpolacion="constante": la tasa de cada punto vale hasta el siguiente punto.
+  - interpolacion="lineal": la tasa cambia linealmente entre puntos consecutivos.
+
+Después del último punto la tasa se mantiene constante. La tabla se puede leer de un CSV con
+columnas inicio,tasa (PerfilLlegadas.desde_csv).
+
+Las llegadas se generan por inversión de la tasa acumulada Lambda(t) = integral de LAMBDA(s) ds
+desde 0 hasta t. Si E1, E2, ... son exponenciales de tasa 1, la llegada n ocurre en
+Lambda^-1(E1 + ... + En). A diferencia del método de aceptación y rechazo (thinning), no se
+desperdicia ningún valor aunque el perfil tenga picos altos. Con un flujo de NumPy
+(flujos_aleatorios.py) la inversión se hace por bloques completos con searchsorted
+(bloques_entre_llegadas); con random.Random, valor por valor (entre_llegadas).
+
+python perfil_llegadas.py [tabla.csv] corre un día con el perfil y muestra las métricas por franja de
+15 minutos (MetricasPorFranja, estadisticas.py).
+"""
+
+import csv
+import math
+import sys
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+
+# Configuración de la demostración (jornada del script 5 con pico de almuerzo)
+ARCHIVO_PERFIL = "perfil_jornada.csv"
+MU = 0.25
+NUM_SERVIDORES = 6
+TIEMPO_LLEGADA_MAXIMA = 480
+ANCHO_FRANJA = 15
+SEMILLA = 2025
+
+INTERPOLACIONES = ("constante", "lineal")
+
+
+class PerfilLlegadas:
+
+    def __init__(self, tramos, interpolacion="constante"):
+        if interpolacion not in INTERPOLACIONES:
+            raise ValueError(f"Interpolación desconocida: {interpolacion!r} (opciones: {', '.join(INTERPOLACIONES)})")
+        tramos = sorted((float(inicio), float(tasa)) for inicio, tasa in tramos)
+        if not tramos or tramos[0][0] != 0:
+            raise ValueError("El perfil de llegadas debe tener un tramo que empiece en 0")
+        if any(tasa < 0 for _, tasa in tramos):
+            raise ValueError("Las tasas del perfil de llegadas no pueden ser negativas")
+        self.interpolacion = interpolacion
+        self.inicios = [inicio for inicio, _ in tramos]
+        self.tasas = [tasa for _, tasa in tramos]
+
+        # Pendiente de la tasa en cada tramo (0 en el último y con interpolación constante)
+        self.pendientes = [0.0] * len(tramos)
+        if interpolacion == "lineal":
+            for k in range(len(tramos) - 1):
+                self.pendientes[k] = (self.tasas[k + 1] - self.tasas[k]) / (self.inicios[k + 1] - self.inicios[k])
+
+        # Tasa acumulada al inicio de cada tramo
+        self.acumuladas = [0.0]
+        for k in range(1, len(tramos)):
+            duracion = self.inicios[k] - self.inicios[k - 1]
+            self.acumuladas.append(self.acumuladas[-1] + self.tasas[k - 1] * duracion + 0.5 * self.pendientes[k - 1] * duracion * duracion)
+
+        # Copias en NumPy para la inversión por bloques
+        self._inicios = np.array(self.inicios)
+        self._tasas = np.array(self.tasas)
+        self._pendientes = np.array(self.pendientes)
+        self._acumuladas = np.array(self.acumuladas)
+
+    @classmethod
+    def desde_csv(cls, ruta, interpolacion="constante"):
+        # Columnas inicio,tasa; se ignoran las filas que no son numéricas (encabezado)
+        tramos = []
+        with open(ruta, newline="") as archivo:
+            for fila in csv.reader(archivo):
+                try:
+                    tramos.append((float(fila[0]), float(fila[1])))
+                except (ValueError, IndexError):
+                    continue
+        return cls(tramos, interpolacion)
+
+    def tramos(self):
+        return list(zip(self.inicios, self.tasas))
+
+    def como_dict(self):
+        # Forma JSON del perfil (celdas de dotacion.py y llave de caché de barrido_parametros.py)
+        return {"tramos": [[inicio, tasa] for inicio, tasa in self.tramos()], "interpolacion": self.interpolacion}
+
+    @classmethod
+    def desde_dict(cls, datos):
+        return cls(datos["tramos"], datos["interpolacion"])
+
+    def tramo(self, t):
+        return bisect_right(self.inicios, t) - 1
+
+    def tasa(self, t):
+        k = self.tramo(t)
+        return self.tasas[k] + self.pendientes[k] * (t - self.inicios[k])
+
+    def integral(self, t):
+        k = self.tramo(t)
+        x = t - self.inicios[k]
+        return self.acumuladas[k] + self.tasas[k] * x + 0.5 * self.pendientes[k] * x * x
+
+    def tasa_media(self, hasta):
+        return self.integral(hasta) / hasta
+
+    def tasa_maxima(self, hasta=math.inf):
+        # Con interpolación lineal el máximo está en uno de los puntos de la tabla (o en hasta)
+        tasas = [tasa for inicio, tasa in zip(self.inicios, self.tasas) if inicio < hasta]
+        if hasta != math.inf:
+            tasas.append(self.tasa(hasta))
+        return max(tasas)
+
+    # ---------------------------
+    # Inversión de la tasa acumulada
+    # ---------------------------
+    # Dentro del tramo k, Lambda(inicio_k + x) = acumulada_k + r x + m x^2 / 2. Para un valor d de la
+    # tasa acumulada por encima de acumulada_k, x = 2 d / (r + sqrt(r^2 + 2 m d)); esta forma no
+    # pierde precisión cuando m es cero o muy pequeña. El tramo es el último con acumulada_k < objetivo.
+    def tiempo_acumulado(self, objetivo):
+        # Instante s con Lambda(s) = objetivo; infinito si la tasa se queda en 0
+        k = max(bisect_left(self.acumuladas, objetivo) - 1, 0)
+        d = objetivo - self.acumuladas[k]
+        r, m = self.tasas[k], self.pendientes[k]
+        denominador = r + math.sqrt(max(r * r + 2 * m * d, 0.0))
+        if denominador == 0:
+            return math.inf
+        return self.inicios[k] + 2 * d / denominador
+
+    def tiempos_acumulados(self, objetivos):
+        k = np.maximum(np.searchsorted(self._acumuladas, objetivos, side="left") - 1, 0)
+        d = objetivos - self._acumuladas[k]
+        r, m = self._tasas[k], self._pendientes[k]
+        denominador = r + np.sqrt(np.maximum(r * r + 2 * m * d, 0.0))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            tiempos = self._inicios[k] + 2 * d / denominador
+        tiempos[denominador == 0] = np.inf
+        return tiempos
+
+    def invertir(self, t, e):
+        # Instante s >= t con Lambda(s) - Lambda(t) = e
+        return max(t, self.tiempo_acumulado(self.integral(t) + e))
+
+    # ---------------------------
+    # Tiempos entre llegadas
+    # ---------------------------
+    def entre_llegadas(self, exponenciales):
+        # Valor por valor, a partir de exponenciales de tasa 1
+        t = 0.0
+        for e in exponenciales:
+            siguiente = self.invertir(t, e)
+            if siguiente == math.inf:
+                return
+            yield siguiente - t
+            t = siguiente
+
+    def bloques_entre_llegadas(self, bloques_exponenciales):
+        # Por bloques: cada bloque de exponenciales de tasa 1 se convierte con una sola llamada a
+        # tiempos_acumulados; devuelve listas de tiempos entre llegadas
+        acumulada = 0.0
+        t = 0.0
+        for exponenciales in bloques_exponenciales:
+            objetivos = acumulada + np.cumsum(exponenciales)
+            acumulada = float(objetivos[-1])
+            tiempos = self.tiempos_acumulados(objetivos)
+            # Los tiempos son no decrecientes: si la tasa se anula, las llegadas infinitas quedan al final
+            finitos = tiempos[np.isfinite(tiempos)]
+            yield np.diff(finitos, prepend=t).tolist()
+            if len(finitos) < len(tiempos):
+                return
+            t = float(tiempos[-1])
+
+
+# ---------------------------
+# Demostración: un día con el perfil y métricas por franja
+# ---------------------------
+def main():
+    from modelo_banco import SimulacionBanco
+
+    ruta = sys.argv[1] if len(sys.argv) > 1 else ARCHIVO_PERFIL
+    perfil = PerfilLlegadas.desde_csv(ruta, "lineal")
+    banco = SimulacionBanco(perfil.tasa_media(TIEMPO_LLEGADA_MAXIMA), MU, NUM_SERVIDORES, TIEMPO_LLEGADA_MAXIMA, semilla=SEMILLA, perfil_llegadas=perfil, ancho_franja=ANCHO_FRANJA)
+    r = banco.ejecutar()
+
+    print(f"\n--- Perfil {ruta} (lineal): {r.clientes_atendidos} clientes, {NUM_SERVIDORES} cajeros ---")
+    print(f"{'Franja':>13}{'LAMBDA':>8}{'Llegadas':>10}{'L_q':>8}{'L':>8}{'Wq':>8}{'W':>8}{'Wq máx':>9}")
+    for f in banco.franjas.tabla(r.tiempo_simulado):
+        print(f"{f.inicio:6.0f}-{f.fin:<6.0f}{perfil.tasa((f.inicio + f.fin) / 2):8.2f}{f.clientes:10d}{f.L_q:8.2f}{f.L:8.2f}{f.Wq:8.2f}{f.W:8.2f}{f.Wq_maximo:9.2f}")
+
+
+if __name__ == '__main__':
+    main()
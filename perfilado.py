@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tiempo por fase de los modelos del banco (instrumentación opcional).
+
+Para saber si el tiempo de una corrida se va en la planificación de SimPy, en sortear variables, en
+actualizar_estadisticas o en escribir el registro, PerfiladoSimpy y PerfiladoEventos (subclases de
+SimulacionBanco y MotorEventosBanco) cuentan y miden con time.perf_counter_ns cada llamada a:
+
+  - los pasos de los procesos generacion_llegadas y atencion_cliente (SimPy), o los manejadores
+    llegada, fin_servicio e iniciar_servicio y la inserción en el heap (motor de eventos);
+  - tiempo_entre_llegadas y tiempo_servicio (sorteo de variables), seleccionar_cajero,
+    actualizar_estadisticas y el resumen de esperas y tiempos en el sistema de cada cliente atendido
+    (media, varianza y cuantiles P²);
+  - registrar y la escritura en bloque del registro de eventos (escribir_bloque o escribir_ventana).
+
+Los tiempos son exclusivos: a cada fase se le resta el tiempo de las fases medidas dentro de ella,
+así que la suma de la tabla es el tiempo total. Lo que queda en "motor" es lo que ejecutar() no pasa
+dentro de ninguna fase: la planificación de eventos de SimPy o el bucle del heap. La medición agrega
+unos cientos de nanosegundos por llamada, así que la tabla sirve para comparar fases, no como tiempo
+absoluto. Las clases SimulacionBanco y MotorEventosBanco no cambian: sin perfilado no hay ningún
+costo.
+
+perfilar_cprofile() corre una función (por ejemplo, banco.ejecutar de una replicación) con cProfile y
+guarda las estadísticas en un archivo de pstats.
+
+En los scripts 4, 5 y 6, PERFILAR = True usa PerfiladoSimpy e imprime la tabla al final de main(), y
+ARCHIVO_PSTATS = "ruta.pstats" guarda el perfil de cProfile de la corrida principal.
+"""
+
+import cProfile
+import pstats
+import sys
+from time import perf_counter_ns
+
+from modelo_banco import SimulacionBanco
+from motor_eventos import MotorEventosBanco
+
+# Configuración de la demostración (mismo sistema que el script 5)
+TIEMPO_LLEGADA_MAXIMA = 20_000
+LAMBDA = 1
+MU = 0.25
+NUM_SERVIDORES = 5
+SEMILLA = 2025
+
+# Método medido: nombre de la fase en la tabla
+FASES = {
+    "ejecutar": "motor",
+    "reiniciar": "reiniciar",
+    "tiempo_entre_llegadas": "sorteo llegadas",
+    "tiempo_servicio": "sorteo servicio",
+    "seleccionar_cajero": "seleccionar_cajero",
+    "actualizar_estadisticas": "actualizar_estadisticas",
+    "programar": "programar (heap)",
+    "llegada": "llegada",
+    "fin_servicio": "fin_servicio",
+    "iniciar_servicio": "iniciar_servicio",
+}
+PROCESOS = {
+    "generacion_llegadas": "proceso generacion_llegadas",
+    "atencion_cliente": "proceso atencion_cliente",
+}
+RESUMENES = ("esperas", "tiempos_sistema")
+FASES_REGISTRO = {
+    "registrar": "registro: filas",
+    "escribir_bloque": "registro: escritura",
+    "escribir_ventana": "registro: escritura",
+}
+
+
+# ---------------------------
+# Contadores por fase
+# ---------------------------
+class Perfil:
+
+    def __init__(self):
+        self.llamadas = {}
+        self.tiempos = {}           # Nanosegundos exclusivos por fase
+        self._hijos = [0]           # Tiempo de las fases anidadas en cada nivel abierto
+
+    def _cerrar(self, fase, inicio):
+        total = perf_counter_ns() - inicio
+        hijos = self._hijos.pop()
+        self.tiempos[fase] = self.tiempos.get(fase, 0) + total - hijos
+        self.llamadas[fase] = self.llamadas.get(fase, 0) + 1
+        self._hijos[-1] += total
+
+    def envolver(self, fase, funcion):
+        def medida(*args, **kwargs):
+            self._hijos.append(0)
+            inicio = perf_counter_ns()
+            try:
+                return funcion(*args, **kwargs)
+            finally:
+                self._cerrar(fase, inicio)
+        return medida
+
+    def envolver_proceso(self, fase, funcion):
+        # Mide cada paso del generador (de un yield al siguiente), no el tiempo simulado que espera
+        def proceso(*args, **kwargs):
+            generador = funcion(*args, **kwargs)
+            valor = None
+            while True:
+                self._hijos.append(0)
+                inicio = perf_counter_ns()
+                try:
+                    evento = generador.send(valor)
+                except StopIteration:
+                    return
+                finally:
+                    self._cerrar(fase, inicio)
+                valor = yield evento
+        return proceso
+
+    def tabla(self):
+        # (fase, llamadas, segundos, nanosegundos por llamada, fracción del total), de mayor a menor
+        total = sum(self.tiempos.values())
+        filas = []
+        for fase, tiempo in sorted(self.tiempos.items(), key=lambda item: -item[1]):
+            llamadas = self.llamadas[fase]
+            filas.append((fase, llamadas, tiempo / 1e9, tiempo / llamadas, tiempo / total if total else 0.0))
+        return filas
+
+
+def instrumentar_registro(registro, perfil):
+    # Los métodos se reemplazan en la instancia, así que también se miden las llamadas internas
+    # (registrar -> escribir_bloque). Sigue a los registros envueltos (RegistroMuestreado).
+    while registro is not None:
+        for metodo, fase in FASES_REGISTRO.items():
+            if hasattr(registro, metodo):
+                setattr(registro, metodo, perfil.envolver(fase, getattr(registro, metodo)))
+        registro = getattr(registro, "registro", None)
+
+
+# ---------------------------
+# Modelos con perfilado (sirve con cualquiera de los dos motores)
+# ---------------------------
+class Perfilado:
+
+    def __init__(self, *args, perfil=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.perfil = perfil if perfil is not None else Perfil()
+        for metodo, fase in FASES.items():
+            if hasattr(self, metodo):
+                setattr(self, metodo, self.perfil.envolver(fase, getattr(self, metodo)))
+        for metodo, fase in PROCESOS.items():
+            setattr(self, metodo, self.perfil.envolver_proceso(fase, getattr(self, metodo)))
+        instrumentar_registro(self.registro, self.perfil)
+
+    def reiniciar_acumuladores(self):
+        super().reiniciar_acumuladores()
+        # Los resúmenes se crean de nuevo en cada replicación
+        for nombre in RESUMENES:
+            resumen = getattr(self, nombre)
+            resumen.agregar = self.perfil.envolver("resumen de clientes", resumen.agregar)
+
+
+class PerfiladoSimpy(Perfilado, SimulacionBanco):
+    pass
+
+
+class PerfiladoEventos(Perfilado, MotorEventosBanco):
+    pass
+
+
+MOTORES = {"simpy": PerfiladoSimpy, "eventos": PerfiladoEventos}
+
+
+def imprimir_perfil(perfil, titulo="Tiempo por fase"):
+    print(f"\n--- {titulo} ---")
+    print(f"{'Fase':<30}{'Llamadas':>12}{'Tiempo (s)':>12}{'ns/llamada':>12}{'%':>8}")
+    for fase, llamadas, segundos, por_llamada, fraccion in perfil.tabla():
+        print(f"{fase:<30}{llamadas:12d}{segundos:12.3f}{por_llamada:12.0f}{fraccion * 100:8.1f}")
+
+
+# ---------------------------
+# cProfile de una replicación
+# ---------------------------
+def perfilar_cprofile(funcion, ruta, *args, **kwargs):
+    # Corre funcion(*args, **kwargs) con cProfile y guarda las estadísticas en ruta (formato pstats)
+    perfilador = cProfile.Profile()
+    resultado = perfilador.runcall(funcion, *args, **kwargs)
+    perfilador.dump_stats(ruta)
+    return resultado
+
+
+def ejecutar_perfilado(banco, archivo_pstats=None):
+    # banco.ejecutar(), con cProfile si se indica un archivo de pstats
+    if archivo_pstats is None:
+        return banco.ejecutar()
+    return perfilar_cprofile(banco.ejecutar, archivo_pstats)
+
+
+def imprimir_pstats(ruta, limite=15, orden="tottime"):
+    pstats.Stats(ruta).strip_dirs().sort_stats(orden).print_stats(limite)
+
+
+def main():
+    motores = sys.argv[1:] or list(MOTORES)
+    for motor in motores:
+        banco = MOTORES[motor](LAMBDA, MU, NUM_SERVIDORES, TIEMPO_LLEGADA_MAXIMA, semilla=SEMILLA)
+        r = banco.ejecutar()
+        imprimir_perfil(banco.perfil, f"Motor {motor}: {r.clientes_atendidos} clientes, {NUM_SERVIDORES} cajeros")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Puntos de control para corridas largas del modelo del banco (guardar y reanudar).
+
+Una corrida de estado estacionario de horas se pierde completa si el proceso se corta. En
+SimulacionBanco el estado vive en los generadores atencion_cliente de SimPy, que no se pueden
+guardar con pickle; MotorEventosBanco (motor_eventos.py) da los mismos resultados con la misma semilla
+y su estado es explícito, así que los puntos de control se hacen sobre ese motor:
+
+  - el reloj (ahora), el heap de eventos pendientes con su secuencia, las colas y los clientes en
+    servicio (registros Cliente con tiempo de llegada, de inicio de servicio y cajero);
+  - los contadores y acumuladores (area_clientes_cola, total_cola, tiempo_ocupado, ...), los
+    resúmenes de esperas (Welford y P²), los histogramas, las franjas y el estado de la política
+    de despacho;
+  - el estado de random.Random y, para los flujos de NumPy, el estado del generador al inicio del
+    bloque actual junto con el número de valores consumidos (se deduce del estado del modelo: un
+    tiempo entre llegadas por cliente llegado más la llegada pendiente, un servicio por cliente
+    atendido o en servicio).
+
+El archivo es un pickle comprimido con gzip y se escribe primero en un archivo temporal que luego
+reemplaza al anterior, así que un corte durante la escritura no deja un punto de control a medias.
+Una corrida reanudada procesa los mismos eventos con los mismos números aleatorios y da exactamente
+los mismos resultados que una corrida sin interrupción.
+
+ejecutar_con_puntos_control() corre la replicación en tramos de intervalo unidades de tiempo simulado
+y guarda un punto de control al final de cada tramo; si el archivo ya existe, la corrida sigue desde
+ahí. El registro de eventos no forma parte del punto de control: al reanudar se usa el registro del
+modelo que se pasa (por ejemplo, uno nuevo en otro archivo). No se admite perfil_llegadas (los
+tiempos por bloque del perfil dependen del estado interno de su generador).
+
+python puntos_control.py corre la demostración; si se interrumpe con Ctrl+C, la siguiente ejecución
+sigue desde el último punto de control.
+"""
+
+import gzip
+import os
+import pickle
+import time
+
+from motor_eventos import LLEGADA, MotorEventosBanco
+
+# Configuración de la demostración (sistema del script 5, corrida larga)
+TIEMPO_LLEGADA_MAXIMA = 1_000_000
+LAMBDA = 1
+MU = 0.25
+NUM_SERVIDORES = 5
+SEMILLA = 2025
+INTERVALO = 50_000
+ARCHIVO_PUNTO_CONTROL = "punto_control.pkl.gz"
+
+VERSION = 1
+
+# Atributos que no se guardan: iteradores (se reconstruyen al cargar) y el registro de eventos
+EXCLUIDOS = ("_llegadas", "_flujo_servicios", "registro")
+
+# Parámetros que deben coincidir entre el modelo que se corre y el punto de control
+PARAMETROS = ("tasa_llegadas", "tasa_servicio", "num_servidores", "tiempo_llegada_maxima", "semilla", "colas_individuales", "vaciar_sistema", "politica_despacho", "cuantiles", "variables", "umbral_espera", "ancho_franja")
+
+
+# ---------------------------
+# Guardar
+# ---------------------------
+def valores_consumidos(motor):
+    # (tiempos entre llegadas, tiempos de servicio) sorteados hasta ahora
+    llegada_pendiente = any(evento[2] == LLEGADA for evento in motor.eventos)
+    return motor.id_cliente + llegada_pendiente, motor.total_clientes_simulacion + motor.cajeros_ocupados
+
+
+def firma(motor):
+    return type(motor).__name__, tuple(repr(getattr(motor, nombre)) for nombre in PARAMETROS)
+
+
+def validar_motor(motor):
+    if not isinstance(motor, MotorEventosBanco):
+        raise TypeError("Los puntos de control necesitan un MotorEventosBanco (SimPy guarda el estado en generadores)")
+    if motor.perfil_llegadas is not None:
+        raise ValueError("Los puntos de control no admiten perfil_llegadas")
+
+
+def estado_motor(motor):
+    validar_motor(motor)
+    return {
+        "version": VERSION,
+        "clase": type(motor),
+        "firma": firma(motor),
+        "consumidos": valores_consumidos(motor),
+        "atributos": {nombre: valor for nombre, valor in vars(motor).items() if nombre not in EXCLUIDOS},
+    }
+
+
+def guardar_punto_control(motor, ruta=ARCHIVO_PUNTO_CONTROL):
+    temporal = f"{ruta}.tmp"
+    with gzip.open(temporal, "wb", compresslevel=6) as archivo:
+        pickle.dump(estado_motor(motor), archivo, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporal, ruta)
+
+
+# ---------------------------
+# Cargar
+# ---------------------------
+def restaurar_flujos(motor, llegadas, servicios):
+    # Los iteradores quedan en el valor siguiente al último sorteado antes de guardar
+    motor._llegadas = None
+    motor._flujo_servicios = None
+    if motor._flujos is not None:
+        flujo_llegadas, flujo_servicios = motor._flujos
+        flujo_llegadas.reanudar(llegadas if motor.tiempos_entre_llegadas is None else 0)
+        flujo_servicios.reanudar(servicios if motor._servicios is None else 0)
+        motor._llegadas = iter(flujo_llegadas)
+        motor._flujo_servicios = iter(flujo_servicios)
+    if motor.tiempos_entre_llegadas is not None:
+        motor._llegadas = iter([float(t) for t in motor.tiempos_entre_llegadas[llegadas:]])
+
+
+def cargar_punto_control(ruta=ARCHIVO_PUNTO_CONTROL, registro=None):
+    # Devuelve el modelo listo para seguir con motor.continuar()
+    with gzip.open(ruta, "rb") as archivo:
+        estado = pickle.load(archivo)
+    if estado.get("version") != VERSION:
+        raise ValueError(f"Versión de punto de control no compatible: {estado.get('version')!r}")
+    clase = estado["clase"]
+    motor = clase.__new__(clase)
+    motor.__dict__.update(estado["atributos"])
+    motor.registro = registro
+    restaurar_flujos(motor, *estado["consumidos"])
+    return motor
+
+
+# ---------------------------
+# Corrida con puntos de control
+# ---------------------------
+def ejecutar_con_puntos_control(motor, ruta=ARCHIVO_PUNTO_CONTROL, intervalo=INTERVALO, reanudar=True, conservar=False):
+    # Corre la replicación de motor guardando un punto de control cada intervalo de tiempo simulado.
+    # Con reanudar=True y un punto de control en ruta, sigue desde ahí (los parámetros deben
+    # coincidir). Al terminar se borra el archivo, salvo con conservar=True.
+    if reanudar and os.path.exists(ruta):
+        guardado = cargar_punto_control(ruta, motor.registro)
+        if firma(guardado) != firma(motor):
+            raise ValueError(f"El punto de control {ruta} es de otro modelo o con otros parámetros")
+        motor = guardado
+    else:
+        validar_motor(motor)
+        motor.reiniciar()
+        motor.programar_llegada()
+
+    hasta = (motor.ahora // intervalo + 1) * intervalo
+    while True:
+        resultados = motor.continuar(hasta)
+        if resultados is not None:
+            break
+        guardar_punto_control(motor, ruta)
+        hasta += intervalo
+
+    if not conservar and os.path.exists(ruta):
+        os.remove(ruta)
+    return resultados
+
+
+def main():
+    banco = MotorEventosBanco(LAMBDA, MU, NUM_SERVIDORES, TIEMPO_LLEGADA_MAXIMA, semilla=SEMILLA)
+    if os.path.exists(ARCHIVO_PUNTO_CONTROL):
+        print(f"Reanudando desde {ARCHIVO_PUNTO_CONTROL}")
+    inicio = time.perf_counter()
+    try:
+        r = ejecutar_con_puntos_control(banco)
+    except KeyboardInterrupt:
+        print(f"\nInterrumpido: la siguiente ejecución sigue desde {ARCHIVO_PUNTO_CONTROL}")
+        return
+    duracion = time.perf_counter() - inicio
+
+    print(f"\n--- {r.clientes_atendidos} clientes, punto de control cada {INTERVALO} minutos ({duracion:.1f} s) ---")
+    print(f"Utilización: {r.utilizacion:.4f}")
+    print(f"Wq: {r.Wq:.4f}  W: {r.W:.4f}  L_q: {r.L_q:.4f}  L: {r.L:.4f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Reducción de varianza para los modelos del banco: variables antitéticas y variables de control.
+
+Variables antitéticas
+    Cada replicación se corre dos veces con la misma semilla: una con los tiempos generados por
+    inversión de uniformes U (variables="inversion") y otra con 1 - U (variables="antitetica"),
+    tanto en las llegadas (generacion_llegadas) como en los servicios (atencion_cliente). Una corrida
+    con llegadas cortas y servicios largos se empareja con una de llegadas largas y servicios
+    cortos; el promedio de cada par tiene menos varianza que el de dos corridas independientes.
+
+Variables de control
+    En cada replicación se conocen los valores esperados de dos cantidades observadas:
+      - servicio_medio: promedio de los tiempos de servicio, con E = 1 / MU;
+      - llegadas: número de clientes que llegan, con E = LAMBDA * T + 1 (el cliente que llega
+        después de T también entra, igual que en generacion_llegadas).
+    El estimador corregido es media(Y) - beta * (media(C) - E[C]), con beta de la regresión de Y
+    sobre los controles. Ambas esperanzas son exactas solo si el sistema se vacía al final
+    (vaciar_sistema=True, scripts 5 y 6).
+
+El factor de reducción de varianza de cada métrica es la varianza del estimador simple con el mismo
+número de corridas dividida entre la del estimador con reducción (mayor que 1 = mejora).
+"""
+
+import os
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from estadisticas import ResumenMetrica, resumir_muestra, t_critico
+from replicaciones import METRICAS, ejecutar_tareas, generar_semillas
+
+# Configuración (mismos valores que el script 5)
+TIEMPO_LLEGADA_MAXIMA = 480
+LAMBDA = 1
+MU = 0.25
+NUM_SERVIDORES = 5
+NUM_REPLICACIONES = 100
+SEMILLA_MAESTRA = 2025
+CONFIANZA = 0.95
+
+CONTROLES = ("servicio_medio", "llegadas")
+
+
+# ---------------------------
+# Estimación con reducción de varianza
+# ---------------------------
+@dataclass
+class EstimacionReducida:
+    resumen: ResumenMetrica     # Estimación e intervalo de confianza con reducción de varianza
+    simple: ResumenMetrica      # Estimador simple con el mismo número de corridas
+    factor: float               # Var(simple) / Var(reducido)
+
+
+# ---------------------------
+# Variables antitéticas
+# ---------------------------
+def ejecutar_antiteticas(num_pares, semilla_maestra=None, procesos=None, **parametros):
+    semillas = generar_semillas(num_pares, semilla_maestra)
+    tareas = []
+    for semilla in semillas:
+        tareas.append(({**parametros, "variables": "inversion"}, semilla))
+        tareas.append(({**parametros, "variables": "antitetica"}, semilla))
+    corridas = ejecutar_tareas(tareas, procesos)
+    return list(zip(corridas[0::2], corridas[1::2]))
+
+
+def estimar_antiteticas(pares, confianza=CONFIANZA, metricas=METRICAS):
+    estimaciones = {}
+    for metrica in metricas:
+        promedios = [(getattr(a, metrica) + getattr(b, metrica)) / 2 for a, b in pares]
+        resumen = resumir_muestra(promedios, confianza)
+        # Cada corrida por separado tiene la distribución de una replicación simple; el semiancho de
+        # simple es el de 2n corridas tratadas como independientes
+        simple = resumir_muestra([getattr(r, metrica) for par in pares for r in par], confianza)
+        # 2n corridas independientes darían varianza Var(Y) / (2n); los n pares, Var(promedio) / n
+        factor = simple.varianza / (2 * resumen.varianza) if resumen.varianza > 0 else float("inf")
+        estimaciones[metrica] = EstimacionReducida(resumen, simple, factor)
+    return estimaciones
+
+
+# ---------------------------
+# Variables de control
+# ---------------------------
+def valores_control(resultados, num_servidores):
+    # El tiempo ocupado total es utilizacion * tiempo_simulado * num_servidores
+    servicio_medio = resultados.utilizacion * resultados.tiempo_simulado * num_servidores / resultados.clientes_atendidos
+    return {"servicio_medio": servicio_medio, "llegadas": resultados.clientes_atendidos}
+
+
+def esperanzas_control(tasa_llegadas, tasa_servicio, tiempo_llegada_maxima):
+    return {"servicio_medio": 1 / tasa_servicio, "llegadas": tasa_llegadas * tiempo_llegada_maxima + 1}
+
+
+def estimar_control(resultados, tasa_llegadas, tasa_servicio, num_servidores, tiempo_llegada_maxima, confianza=CONFIANZA, metricas=METRICAS, controles=CONTROLES):
+    esperanzas = esperanzas_control(tasa_llegadas, tasa_servicio, tiempo_llegada_maxima)
+    observados = [valores_control(r, num_servidores) for r in resultados]
+    n, q = len(resultados), len(controles)
+    if n <= q + 1:
+        raise ValueError(f"Se necesitan más de {q + 1} replicaciones para {q} variables de control")
+
+    # Regresión Y = a + beta * (C - E[C]); la ordenada a es el estimador corregido
+    x = np.ones((n, q + 1))
+    for j, control in enumerate(controles):
+        x[:, j + 1] = [o[control] - esperanzas[control] for o in observados]
+    inversa = np.linalg.inv(x.T @ x)
+
+    estimaciones = {}
+    for metrica in metricas:
+        y = np.array([getattr(r, metrica) for r in resultados])
+        coeficientes = inversa @ (x.T @ y)
+        residuos = y - x @ coeficientes
+        gl = n - q - 1
+        varianza_estimador = float(residuos @ residuos) / gl * inversa[0, 0]
+        semiancho = t_critico(confianza, gl) * varianza_estimador ** 0.5
+        media = float(coeficientes[0])
+        resumen = ResumenMetrica(media, varianza_estimador * n, semiancho, media - semiancho, media + semiancho, n)
+
+        simple = resumir_muestra(y.tolist(), confianza)
+        factor = (simple.varianza / n) / varianza_estimador if varianza_estimador > 0 else float("inf")
+        estimaciones[metrica] = EstimacionReducida(resumen, simple, factor)
+    return estimaciones
+
+
+def imprimir_estimaciones(titulo, estimaciones, confianza=CONFIANZA):
+    print(f"\n--- {titulo} (IC {confianza:.0%}) ---")
+    print(f"{'Métrica':<12}{'Simple':>10}{'Semiancho':>11}{'Reducido':>10}{'Semiancho':>11}{'Factor':>9}")
+    for metrica, e in estimaciones.items():
+        print(f"{metrica:<12}{e.simple.media:10.4f}{e.simple.semiancho:11.4f}{e.resumen.media:10.4f}{e.resumen.semiancho:11.4f}{e.factor:9.2f}")
+
+
+def main():
+    procesos = os.cpu_count()
+    parametros = dict(tasa_llegadas=LAMBDA, tasa_servicio=MU, num_servidores=NUM_SERVIDORES, tiempo_llegada_maxima=TIEMPO_LLEGADA_MAXIMA)
+
+    inicio = time.perf_counter()
+    pares = ejecutar_antiteticas(NUM_REPLICACIONES, SEMILLA_MAESTRA, procesos, **parametros)
+    duracion = time.perf_counter() - inicio
+
+    imprimir_estimaciones(f"Variables antitéticas: {len(pares)} pares", estimar_antiteticas(pares))
+    # Las corridas originales de cada par son replicaciones independientes para las variables de control
+    originales = [a for a, _ in pares]
+    imprimir_estimaciones(f"Variables de control ({', '.join(CONTROLES)}): {len(originales)} replicaciones", estimar_control(originales, **parametros))
+    print(f"\n{2 * len(pares)} corridas en {duracion:.2f} s con {procesos} procesos (semilla maestra {SEMILLA_MAESTRA})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,421 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Registro de eventos de la simulación.
+
+Los modelos del banco (scripts 5 y 6) registran cada Llegada, InicioServicio y FinServicio en
+"eventos_simulacion.csv". Abrir y cerrar el archivo en cada evento hace que la escritura domine el
+tiempo de ejecución cuando se simulan cientos de miles de clientes.
+
+RegistroEventosCSV mantiene el archivo abierto durante toda la corrida, acumula las filas en memoria
+y las escribe en bloques grandes, ya sea al alcanzar un número de filas o al pasar cierto tiempo real
+desde la última escritura. El formato de cada fila es exactamente el mismo que el de los scripts.
+
+RegistroEventosNpy escribe el mismo esquema en un archivo binario columnar de NumPy (.npy): el evento
+como un código entero pequeño, los tiempos como float64 y los tamaños de cola como int32. Las filas
+se escriben en grupos a medida que avanza la corrida, y el archivo se puede mapear a memoria al
+leerlo (leer_registro_npy) sin tener que interpretar texto.
+
+Cuando no hace falta una fila por evento, abrir_registro(modo=...) reduce el volumen escrito:
+  - modo="muestreo": detalle completo solo de los clientes cuyo ID es múltiplo de N
+    (RegistroMuestreado), en CSV o npy.
+  - modo="agregado": una fila por ventana de tiempo simulado (RegistroAgregado) con llegadas, inicios
+    de servicio, salidas, espera promedio, cola promedio y máxima y tiempo de cajeros ocupados.
+
+RegistroCircular guarda en memoria solo los últimos K eventos, sin escribir a disco, en un arreglo
+estructurado TIPO_EVENTO reservado al inicio: la memoria no depende de la duración de la corrida.
+instantanea() devuelve una copia en orden cronológico (que también acepta
+analisis_registro.AnalisisRegistro.agregar_bloque) y guardar() la escribe como .npy.
+"""
+
+import struct
+import time
+
+import numpy as np
+
+ARCHIVO_EVENTOS = "eventos_simulacion.csv"
+ENCABEZADO_CSV = "ID_Cliente,Evento,Tiempo,Tiempo_Desde_Ultima_Llegada,Tamaño_Cola,Cajeros_Ocupados,Tiempo_Inicio_Servicio,Tiempo_Fin_Servicio,Tiempo_En_Cola,Tiempo_En_Servicio,Tiempo_Total\n"
+
+ARCHIVO_EVENTOS_NPY = "eventos_simulacion.npy"
+FORMATOS_REGISTRO = ("csv", "npy")
+
+ARCHIVO_AGREGADO = "eventos_agregados.csv"
+ENCABEZADO_AGREGADO = "Inicio,Fin,Llegadas,Inicios_Servicio,Salidas,Espera_Promedio,Cola_Promedio,Cola_Maxima,Ocupados_Promedio,Ocupados_Maximo,Tiempo_Ocupado\n"
+MODOS_REGISTRO = ("completo", "muestreo", "agregado")
+
+# Códigos de evento para el formato binario
+EVENTOS = ("Llegada", "InicioServicio", "FinServicio")
+CODIGOS_EVENTO = {evento: codigo for codigo, evento in enumerate(EVENTOS)}
+
+# Mismo esquema que el encabezado CSV; los campos vacíos del CSV se guardan como NaN (o 0 en el ID)
+TIPO_EVENTO = np.dtype([
+    ("id_cliente", np.int64),
+    ("evento", np.int8),
+    ("tiempo", np.float64),
+    ("tiempo_desde_ultimo_evento", np.float64),
+    ("tamano_cola", np.int32),
+    ("cajeros_ocupados", np.int32),
+    ("tiempo_inicio_servicio", np.float64),
+    ("tiempo_fin_servicio", np.float64),
+    ("tiempo_en_cola", np.float64),
+    ("tiempo_en_servicio", np.float64),
+    ("tiempo_total", np.float64),
+])
+
+# Tamaño fijo del encabezado .npy, para poder reescribirlo al cerrar con el número final de filas
+LONGITUD_ENCABEZADO_NPY = 512
+
+# Cada cuántas filas se consulta el reloj para el umbral de tiempo (consultarlo en cada evento es caro)
+FILAS_ENTRE_CONSULTAS_RELOJ = 1024
+
+
+# ---------------------------
+# Registro CSV con un solo manejador de archivo
+# ---------------------------
+class RegistroEventosCSV:
+
+    def __init__(self, ruta=ARCHIVO_EVENTOS, filas_por_bloque=50000, segundos_por_bloque=5.0):
+        self.ruta = ruta
+        self.filas_por_bloque = filas_por_bloque
+        self.segundos_por_bloque = segundos_por_bloque
+        self.filas = []
+        self.bloques_escritos = 0
+
+        # El archivo se abre una sola vez y se escribe el encabezado
+        self.archivo = open(ruta, "w")
+        self.archivo.write(ENCABEZADO_CSV)
+        self.ultima_escritura = time.monotonic()
+
+    def registrar(self, id_cliente, evento, tiempo, delta_tiempo, clientes_cola, cajeros_ocupados, tiempo_inicio_servicio=None, tiempo_fin_servicio=None, tiempo_en_cola=None, tiempo_servicio=None, tiempo_total=None):
+        # Misma fila que escribía actualizar_estadisticas, pero se guarda en memoria
+        self.filas.append(f"{id_cliente if id_cliente else ''},{evento if evento else ''},{tiempo:.2f},{delta_tiempo:.2f},{clientes_cola},{cajeros_ocupados},{tiempo_inicio_servicio if tiempo_inicio_servicio else ''},{tiempo_fin_servicio if tiempo_fin_servicio else ''},{tiempo_en_cola if tiempo_en_cola else ''},{tiempo_servicio if tiempo_servicio else ''},{tiempo_total if tiempo_total else ''}\n")
+
+        pendientes = len(self.filas)
+        if pendientes >= self.filas_por_bloque:
+            self.escribir_bloque()
+        elif pendientes % FILAS_ENTRE_CONSULTAS_RELOJ == 0 and time.monotonic() - self.ultima_escritura >= self.segundos_por_bloque:
+            self.escribir_bloque()
+
+    def escribir_bloque(self):
+        # Escribe todas las filas pendientes con una sola llamada al sistema
+        if self.filas:
+            self.archivo.write("".join(self.filas))
+            self.filas.clear()
+            self.bloques_escritos += 1
+        self.archivo.flush()
+        self.ultima_escritura = time.monotonic()
+
+    def cerrar(self):
+        if self.archivo.closed:
+            return
+        self.escribir_bloque()
+        self.archivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        self.cerrar()
+
+
+# ---------------------------
+# Tabla de eventos en consola (script 4)
+# ---------------------------
+NOMBRES_CONSOLA = {"Llegada": "LlegadaCliente", "InicioServicio": "InicioServicio", "FinServicio": "FinServicio(Salida)"}
+
+
+class RegistroConsola:
+
+    def registrar(self, id_cliente, evento, tiempo, delta_tiempo, clientes_cola, cajeros_ocupados, tiempo_inicio_servicio=None, tiempo_fin_servicio=None, tiempo_en_cola=None, tiempo_servicio=None, tiempo_total=None):
+        # La última columna es, como en el script original, el tiempo del evento anterior (tiempo_ultimo_evento)
+        print(f"{id_cliente:d},{tiempo:.2f},{NOMBRES_CONSOLA[evento]},{clientes_cola:d},{cajeros_ocupados:d},{tiempo - delta_tiempo:.4f}")
+
+    def cerrar(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        self.cerrar()
+
+
+# ---------------------------
+# Registro de una muestra determinista de clientes (1 de cada N)
+# ---------------------------
+class RegistroMuestreado:
+
+    def __init__(self, registro, cada=100):
+        self.registro = registro
+        self.cada = cada
+
+    def registrar(self, id_cliente, evento, tiempo, delta_tiempo, clientes_cola, cajeros_ocupados, tiempo_inicio_servicio=None, tiempo_fin_servicio=None, tiempo_en_cola=None, tiempo_servicio=None, tiempo_total=None):
+        # Solo los clientes cuyo ID es múltiplo de N; el resto no formatea ni escribe nada
+        if id_cliente % self.cada == 0:
+            self.registro.registrar(id_cliente, evento, tiempo, delta_tiempo, clientes_cola, cajeros_ocupados, tiempo_inicio_servicio, tiempo_fin_servicio, tiempo_en_cola, tiempo_servicio, tiempo_total)
+
+    def cerrar(self):
+        self.registro.cerrar()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        self.cerrar()
+
+
+# ---------------------------
+# Registro agregado: una fila por ventana de tiempo simulado
+# ---------------------------
+# Cada llamada a registrar() describe el estado (cola y cajeros ocupados) desde el evento anterior
+# hasta el evento actual, igual que actualizar_estadisticas. Ese intervalo se reparte entre las
+# ventanas [k * ancho, (k + 1) * ancho) que cubre, y cada ventana se escribe al cerrarse, también si
+# no tuvo eventos. Un evento justo en el borde cuenta en la ventana que empieza ahí.
+class RegistroAgregado:
+
+    def __init__(self, ruta=ARCHIVO_AGREGADO, ancho=1.0):
+        self.ruta = ruta
+        self.ancho = ancho
+        self.ventana = 0
+        self.fin_ventana = ancho
+        self.ventanas_escritas = 0
+        self.tiempo = 0.0
+        self.reiniciar_contadores()
+
+        self.archivo = open(ruta, "w")
+        self.archivo.write(ENCABEZADO_AGREGADO)
+
+    def reiniciar_contadores(self):
+        self.llegadas = 0
+        self.inicios = 0
+        self.salidas = 0
+        self.total_espera = 0.0
+        self.area_cola = 0.0
+        self.area_ocupados = 0.0
+        self.cola_maxima = 0
+        self.ocupados_maximo = 0
+
+    def registrar(self, id_cliente, evento, tiempo, delta_tiempo, clientes_cola, cajeros_ocupados, tiempo_inicio_servicio=None, tiempo_fin_servicio=None, tiempo_en_cola=None, tiempo_servicio=None, tiempo_total=None):
+        if tiempo >= self.fin_ventana:
+            self.cerrar_ventanas(tiempo, clientes_cola, cajeros_ocupados)
+
+        # Resto del intervalo y el evento, en la ventana abierta
+        duracion = tiempo - self.tiempo
+        self.area_cola += clientes_cola * duracion
+        self.area_ocupados += cajeros_ocupados * duracion
+        if clientes_cola > self.cola_maxima:
+            self.cola_maxima = clientes_cola
+        if cajeros_ocupados > self.ocupados_maximo:
+            self.ocupados_maximo = cajeros_ocupados
+        if evento == "Llegada":
+            self.llegadas += 1
+        elif evento == "InicioServicio":
+            self.inicios += 1
+            self.total_espera += tiempo_en_cola or 0.0
+        elif evento == "FinServicio":
+            self.salidas += 1
+        self.tiempo = tiempo
+
+    def cerrar_ventanas(self, tiempo, clientes_cola, cajeros_ocupados):
+        # Escribe las ventanas que terminan antes del evento; el estado vale hasta el evento
+        while tiempo >= self.fin_ventana:
+            fin = self.fin_ventana
+            if fin > self.tiempo:
+                duracion = fin - self.tiempo
+                self.area_cola += clientes_cola * duracion
+                self.area_ocupados += cajeros_ocupados * duracion
+                self.cola_maxima = max(self.cola_maxima, clientes_cola)
+                self.ocupados_maximo = max(self.ocupados_maximo, cajeros_ocupados)
+                self.tiempo = fin
+            self.escribir_ventana(fin)
+
+    def escribir_ventana(self, fin):
+        inicio = self.ventana * self.ancho
+        duracion = fin - inicio
+        espera = f"{self.total_espera / self.inicios:.4f}" if self.inicios else ""
+        cola = self.area_cola / duracion if duracion > 0 else 0.0
+        ocupados = self.area_ocupados / duracion if duracion > 0 else 0.0
+        self.archivo.write(f"{inicio:.2f},{fin:.2f},{self.llegadas},{self.inicios},{self.salidas},{espera},{cola:.4f},{self.cola_maxima},{ocupados:.4f},{self.ocupados_maximo},{self.area_ocupados:.4f}\n")
+        self.ventanas_escritas += 1
+        self.ventana += 1
+        self.fin_ventana = (self.ventana + 1) * self.ancho
+        self.reiniciar_contadores()
+
+    def cerrar(self):
+        if self.archivo.closed:
+            return
+        # La última ventana queda incompleta: termina en el último evento
+        if self.tiempo > self.ventana * self.ancho:
+            self.escribir_ventana(self.tiempo)
+        self.archivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        self.cerrar()
+
+
+# ---------------------------
+# Registro binario columnar (.npy)
+# ---------------------------
+def _encabezado_npy(num_filas):
+    # Encabezado .npy versión 1.0, rellenado con espacios hasta LONGITUD_ENCABEZADO_NPY bytes
+    diccionario = repr({"descr": np.lib.format.dtype_to_descr(TIPO_EVENTO), "fortran_order": False, "shape": (num_filas,)})
+    longitud = LONGITUD_ENCABEZADO_NPY - 10
+    if len(diccionario) >= longitud:
+        raise ValueError("El encabezado .npy no cabe en LONGITUD_ENCABEZADO_NPY")
+    texto = diccionario.ljust(longitud - 1) + "\n"
+    return b"\x93NUMPY\x01\x00" + struct.pack("<H", longitud) + texto.encode("latin1")
+
+
+def _columnas(filas):
+    # Vistas por columna del arreglo reservado (evita buscar el campo en cada evento)
+    return tuple(filas[nombre] for nombre in TIPO_EVENTO.names)
+
+
+def _escribir_fila(columnas, i, id_cliente, evento, tiempo, delta_tiempo, clientes_cola, cajeros_ocupados, tiempo_inicio_servicio, tiempo_fin_servicio, tiempo_en_cola, tiempo_servicio, tiempo_total):
+    # Escribe la fila i campo por campo en las vistas reservadas (RegistroEventosNpy y RegistroCircular),
+    # sin crear objetos por evento. Los campos vacíos se pasan como None: NumPy los guarda como NaN
+    (c_id, c_evento, c_tiempo, c_delta, c_cola, c_ocupados, c_inicio, c_fin, c_en_cola, c_servicio, c_total) = columnas
+    c_id[i] = id_cliente or 0
+    c_evento[i] = CODIGOS_EVENTO[evento]
+    c_tiempo[i] = tiempo
+    c_delta[i] = delta_tiempo
+    c_cola[i] = clientes_cola
+    c_ocupados[i] = cajeros_ocupados
+    c_inicio[i] = tiempo_inicio_servicio
+    c_fin[i] = tiempo_fin_servicio
+    c_en_cola[i] = tiempo_en_cola
+    c_servicio[i] = tiempo_servicio
+    c_total[i] = tiempo_total
+
+
+class RegistroEventosNpy:
+
+    def __init__(self, ruta=ARCHIVO_EVENTOS_NPY, filas_por_bloque=65536):
+        self.ruta = ruta
+        self.filas_por_bloque = filas_por_bloque
+        self.num_filas = 0
+        self.bloques_escritos = 0
+
+        # Grupo de filas en memoria
+        self.bloque = np.zeros(filas_por_bloque, dtype=TIPO_EVENTO)
+        self.columnas = _columnas(self.bloque)
+        self.indice = 0
+
+        # El encabezado se reescribe al cerrar con el número real de filas
+        self.archivo = open(ruta, "wb")
+        self.archivo.write(_encabezado_npy(0))
+
+    def registrar(self, id_cliente, evento, tiempo, delta_tiempo, clientes_cola, cajeros_ocupados, tiempo_inicio_servicio=None, tiempo_fin_servicio=None, tiempo_en_cola=None, tiempo_servicio=None, tiempo_total=None):
+        i = self.indice
+        _escribir_fila(self.columnas, i, id_cliente, evento, tiempo, delta_tiempo, clientes_cola, cajeros_ocupados, tiempo_inicio_servicio, tiempo_fin_servicio, tiempo_en_cola, tiempo_servicio, tiempo_total)
+        self.indice = i + 1
+        if self.indice == self.filas_por_bloque:
+            self.escribir_bloque()
+
+    def escribir_bloque(self):
+        # Escribe el grupo de filas completo (o parcial al cerrar) como bytes contiguos
+        if self.indice:
+            self.archivo.write(self.bloque[:self.indice].tobytes())
+            self.num_filas += self.indice
+            self.indice = 0
+            self.bloques_escritos += 1
+        self.archivo.flush()
+
+    def cerrar(self):
+        if self.archivo.closed:
+            return
+        self.escribir_bloque()
+        self.archivo.seek(0)
+        self.archivo.write(_encabezado_npy(self.num_filas))
+        self.archivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        self.cerrar()
+
+
+# ---------------------------
+# Traza en memoria de los últimos eventos (búfer circular)
+# ---------------------------
+# registrar() escribe en la fila indice del arreglo reservado al inicio y avanza el índice; al llegar
+# a la capacidad vuelve a 0 y sobrescribe los eventos más antiguos. No crea objetos por evento.
+class RegistroCircular:
+
+    def __init__(self, capacidad=100_000):
+        if capacidad < 1:
+            raise ValueError("La capacidad del registro circular debe ser al menos 1")
+        self.capacidad = capacidad
+        self.eventos = np.zeros(capacidad, dtype=TIPO_EVENTO)
+        self.columnas = _columnas(self.eventos)
+        self.indice = 0
+        self.num_eventos = 0
+
+    def registrar(self, id_cliente, evento, tiempo, delta_tiempo, clientes_cola, cajeros_ocupados, tiempo_inicio_servicio=None, tiempo_fin_servicio=None, tiempo_en_cola=None, tiempo_servicio=None, tiempo_total=None):
+        i = self.indice
+        _escribir_fila(self.columnas, i, id_cliente, evento, tiempo, delta_tiempo, clientes_cola, cajeros_ocupados, tiempo_inicio_servicio, tiempo_fin_servicio, tiempo_en_cola, tiempo_servicio, tiempo_total)
+        i += 1
+        self.indice = i if i < self.capacidad else 0
+        self.num_eventos += 1
+
+    def __len__(self):
+        return min(self.num_eventos, self.capacidad)
+
+    @property
+    def sobrescritos(self):
+        # Eventos que ya salieron del búfer
+        return self.num_eventos - len(self)
+
+    def instantanea(self, ultimos=None):
+        # Copia de los eventos guardados (o de los últimos `ultimos`), del más antiguo al más reciente
+        if self.num_eventos <= self.capacidad:
+            eventos = self.eventos[:self.num_eventos].copy()
+        else:
+            eventos = np.concatenate([self.eventos[self.indice:], self.eventos[:self.indice]])
+        if ultimos is not None:
+            eventos = eventos[max(len(eventos) - ultimos, 0):]
+        return eventos
+
+    def guardar(self, ruta=ARCHIVO_EVENTOS_NPY):
+        # Mismo formato que RegistroEventosNpy: se lee con leer_registro_npy
+        np.save(ruta, self.instantanea())
+
+    def cerrar(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        self.cerrar()
+
+
+# ---------------------------
+# Selección del formato y lectura
+# ---------------------------
+# modo="completo" registra todos los eventos; "muestreo", uno de cada `cada` clientes;
+# "agregado", una fila por ventana de `ancho` unidades de tiempo (siempre en CSV).
+def abrir_registro(formato="csv", ruta=None, modo="completo", cada=100, ancho=1.0):
+    if modo not in MODOS_REGISTRO:
+        raise ValueError(f"Modo de registro desconocido: {modo!r} (opciones: {', '.join(MODOS_REGISTRO)})")
+    if modo == "agregado":
+        return RegistroAgregado(ruta or ARCHIVO_AGREGADO, ancho)
+    if formato == "csv":
+        registro = RegistroEventosCSV(ruta or ARCHIVO_EVENTOS)
+    elif formato == "npy":
+        registro = RegistroEventosNpy(ruta or ARCHIVO_EVENTOS_NPY)
+    else:
+        raise ValueError(f"Formato de registro desconocido: {formato!r} (opciones: {', '.join(FORMATOS_REGISTRO)})")
+    if modo == "muestreo":
+        return RegistroMuestreado(registro, cada)
+    return registro
+
+
+def leer_registro_npy(ruta=ARCHIVO_EVENTOS_NPY):
+    # Mapea el archivo a memoria: las columnas se leen del disco solo cuando se usan
+    return np.load(ruta, mmap_mode="r")
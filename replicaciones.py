@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Replicaciones independientes del modelo del banco en paralelo.
+
+Una sola corrida del script 5 da una muestra ruidosa de L, L_q, W y Wq. Este módulo reparte N
+replicaciones de SimulacionBanco entre los núcleos del procesador con un ProcessPoolExecutor.
+
+Cada replicación recibe su propio flujo aleatorio, derivado de una sola semilla maestra con
+numpy.random.SeedSequence.spawn(). Los flujos hijos son independientes y no se traslapan, y el
+resultado no depende del número de procesos. Las replicaciones se envían en lotes (chunksize)
+para que el costo de comunicación entre procesos sea pequeño frente al de simular, y así el
+tiempo baja casi linealmente con el número de núcleos.
+
+Al final se calculan la media, la varianza y el intervalo de confianza de cada métrica.
+
+El parámetro motor elige el motor de simulación: "simpy" (SimulacionBanco) o "eventos"
+(MotorEventosBanco, heap de eventos, más rápido para corridas grandes).
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from estadisticas import resumir_muestra
+from modelo_banco import SimulacionBanco
+from motor_eventos import MotorEventosBanco
+
+# Configuración (mismos valores que el script 5)
+TIEMPO_LLEGADA_MAXIMA = 480
+LAMBDA = 1
+MU = 0.25
+NUM_SERVIDORES = 5
+NUM_REPLICACIONES = 200
+SEMILLA_MAESTRA = 2025
+CONFIANZA = 0.95
+
+METRICAS = ("utilizacion", "L", "L_q", "W", "Wq")
+
+MOTORES = {"simpy": SimulacionBanco, "eventos": MotorEventosBanco}
+
+
+# ---------------------------
+# Una replicación (se ejecuta en un proceso del pool)
+# ---------------------------
+def ejecutar_replicacion(tarea):
+    parametros, semilla = tarea
+    parametros = dict(parametros)
+    clase = MOTORES[parametros.pop("motor", "simpy")]
+    return clase(semilla=semilla, **parametros).ejecutar()
+
+
+# ---------------------------
+# Semillas independientes a partir de la semilla maestra
+# ---------------------------
+def generar_semillas(num_replicaciones, semilla_maestra=None):
+    # Con semilla_maestra=None se toma entropía del sistema; se puede recuperar en .entropy
+    return np.random.SeedSequence(semilla_maestra).spawn(num_replicaciones)
+
+
+# ---------------------------
+# Ejecución de las replicaciones en paralelo
+# ---------------------------
+# Los parámetros son los de SimulacionBanco (tasa_llegadas, tasa_servicio, num_servidores, ...) y,
+# opcionalmente, motor.
+# Con procesos=1 las replicaciones se corren en el proceso actual (útil para depurar).
+def ejecutar_replicaciones(num_replicaciones, semilla_maestra=None, procesos=None, **parametros):
+    semillas = generar_semillas(num_replicaciones, semilla_maestra)
+    return ejecutar_con_semillas(semillas, procesos, **parametros)
+
+
+def ejecutar_con_semillas(semillas, procesos=None, **parametros):
+    return ejecutar_tareas([(parametros, semilla) for semilla in semillas], procesos)
+
+
+# Cada tarea es un par (parámetros, semilla); las tareas pueden tener parámetros distintos.
+# Con pool se reutiliza un ProcessPoolExecutor ya abierto (por ejemplo, entre lotes sucesivos).
+# funcion es la que corre cada tarea (debe estar definida a nivel de módulo para enviarse al pool).
+def ejecutar_tareas(tareas, procesos=None, pool=None, funcion=ejecutar_replicacion):
+    procesos = procesos or os.cpu_count()
+
+    if pool is None and (procesos == 1 or len(tareas) == 1):
+        return [funcion(tarea) for tarea in tareas]
+
+    # Unos 4 lotes por proceso: pocos mensajes entre procesos y buen balance de carga
+    lote = max(1, len(tareas) // (procesos * 4))
+    if pool is not None:
+        return list(pool.map(funcion, tareas, chunksize=lote))
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        return list(pool.map(funcion, tareas, chunksize=lote))
+
+
+# ---------------------------
+# Resumen: media, varianza e intervalo de confianza por métrica
+# ---------------------------
+def resumir(resultados, confianza=0.95, metricas=METRICAS):
+    return {metrica: resumir_muestra([getattr(r, metrica) for r in resultados], confianza) for metrica in metricas}
+
+
+def imprimir_resumen(resumen, confianza=0.95):
+    print(f"\n--- Resumen de {next(iter(resumen.values())).n} replicaciones (IC {confianza:.0%}) ---")
+    print(f"{'Métrica':<12}{'Media':>12}{'Varianza':>12}{'Inferior':>12}{'Superior':>12}{'Semiancho':>12}")
+    for metrica, r in resumen.items():
+        print(f"{metrica:<12}{r.media:12.4f}{r.varianza:12.4f}{r.inferior:12.4f}{r.superior:12.4f}{r.semiancho:12.4f}")
+
+
+def main():
+    procesos = os.cpu_count()
+    inicio = time.perf_counter()
+    resultados = ejecutar_replicaciones(NUM_REPLICACIONES, SEMILLA_MAESTRA, procesos, tasa_llegadas=LAMBDA, tasa_servicio=MU, num_servidores=NUM_SERVIDORES, tiempo_llegada_maxima=TIEMPO_LLEGADA_MAXIMA)
+    duracion = time.perf_counter() - inicio
+
+    imprimir_resumen(resumir(resultados, CONFIANZA), CONFIANZA)
+    print(f"\n{NUM_REPLICACIONES} replicaciones en {duracion:.2f} s con {procesos} procesos (semilla maestra {SEMILLA_MAESTRA})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+
+"""
+Ida y vuelta de una celda de dotacion.py: el perfil de llegadas debe conservar su interpolación.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from barrido_parametros import llave_celda, parametros_modelo  # noqa: E402
+from dotacion import celda_dotacion  # noqa: E402
+from perfil_llegadas import PerfilLlegadas  # noqa: E402
+
+TRAMOS = [(0, 0.6), (120, 1.4), (240, 1.0), (360, 0.8)]
+
+
+def celda(interpolacion):
+    return celda_dotacion(5, 1.0, 0.25, 480, 2, 2025, PerfilLlegadas(TRAMOS, interpolacion))
+
+
+def test_perfil_lineal_sobrevive_ida_y_vuelta():
+    perfil = parametros_modelo(celda("lineal"))["perfil_llegadas"]
+    assert perfil.interpolacion == "lineal"
+    assert perfil.tramos() == PerfilLlegadas(TRAMOS, "lineal").tramos()
+    assert perfil.tasa(60) == PerfilLlegadas(TRAMOS, "lineal").tasa(60)
+
+
+def test_interpolacion_entra_en_la_llave():
+    assert llave_celda(celda("lineal")) != llave_celda(celda("constante"))
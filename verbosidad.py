@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Niveles de verbosidad para las salidas en consola de los ejemplos.
+
+Imprimir una línea por evento hace que las corridas sean órdenes de magnitud más lentas que la
+simulación misma. Niveles:
+
+  - SILENCIOSO: no imprime nada.
+  - RESUMEN:    solo los resultados al final.
+  - MUESTREO:   traza de uno de cada N clientes (o pasajeros) y los resultados.
+  - COMPLETO:   traza de todos los eventos (comportamiento original de los ejemplos).
+
+En los niveles distintos de COMPLETO la decisión de trazar se toma una vez por cliente con
+aritmética entera (debe_trazar); los mensajes solo se formatean si se van a imprimir.
+"""
+
+from registro_eventos import RegistroConsola, RegistroMuestreado
+
+SILENCIOSO = 0
+RESUMEN = 1
+MUESTREO = 2
+COMPLETO = 3
+
+
+# ---------------------------
+# ¿Se traza este cliente?
+# ---------------------------
+def debe_trazar(numero, nivel, cada=100):
+    if nivel == COMPLETO:
+        return True
+    return nivel == MUESTREO and numero % cada == 0
+
+
+# ---------------------------
+# Registro de consola para los modelos del banco (script 4)
+# ---------------------------
+# Sin traza devuelve None: SimulacionBanco no llama al registro en absoluto.
+def registro_consola(nivel, cada=100):
+    if nivel == COMPLETO:
+        return RegistroConsola()
+    if nivel == MUESTREO:
+        return RegistroMuestreado(RegistroConsola(), cada)
+    return None